@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Time the repository scripts against synthetic corpora.
+
+Generates (or reuses) trees of 10, 1k and 10k skills with corpus.py, runs
+validate-skills.py, validate-markdown.py and update-docs.py --check in each
+as subprocesses, and keeps the best wall time of --repeat runs. Timings are
+compared to a stored baseline; any case slower than the baseline by more
+than --threshold fails the run.
+
+Baselines are machine-specific and are not committed: record one with
+--save-baseline on the machine that will run the comparison.
+
+Usage:
+    python benchmarks/bench.py                          # All sizes, compare to baseline
+    python benchmarks/bench.py --sizes 10 1000          # Skip the 10k tree
+    python benchmarks/bench.py --save-baseline          # Record current timings
+    python benchmarks/bench.py --threshold 0.1          # Fail on >10% regressions
+
+Exit codes:
+    0 = No regressions (or no baseline to compare against)
+    1 = A case regressed beyond the threshold, or a script failed
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import CORPUS_VERSION, generate_corpus
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / "scripts"
+
+DEFAULT_SIZES = [10, 1000, 10000]
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_WORK_DIR = Path(tempfile.gettempdir()) / "writing-with-agents-bench"
+
+# Case name -> script arguments, run from the corpus root
+CASES = {
+    "validate-skills": ["validate-skills.py", "--no-cache"],
+    "validate-skills-cached": ["validate-skills.py"],
+    "validate-markdown": ["validate-markdown.py"],
+    "update-docs": ["update-docs.py", "--check"],
+}
+
+
+# =============================================================================
+# Corpus Setup
+# =============================================================================
+
+def ensure_corpus(work_dir: Path, skills: int, seed: int) -> Path:
+    """Return a corpus root for ``skills``, regenerating it if stale."""
+    root = work_dir / f"skills-{skills}"
+    stamp = root / ".corpus.json"
+    expected = {"version": CORPUS_VERSION, "skills": skills, "seed": seed}
+    if stamp.exists() and json.loads(stamp.read_text()) == expected:
+        return root
+    if root.exists():
+        shutil.rmtree(root)
+    print(f"Generating {skills}-skill corpus in {root}...", file=sys.stderr)
+    generate_corpus(root, skills, seed)
+    stamp.write_text(json.dumps(expected) + "\n")
+    return root
+
+
+# =============================================================================
+# Timing
+# =============================================================================
+
+def run_case(root: Path, args: list[str]) -> float:
+    """Run one script in ``root`` and return its wall time in seconds."""
+    cmd = [sys.executable, str(SCRIPTS_DIR / args[0]), *args[1:]]
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited with {proc.returncode} in {root}\n{proc.stderr}")
+    return elapsed
+
+
+def time_case(root: Path, args: list[str], repeat: int) -> float:
+    """Best wall time over ``repeat`` runs."""
+    return min(run_case(root, args) for _ in range(repeat))
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return one message per case slower than baseline * (1 + threshold)."""
+    regressions = []
+    for size, cases in results.items():
+        for case, seconds in cases.items():
+            base = baseline.get(size, {}).get(case)
+            if base and seconds > base * (1 + threshold):
+                regressions.append(
+                    f"{case} @ {size} skills: {seconds:.3f}s vs baseline {base:.3f}s "
+                    f"(+{(seconds / base - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def format_table(results: dict, baseline: dict) -> str:
+    lines = [f"{'skills':>8}  {'case':<24}{'seconds':>10}{'baseline':>10}{'change':>9}"]
+    for size, cases in results.items():
+        for case, seconds in cases.items():
+            base = baseline.get(size, {}).get(case)
+            if base:
+                lines.append(
+                    f"{size:>8}  {case:<24}{seconds:>10.3f}{base:>10.3f}{(seconds / base - 1) * 100:>+8.0f}%"
+                )
+            else:
+                lines.append(f"{size:>8}  {case:<24}{seconds:>10.3f}{'-':>10}{'-':>9}")
+    return "\n".join(lines)
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main() -> int:
+    """Main entry point. Returns exit code."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the scripts against synthetic skill corpora.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        metavar="N",
+        help="Corpus sizes in skills (default: 10 1000 10000)",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=sorted(CASES),
+        help="Run only this case (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per case; the best time is kept (default: 3)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown over baseline as a fraction (default: 0.25)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline file (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write the measured timings to the baseline file instead of comparing",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        default=DEFAULT_WORK_DIR,
+        help="Where generated corpora are kept between runs",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed (default: 0)")
+    parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format (default: table)",
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        print("Error: --repeat must be at least 1")
+        return 1
+
+    baseline = {}
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text()).get("results", {})
+
+    results = {}
+    try:
+        for skills in args.sizes:
+            root = ensure_corpus(args.work_dir, skills, args.seed)
+            cases = args.case or list(CASES)
+            if "validate-skills-cached" in cases:
+                # Warm the validation cache so the cached case measures hits only
+                run_case(root, CASES["validate-skills-cached"])
+            results[str(skills)] = {
+                case: time_case(root, CASES[case], args.repeat) for case in cases
+            }
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+
+    regressions = compare(results, baseline, args.threshold)
+    if args.format == "json":
+        print(json.dumps({"results": results, "baseline": baseline, "regressions": regressions}, indent=2))
+    else:
+        print(format_table(results, baseline))
+        if regressions:
+            print(f"\nREGRESSIONS (threshold {args.threshold:.0%}):")
+            for message in regressions:
+                print(f"  {message}")
+        elif baseline:
+            print("\nNo regressions.")
+        elif not args.save_baseline:
+            print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one.")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
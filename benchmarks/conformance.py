@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Check the fallback YAML parser against PyYAML.
+
+validate-skills.py parses frontmatter and workflow definitions with PyYAML
+(libyaml's CSafeLoader when available) and falls back to its own
+YamlSubsetParser when PyYAML is missing. This script parses every SKILL.md
+frontmatter and commands/ YAML file in the repository, plus a set of edge
+cases covering the supported subset, with each backend and reports any
+document where the results differ. Documents PyYAML rejects must be
+rejected by the fallback too.
+
+Usage:
+    python benchmarks/conformance.py                 # Repository files + edge cases
+    python benchmarks/conformance.py --path /tmp/corpus  # Another tree
+
+Exit codes:
+    0 = All backends agree
+    1 = A mismatch was found, or PyYAML is not installed
+"""
+
+import argparse
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+EDGE_CASES = {
+    "nested metadata": (
+        "name: x\nmetadata:\n  domain: craft\n  version: \"1.0.0\"\n  related-skills: a, b\n"
+    ),
+    "list under metadata": "metadata:\n  triggers:\n    - one\n    - two\n  role: specialist\n",
+    "sequence at key indent": "requires:\n- ticketing\n- documentation\n",
+    "sequence of mappings": (
+        "inputs:\n  - name: topic\n    type: string\n    required: true\n"
+        "  - name: seo\n    type: flag\n    required: false\n"
+    ),
+    "nested sequence of mappings": (
+        "phases:\n  writing:\n    depends_on:\n      - phase: capture\n        strength: recommended\n"
+        "    commands:\n      - command: a\n        definition: commands/a.yaml\n"
+    ),
+    "double quoted escapes": 'a: "tab\\there \\"q\\" \\u00e9 \\\\ end"\n',
+    "single quoted": "a: 'it''s: fine # not a comment'\n",
+    "quoted keys": "\"quoted key\": 1\n'single key': 2\n",
+    "multi-line plain description": (
+        "description: Use when drafting\n  long documents that need\n  several passes.\nname: x\n"
+    ),
+    "plain with blank line": "description: first\n\n  second\nname: x\n",
+    "multi-line double quoted": 'description: "Use when a\n  b and\n\n  c"\nname: x\n',
+    "multi-line single quoted": "description: 'Use when a\n  b'\nname: x\n",
+    "escaped line break": 'a: "one\\\n  two"\n',
+    "literal block": "body: |\n  line one\n    indented\n\n  line three\nnext: 1\n",
+    "folded block": "body: >\n  folded one\n  folded two\n\n  new paragraph\n    kept\n  back\nnext: 1\n",
+    "block chomping": "strip: |-\n  a\n\nkeep: |+\n  b\n\nclip: >\n  c\n",
+    "keep chomping at end of document": "a: |+\n  x\n\n",
+    "block explicit indent": "a: |2\n    indented four\n  indented two\n",
+    "flow collections": "empty: []\nmap: {}\nitems: [a, 'b c', \"d\", 3]\ninline: {k: v, n: 1}\n",
+    "scalars": (
+        "null1:\nnull2: ~\nnull3: null\nb1: true\nb2: False\nb3: yes\nb4: off\n"
+        "i1: 42\ni2: -7\ni3: 1_000\nf1: 1.5\nf2: .5\nf3: 1.\nf4: -.inf\nf5: 1.0e+3\n"
+        "d: 2026-04-21\ns1: 1.0.0\ns2: 007x\ns3: a:b\ns4: -.5\n"
+        "o1: 0755\nh1: 0x1F\nbin: -0b101\nsx1: 1:30\nsx2: 1:30.5\ninf: +.Inf\n"
+    ),
+    "comments": "# leading\na: 1 # trailing\n  # indented comment\nb: value#not comment\n",
+    "url values": "author: https://github.com/example\nlinks:\n  - https://example.com/a\n",
+    "command with colon": "command: writing:flowers-cycle\nphase: writing\n",
+    "empty document": "\n# only a comment\n",
+    "empty value then key": "a:\nb: 2\n",
+    "nested sequences": "grid:\n  - - a\n    - b\n  - - c\n",
+}
+
+INVALID_CASES = {
+    "unclosed flow": "name: [unclosed\n",
+    "bad indentation": "a: 1\n   b: 2\n",
+    "unterminated quote": 'a: "open\n',
+    "mixed mapping and sequence": "a:\n  b: 1\n  - c\n",
+    "colon in plain value": "a: text with: colon\n",
+    "tab after colon": "a:\t1",
+    "tab before comment": "a: b\t# c",
+    "bare dash value": "a: -",
+    "sequence entry as value": "a: - b",
+}
+
+
+def load_validator():
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    spec = importlib.util.spec_from_file_location("validate_skills", SCRIPTS_DIR / "validate-skills.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def collect_documents(base_path: Path) -> dict[str, str]:
+    """Frontmatter of every SKILL.md and every commands/ YAML file under base_path."""
+    documents = {}
+    for skill_md in sorted(base_path.glob("skills/*/SKILL.md")):
+        parts = skill_md.read_text().split("---", 2)
+        if len(parts) == 3:
+            documents[str(skill_md)] = parts[1]
+    for yaml_file in sorted(base_path.glob("commands/**/*.yaml")):
+        documents[str(yaml_file)] = yaml_file.read_text()
+    return documents
+
+
+def outcome(parse, text: str):
+    """Parse result, or the exception type name when parsing fails."""
+    try:
+        return parse(text)
+    except Exception as e:
+        return f"<{type(e).__name__}>"
+
+
+def rejects(parse, text: str) -> bool:
+    """Whether parsing fails (a document that parses to a string is still accepted)."""
+    try:
+        parse(text)
+    except Exception:
+        return True
+    return False
+
+
+def main() -> int:
+    """Main entry point. Returns exit code."""
+    parser = argparse.ArgumentParser(description="Compare the fallback YAML parser against PyYAML.")
+    parser.add_argument(
+        "--path",
+        type=Path,
+        default=Path("."),
+        help="Tree whose skills/ and commands/ files are compared (default: .)",
+    )
+    args = parser.parse_args()
+
+    validator = load_validator()
+    yaml = validator.load_pyyaml()
+    if yaml is None:
+        print("Error: PyYAML is required for the conformance check")
+        return 1
+
+    backends = {"fallback": validator.simple_yaml_parse}
+    if hasattr(yaml, "CSafeLoader"):
+        backends["libyaml"] = lambda text: yaml.load(text, Loader=yaml.CSafeLoader)
+
+    documents = {**collect_documents(args.path), **{f"<{k}>": v for k, v in EDGE_CASES.items()}}
+    failures = []
+    for name, text in documents.items():
+        expected = outcome(yaml.safe_load, text)
+        for backend, parse in backends.items():
+            actual = outcome(parse, text)
+            if actual != expected:
+                failures.append(f"{name} [{backend}]\n    expected: {expected!r}\n    actual:   {actual!r}")
+
+    for name, text in INVALID_CASES.items():
+        if not rejects(yaml.safe_load, text):
+            failures.append(f"<{name}> is accepted by PyYAML; move it to EDGE_CASES")
+        elif not rejects(validator.simple_yaml_parse, text):
+            failures.append(f"<{name}> [fallback] parsed input PyYAML rejects")
+
+    checked = len(documents) + len(INVALID_CASES)
+    if failures:
+        print(f"CONFORMANCE FAILURES ({len(failures)}):")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print(f"All {checked} documents agree across PyYAML, {', '.join(backends)}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
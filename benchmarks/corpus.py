@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic skills/commands trees for benchmarking the scripts.
+
+The generated tree follows the layout the validators expect: one directory
+per skill with a SKILL.md in CANONICAL_SECTIONS order and a references/
+folder, per-command YAML definitions with COMMAND.md and description docs,
+a workflow manifest with phases, and the version.json, README.md and
+.claude-plugin files update-docs.py keeps in sync. Every file is valid, so
+the scripts exercise their full happy path and exit 0.
+
+Output is deterministic for a given skill count and seed.
+
+Usage:
+    python benchmarks/corpus.py /tmp/corpus              # 1000 skills
+    python benchmarks/corpus.py /tmp/corpus --skills 10  # Small tree
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+# Bumped whenever the generated layout changes, so cached corpora are rebuilt
+CORPUS_VERSION = 1
+
+REFERENCES_PER_SKILL = 3
+SKILLS_PER_COMMAND = 10
+BODY_NON_BLANK_LINES = 90
+
+WORDS = [
+    "draft", "outline", "reader", "argument", "evidence", "revision", "voice",
+    "structure", "thesis", "paragraph", "audience", "source", "claim", "tone",
+    "section", "example", "transition", "summary", "detail", "narrative",
+    "research", "angle", "hook", "clarity", "rhythm", "context", "note",
+]
+
+
+def load_validator():
+    """Import validate-skills.py so the corpus tracks its constants."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    path = SCRIPTS_DIR / "validate-skills.py"
+    spec = importlib.util.spec_from_file_location("validate_skills", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+VS = load_validator()
+
+
+# =============================================================================
+# Text Helpers
+# =============================================================================
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def paragraph(rng: random.Random, sentences: int = 3) -> str:
+    return " ".join(sentence(rng) for _ in range(sentences))
+
+
+def skill_name(i: int) -> str:
+    return f"skill-{i:05d}"
+
+
+def command_name(i: int) -> str:
+    return f"command-{i:04d}"
+
+
+# =============================================================================
+# Skills
+# =============================================================================
+
+def render_skill(i: int, skills: int, rng: random.Random) -> str:
+    """Render one SKILL.md with frontmatter and all canonical sections."""
+    name = skill_name(i)
+    related = ", ".join(skill_name((i + k) % skills) for k in (1, 2) if (i + k) % skills != i)
+    frontmatter = [
+        "---",
+        f"name: {name}",
+        f"description: Use when {' '.join(rng.choice(WORDS) for _ in range(20))}.",
+        "license: MIT",
+        "metadata:",
+        "  author: https://github.com/example",
+        '  version: "1.0.0"',
+        f"  domain: {sorted(VS.KNOWN_DOMAINS)[i % len(VS.KNOWN_DOMAINS)]}",
+        f"  triggers: {', '.join(rng.sample(WORDS, 6))}",
+        "  role: specialist",
+        f"  scope: {sorted(VS.VALID_SCOPES)[i % len(VS.VALID_SCOPES)]}",
+        f"  output-format: {sorted(VS.VALID_OUTPUT_FORMATS)[i % len(VS.VALID_OUTPUT_FORMATS)]}",
+    ]
+    if related:
+        frontmatter.append(f"  related-skills: {related}")
+    frontmatter.append("---")
+
+    bodies = {
+        "Role Definition": [paragraph(rng) for _ in range(4)],
+        "When to Use This Skill": [],
+        "Core Workflow": [f"{n}. **Step {n}** -- {sentence(rng)}" for n in range(1, 6)],
+        "Reference Guide": [
+            "| Topic | Reference | Load When |",
+            "|-------|-----------|-----------|",
+            *(
+                f"| Topic {r} | `references/{name}-{r}.md` | {sentence(rng, 5)} |"
+                for r in range(REFERENCES_PER_SKILL)
+            ),
+        ],
+        "Constraints": [
+            "**MUST DO:**",
+            *(f"- {sentence(rng, 8)}" for _ in range(8)),
+            "**MUST NOT DO:**",
+            *(f"- {sentence(rng, 8)}" for _ in range(8)),
+        ],
+        "Output Templates": [
+            "```markdown",
+            f"# {name.title()} Output: [Topic]",
+            *(f"## {w.title()}\n[{sentence(rng, 6)}]" for w in rng.sample(WORDS, 5)),
+            "```",
+        ],
+        "Knowledge Reference": [paragraph(rng, 4) for _ in range(4)],
+        "Related Skills": [f"- **{s.strip()}** -- {sentence(rng, 6)}" for s in related.split(",") if s],
+    }
+    used = len(VS.CANONICAL_SECTIONS) + sum(
+        len(line.split("\n")) for lines in bodies.values() for line in lines
+    )
+    bodies["When to Use This Skill"] = [
+        f"- {sentence(rng, 7)}" for _ in range(max(BODY_NON_BLANK_LINES - used, 3))
+    ]
+
+    body = []
+    for section in VS.CANONICAL_SECTIONS:
+        body.append(f"## {section}")
+        body.append("")
+        joiner = "\n\n" if section in ("Role Definition", "Knowledge Reference") else "\n"
+        body.append(joiner.join(bodies[section]))
+        body.append("")
+    return "\n".join(frontmatter) + "\n\n" + "\n".join(body)
+
+
+def render_reference(title: str, rng: random.Random) -> str:
+    """Render a reference file with prose, a table and a fenced example."""
+    lines = [f"# {title}", "", paragraph(rng, 4), ""]
+    lines += ["| Item | Guidance |", "|------|----------|"]
+    lines += [f"| {w} | {sentence(rng, 8)} |" for w in rng.sample(WORDS, 6)]
+    lines += ["", "## Example", "", "```text", *(sentence(rng) for _ in range(6)), "```", ""]
+    lines += [f"- {sentence(rng, 9)}" for _ in range(8)]
+    lines += ["", paragraph(rng, 5), ""]
+    return "\n".join(lines)
+
+
+# =============================================================================
+# Commands
+# =============================================================================
+
+def render_definition(name: str, rel_dir: str) -> str:
+    return "\n".join([
+        f'command: "{name}"',
+        f"path: {rel_dir}/COMMAND.md",
+        f"description: docs/workflow/{name}.md",
+        "inputs:",
+        "  - name: topic",
+        "    type: string",
+        "    required: true",
+        "    description: The topic to work on",
+        "outputs:",
+        "  - name: article",
+        "    type: document",
+        "    description: Finished document",
+        "requires: []",
+        "status: existing",
+        'argument-hint: "<topic>"',
+        "repeat: false",
+        "",
+    ])
+
+
+def render_manifest(phases: dict[str, list[str]], utility: str) -> str:
+    lines = [
+        "name: benchmark-corpus",
+        "description: Synthetic corpus for benchmarking the validators",
+        'version: "0.1.0"',
+        "",
+        "phases:",
+    ]
+    previous = None
+    for phase, commands in phases.items():
+        lines += [f"  {phase}:", f"    description: docs/workflow/{phase}-phase.md"]
+        if previous:
+            lines += ["    depends_on:", f"      - phase: {previous}", "        strength: recommended"]
+        lines.append("    commands:")
+        for cmd in commands:
+            lines += [
+                f"      - command: {cmd}",
+                f"        definition: commands/{phase}/{cmd}/{cmd}.yaml",
+                f'        description: "Synthetic {phase} command"',
+            ]
+        lines.append("")
+        previous = phase
+    lines += [
+        "utilities:",
+        f"  - command: {utility}",
+        f"    definition: commands/utilities/{utility}/{utility}.yaml",
+        '    description: "Synthetic utility command"',
+        "",
+    ]
+    return "\n".join(lines)
+
+
+# =============================================================================
+# Corpus
+# =============================================================================
+
+def generate_corpus(root: Path, skills: int, seed: int = 0) -> dict:
+    """Write a synthetic tree with ``skills`` skills under ``root``.
+
+    Returns:
+        The skill, workflow and reference counts written to version.json.
+    """
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    skills_dir = root / VS.SKILLS_DIR
+    docs_dir = root / "docs" / "workflow"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+
+    for i in range(skills):
+        skill_dir = skills_dir / skill_name(i)
+        refs_dir = skill_dir / "references"
+        refs_dir.mkdir(parents=True, exist_ok=True)
+        (skill_dir / "SKILL.md").write_text(render_skill(i, skills, rng))
+        for r in range(REFERENCES_PER_SKILL):
+            (refs_dir / f"{skill_name(i)}-{r}.md").write_text(
+                render_reference(f"Topic {r}", rng)
+            )
+
+    phase_names = sorted(VS.VALID_PHASES)
+    phases = {phase: [] for phase in phase_names}
+    for c in range(max(skills // SKILLS_PER_COMMAND, len(phase_names))):
+        phases[phase_names[c % len(phase_names)]].append(command_name(c))
+    utility = "setup"
+
+    placements = [(phase, cmd) for phase, cmds in phases.items() for cmd in cmds]
+    placements.append(("utilities", utility))
+    for group, cmd in placements:
+        rel_dir = f"commands/{group}/{cmd}"
+        cmd_dir = root / rel_dir
+        cmd_dir.mkdir(parents=True, exist_ok=True)
+        (cmd_dir / f"{cmd}.yaml").write_text(render_definition(cmd, rel_dir))
+        (cmd_dir / "COMMAND.md").write_text(f"# {cmd}\n\n{paragraph(rng)}\n")
+        (docs_dir / f"{cmd}.md").write_text(f"# {cmd}\n\n{paragraph(rng)}\n")
+    for phase in phase_names:
+        (docs_dir / f"{phase}-phase.md").write_text(f"# {phase.title()} Phase\n\n{paragraph(rng)}\n")
+    (root / VS.MANIFEST_FILE).write_text(render_manifest(phases, utility))
+
+    counts = {
+        "skillCount": skills,
+        "workflowCount": len(placements),
+        "referenceFileCount": skills * REFERENCES_PER_SKILL,
+    }
+    version = "1.0.0"
+    (root / "version.json").write_text(json.dumps({"version": version, **counts}, indent=2) + "\n")
+    (root / "README.md").write_text(
+        "# Benchmark Corpus\n\n"
+        f"<!-- SKILL_COUNT -->{counts['skillCount']}<!-- /SKILL_COUNT --> Skills · "
+        f"<!-- REFERENCE_COUNT -->{counts['referenceFileCount']}<!-- /REFERENCE_COUNT --> References · "
+        f"<!-- WORKFLOW_COUNT -->{counts['workflowCount']}<!-- /WORKFLOW_COUNT --> Workflows\n"
+    )
+    plugin_dir = root / ".claude-plugin"
+    plugin_dir.mkdir(exist_ok=True)
+    description = (
+        f"{skills} specialized skills for benchmarking. "
+        f"Includes {counts['workflowCount']} project workflow commands."
+    )
+    plugin = {"name": "benchmark-corpus", "version": version, "description": description}
+    marketplace = {"name": "benchmark-corpus", "plugins": [plugin]}
+    (plugin_dir / "plugin.json").write_text(json.dumps(plugin, indent=2) + "\n")
+    (plugin_dir / "marketplace.json").write_text(json.dumps(marketplace, indent=2) + "\n")
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic benchmark corpus.")
+    parser.add_argument("root", type=Path, help="Directory to write the corpus into")
+    parser.add_argument(
+        "--skills",
+        type=int,
+        default=1000,
+        help="Number of skills to generate (default: 1000)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    if args.root.exists() and any(args.root.iterdir()):
+        print(f"Error: {args.root} is not empty")
+        return 1
+
+    counts = generate_corpus(args.root, args.skills, args.seed)
+    print(f"Generated {args.root}: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Startup budget for the validation scripts.
+
+Editor integrations and pre-commit hooks start these scripts many times a
+day, so most runs are dominated by interpreter startup and imports. This
+script runs common invocations under ``python -X importtime`` from the
+repository root and fails when:
+
+- a module the invocation does not need is imported (PyYAML for --help,
+  concurrent.futures for a serial run, subprocess without --changed-since,
+  tracemalloc without --profile, ...), or
+- the imports added on top of a bare ``python -c pass`` take longer than the
+  invocation's budget (scaled by --scale for slower machines).
+
+Usage:
+    python benchmarks/startup.py              # Check every invocation
+    python benchmarks/startup.py --scale 2    # Double the time budgets
+    python benchmarks/startup.py --format json
+
+Exit codes:
+    0 = Every invocation is within budget
+    1 = A forbidden module was imported or a budget was exceeded
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Imported only by the runs that need them
+LAZY_MODULES = [
+    "yaml", "json", "hashlib", "concurrent.futures", "multiprocessing",
+    "subprocess", "tracemalloc", "datetime",
+]
+
+# (name, script args, modules allowed from LAZY_MODULES, import budget in ms)
+INVOCATIONS = [
+    ("validate-skills --help", ["scripts/validate-skills.py", "--help"], [], 80),
+    ("validate-skills --check workflows", ["scripts/validate-skills.py", "--check", "workflows"], ["yaml", "datetime"], 120),
+    ("validate-skills --skill", ["scripts/validate-skills.py", "--skill", "madman"], ["yaml", "datetime", "json", "hashlib"], 120),
+    ("validate-markdown --help", ["scripts/validate-markdown.py", "--help"], [], 70),
+    ("validate-markdown single file", ["scripts/validate-markdown.py", "--path", "README.md"], [], 70),
+    ("update-docs --check", ["scripts/update-docs.py", "--check"], ["json"], 70),
+]
+
+
+def import_profile(args: list[str]) -> tuple[set[str], dict[str, int]]:
+    """Run ``python -X importtime`` with ``args``.
+
+    Returns:
+        Every module imported, and the cumulative microseconds of each
+        top-level import (nested imports are included in their parent's).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    modules = set()
+    top_level = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # column header
+        modules.add(name.strip())
+        if not name.startswith("  "):
+            top_level[name.strip()] = int(cumulative)
+    return modules, top_level
+
+
+def check(
+    name: str, args: list[str], allowed: list[str], budget_ms: float, baseline: set[str], repeat: int
+) -> dict:
+    """Check one invocation against its allowed lazy modules and time budget (best of ``repeat``)."""
+    import_ms = float("inf")
+    for _ in range(repeat):
+        modules, top_level = import_profile(args)
+        import_ms = min(import_ms, sum(us for n, us in top_level.items() if n not in baseline) / 1000)
+    forbidden = [
+        m for m in LAZY_MODULES
+        if m not in allowed and any(n == m or n.startswith(m + ".") for n in modules)
+    ]
+    return {
+        "invocation": name,
+        "import_ms": round(import_ms, 1),
+        "budget_ms": budget_ms,
+        "forbidden": forbidden,
+        "ok": not forbidden and import_ms <= budget_ms,
+    }
+
+
+def main() -> int:
+    """Main entry point. Returns exit code."""
+    parser = argparse.ArgumentParser(description="Check the scripts' import-time startup budget.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every time budget by this factor (default: 1.0)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per invocation; the fastest is compared to the budget (default: 3)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format (default: table)",
+    )
+    args = parser.parse_args()
+
+    baseline = set(import_profile(["-c", "pass"])[1])
+    results = [
+        check(name, script_args, allowed, budget * args.scale, baseline, max(args.repeat, 1))
+        for name, script_args, allowed, budget in INVOCATIONS
+    ]
+
+    if args.format == "json":
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'INVOCATION':<36}{'IMPORT ms':>10}{'BUDGET ms':>10}  RESULT")
+        for r in results:
+            status = "ok" if r["ok"] else "FAIL"
+            if r["forbidden"]:
+                status += f" (imports {', '.join(r['forbidden'])})"
+            print(f"{r['invocation']:<36}{r['import_ms']:>10.1f}{r['budget_ms']:>10.0f}  {status}")
+
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
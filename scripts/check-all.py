@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Run every repository check in one process.
+
+Runs validate-skills.py (skills, counts, workflows), validate-markdown.py
+(including its --links check against the repository root) and
+update-docs.py --check over a single shared TreeIndex, so the interpreter
+starts once, PyYAML is imported once, the tree is walked once and each file
+is read at most once. Each tool's own CLI keeps working on its own.
+
+Usage:
+    python scripts/check-all.py                 # Run everything
+    python scripts/check-all.py --format json   # Combined JSON report for CI
+
+Exit codes:
+    0 = Success (warnings allowed)
+    1 = Skill/workflow errors, markdown issues, or docs out of sync
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+from common import TreeIndex
+
+
+def load_script(filename: str):
+    """Import a sibling script whose file name is not a valid module name."""
+    path = Path(__file__).with_name(filename)
+    name = path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> int:
+    """Main entry point. Returns exit code."""
+    parser = argparse.ArgumentParser(
+        description="Run skill, workflow, markdown and docs-sync checks in one process.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format (default: table)",
+    )
+    parser.add_argument(
+        "--skills-dir",
+        default="skills",
+        help="Path to skills directory (default: skills)",
+    )
+    parser.add_argument(
+        "--markdown-path",
+        type=Path,
+        default=Path("skills"),
+        help="Path for markdown validation (default: skills/)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every skill and markdown file without reading or writing the validation cache",
+    )
+    args = parser.parse_args()
+
+    validate_skills = load_script("validate-skills.py")
+    validate_markdown = load_script("validate-markdown.py")
+    update_docs = load_script("update-docs.py")
+
+    base_path = Path(".")
+    skills_dir = Path(args.skills_dir)
+    index = TreeIndex([
+        *validate_skills.index_roots(skills_dir, base_path),
+        args.markdown_path,
+        base_path,
+        base_path / update_docs.VERSION_FILE,
+        *(base_path / f for f in update_docs.FILES_TO_UPDATE),
+    ])
+
+    # Skills, counts and workflows
+    report = validate_skills.SkillValidator(
+        skills_dir=args.skills_dir,
+        cache_dir=None if args.no_cache else validate_skills.CACHE_DIR,
+        index=index,
+    ).validate()
+    workflow_validator = validate_skills.WorkflowValidator(base_path, index=index)
+    report.add_workflow_issues(workflow_validator.validate())
+    report.phase_graph = workflow_validator.phase_graph
+
+    # Markdown
+    if not index.exists(args.markdown_path):
+        print(f"Error: Path does not exist: {args.markdown_path}", file=sys.stderr)
+        return 1
+    cache = None if args.no_cache else validate_markdown.MarkdownCache(Path(validate_skills.CACHE_DIR))
+    links = validate_markdown.LinkIndex(base_path, index)
+    if index.is_file(args.markdown_path):
+        results = validate_markdown.iter_files([args.markdown_path], index, cache=cache, links=links)
+        markdown_issues = [issue for _, issues in results for issue in issues]
+    else:
+        markdown_issues = validate_markdown.validate_directory(
+            args.markdown_path, index=index, cache=cache, links=links
+        )
+
+    # Docs sync
+    try:
+        out_of_sync = update_docs.find_out_of_sync(base_path, index)
+    except FileNotFoundError:
+        print(f"Error: {update_docs.VERSION_FILE} not found", file=sys.stderr)
+        return 1
+
+    failed = {
+        "skills": report.has_errors,
+        "markdown": bool(markdown_issues),
+        "docs": bool(out_of_sync),
+    }
+
+    if args.format == "json":
+        print(json.dumps({
+            "skills": report.to_dict(),
+            "markdown": [i.to_dict() for i in markdown_issues],
+            "docs": {"out_of_sync": out_of_sync},
+            "summary": {"failed": [name for name, bad in failed.items() if bad]},
+        }, indent=2))
+    else:
+        print(validate_skills.TableFormatter().format(report))
+        print("=" * 80)
+        print(f"MARKDOWN VALIDATION ({args.markdown_path})")
+        print("=" * 80)
+        print(validate_markdown.format_text(markdown_issues))
+        print("")
+        print("=" * 80)
+        print("DOCS SYNC")
+        print("=" * 80)
+        if out_of_sync:
+            print(f"  Out of sync: {', '.join(out_of_sync)}")
+            print("  Run 'python scripts/update-docs.py' to update.")
+        else:
+            print("  In sync")
+        print("")
+        print("=" * 80)
+        failures = [name for name, bad in failed.items() if bad]
+        if failures:
+            print(f"OVERALL: FAILED ({', '.join(failures)})")
+        else:
+            print("OVERALL: PASSED")
+        print("=" * 80)
+
+    return 1 if any(failed.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,498 @@
+"""
+Helpers shared by the validation scripts in this directory.
+
+The scripts import this module by name; running ``python scripts/<script>.py``
+puts ``scripts/`` on ``sys.path``.
+
+Modules only some invocations need (subprocess for git, tracemalloc and json
+for --profile) are imported inside the functions that use them, so a plain
+run does not pay for them at startup.
+"""
+
+import fnmatch
+import os
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+
+
+# =============================================================================
+# Git
+# =============================================================================
+
+def git_changed_files(ref: str | None = None, staged: bool = False) -> list[Path]:
+    """Return files changed since ``ref`` (or staged in the index) per local git.
+
+    With ``ref``, this is everything that differs between ``ref`` and the
+    working tree plus untracked files, so uncommitted edits are included.
+    With ``staged``, it is only what ``git commit`` would record. Paths are
+    relative to the current directory and may name files that were deleted.
+
+    Raises:
+        RuntimeError: git is unavailable or rejects the ref.
+    """
+    if staged:
+        commands = [["git", "diff", "--cached", "--name-only", "--relative", "-z"]]
+    else:
+        commands = [
+            ["git", "diff", "--name-only", "--relative", "-z", ref or "HEAD", "--"],
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+        ]
+
+    import subprocess
+
+    changed: set[str] = set()
+    for cmd in commands:
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        except OSError as e:
+            raise RuntimeError(f"Could not run git: {e}") from e
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip() or f"{' '.join(cmd)} failed")
+        changed.update(p for p in proc.stdout.split("\0") if p)
+
+    return [Path(p) for p in sorted(changed)]
+
+
+# =============================================================================
+# Sharding
+# =============================================================================
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse an ``i/N`` shard spec (1 <= i <= N) into ``(i, N)``.
+
+    Raises:
+        ValueError: ``spec`` is not of that form.
+    """
+    index, sep, count = spec.partition("/")
+    if not (sep and index.isdigit() and count.isdigit()) or not 1 <= int(index) <= int(count):
+        raise ValueError(f"Invalid shard {spec!r}: expected i/N with 1 <= i <= N (e.g. 2/4)")
+    return int(index), int(count)
+
+
+def in_shard(key: str, shard: tuple[int, int]) -> bool:
+    """Whether ``key`` belongs to ``shard`` (see parse_shard).
+
+    The CRC-32 of ``key`` is stable across runs, machines and Python
+    versions (unlike ``hash()``), so N jobs given shards 1/N..N/N each get a
+    disjoint slice and together cover every key exactly once.
+    """
+    import zlib
+
+    index, count = shard
+    return zlib.crc32(key.encode()) % count == index - 1
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+# Shared by validate-skills.py (skills/) and validate-markdown.py (markdown.json)
+CACHE_DIR = ".validate-cache"
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a temporary file and rename.
+
+    Concurrent readers see either the old contents or the new, never a
+    partial file. Creates missing parent directories.
+
+    Raises:
+        OSError: The file could not be written.
+    """
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# =============================================================================
+# Profiling
+# =============================================================================
+
+# Order of kinds in the report; files are the most numerous and come last
+PROFILE_KINDS = ["phase", "checker", "skill", "file"]
+PROFILE_TABLE_FILES = 20
+
+
+class _Measurement:
+    """One timed, memory-traced span; see Profiler.measure."""
+
+    def __init__(self, profiler: "Profiler", key: tuple[str, str]):
+        self.profiler = profiler
+        self.key = key
+
+    def __enter__(self) -> None:
+        import tracemalloc
+
+        stack = self.profiler._stack
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1].child_peak = max(stack[-1].child_peak, peak)
+        tracemalloc.reset_peak()
+        self.start_memory = current
+        self.child_peak = 0
+        stack.append(self)
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        import tracemalloc
+
+        elapsed = time.perf_counter() - self.started
+        stack = self.profiler._stack
+        peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+        stack.pop()
+        if stack:
+            stack[-1].child_peak = max(stack[-1].child_peak, peak)
+        stat = self.profiler.stats.setdefault(self.key, [0, 0.0, 0])
+        stat[0] += 1
+        stat[1] += elapsed
+        stat[2] = max(stat[2], peak - self.start_memory)
+
+
+class Profiler:
+    """Wall time, call count and peak traced allocation per phase, checker, skill and file.
+
+    Disabled by default, in which case ``measure`` returns a shared no-op
+    context and costs next to nothing. Spans may nest: a span's peak includes
+    its children's. Times include tracemalloc's own overhead.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stats: dict[tuple[str, str], list] = {}
+        self._stack: list[_Measurement] = []
+        self._null = nullcontext()
+
+    def enable(self) -> None:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.enabled = True
+
+    def measure(self, kind: str, name: str):
+        """Context manager recording one call of ``name`` under ``kind``.
+
+        A span nested inside another with the same kind and name (a file read
+        during that file's own validation) is folded into the outer one.
+        """
+        key = (kind, name)
+        if not self.enabled or any(m.key == key for m in self._stack):
+            return self._null
+        return _Measurement(self, key)
+
+    def rows(self) -> list[dict]:
+        """All recorded entries, grouped by kind and sorted by total time."""
+        rows = [
+            {"kind": kind, "name": name, "calls": calls,
+             "total_ms": seconds * 1000, "peak_kib": peak / 1024}
+            for (kind, name), (calls, seconds, peak) in self.stats.items()
+        ]
+        order = {kind: i for i, kind in enumerate(PROFILE_KINDS)}
+        rows.sort(key=lambda r: (order.get(r["kind"], len(order)), -r["total_ms"]))
+        return rows
+
+    def format(self, fmt: str = "table") -> str:
+        """Render the profile as a table (top files only) or JSON (everything)."""
+        rows = self.rows()
+        if fmt == "json":
+            import json
+
+            return json.dumps(rows, indent=2)
+
+        files = [r for r in rows if r["kind"] == "file"]
+        shown = [r for r in rows if r["kind"] != "file"] + files[:PROFILE_TABLE_FILES]
+        lines = [
+            "=" * 80,
+            "PROFILE (times include tracemalloc overhead)",
+            "=" * 80,
+            f"{'KIND':<8} {'NAME':<38} {'CALLS':>6} {'TOTAL ms':>9} {'MEAN ms':>8} {'PEAK KiB':>8}",
+        ]
+        for r in shown:
+            name = r["name"] if len(r["name"]) <= 38 else "..." + r["name"][-35:]
+            lines.append(
+                f"{r['kind']:<8} {name:<38} {r['calls']:>6} {r['total_ms']:>9.2f} "
+                f"{r['total_ms'] / r['calls']:>8.3f} {r['peak_kib']:>8.1f}"
+            )
+        if len(files) > PROFILE_TABLE_FILES:
+            lines.append(f"  ... {len(files) - PROFILE_TABLE_FILES} more files (use --profile json)")
+        return "\n".join(lines)
+
+
+# Process-wide profiler; scripts enable it for --profile
+PROFILER = Profiler()
+
+
+# =============================================================================
+# Filesystem Index
+# =============================================================================
+
+# Directory names never descended into: they never hold anything the scripts check
+PRUNED_DIRS = frozenset({".git", ".validate-cache", "__pycache__", "node_modules"})
+# Contents of larger files are read each time they are asked for rather than kept
+MAX_RETAINED_SIZE = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """One file or directory in a TreeIndex snapshot."""
+    is_dir: bool
+    size: int
+    mtime_ns: int
+
+
+class TreeIndex:
+    """Snapshot of one or more directory trees, built with a single os.scandir walk.
+
+    Every checker and counter queries this instead of walking the tree again.
+    It records paths, sizes and mtimes up front and loads file contents lazily,
+    once. Queries accept paths in whatever form the caller uses (relative or
+    absolute) and return paths built from the caller's own path, so messages
+    that embed them look the same as with pathlib. Paths outside the indexed
+    roots, or inside pruned directories, fall through to the real filesystem.
+    """
+
+    def __init__(self, roots: Iterable[Path], prune: frozenset[str] = PRUNED_DIRS):
+        self.roots = [Path(r) for r in roots]
+        self.prune = prune
+        self._entries: dict[str, IndexEntry] = {}
+        self._children: dict[str, list[str]] = {}
+        self._contents: dict[str, bytes] = {}
+        self._dir_roots: list[str] = []
+        self._pruned: list[str] = []
+        self._overlaid: dict[str, IndexEntry | None] = {}  # On-disk entry under each overlay
+        # Parents sort before their children, so overlapping roots are walked once
+        with PROFILER.measure("phase", "walk"):
+            for root in sorted({os.path.abspath(r) for r in self.roots}):
+                if not self._covers(root):
+                    self._scan(root)
+
+    def _scan(self, root: str) -> None:
+        try:
+            st = os.stat(root)
+        except OSError:
+            return
+        if not os.path.isdir(root):
+            self._entries[root] = IndexEntry(False, st.st_size, st.st_mtime_ns)
+            return
+
+        self._dir_roots.append(root)
+        self._entries[root] = IndexEntry(True, 0, st.st_mtime_ns)
+        # Symlinks are followed like pathlib does; each directory carries the
+        # (device, inode) of its ancestors so a link back up is not descended
+        stack = [(root, frozenset({(st.st_dev, st.st_ino)}))]
+        while stack:
+            directory, ancestors = stack.pop()
+            names = self._children.setdefault(directory, [])
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                    st = entry.stat()
+                except OSError:
+                    continue  # Deleted mid-walk or broken symlink
+                if is_dir and entry.name in self.prune:
+                    self._pruned.append(entry.path)
+                    continue
+                names.append(entry.name)
+                self._entries[entry.path] = IndexEntry(is_dir, st.st_size, st.st_mtime_ns)
+                if is_dir:
+                    identity = (st.st_dev, st.st_ino)
+                    if identity in ancestors:
+                        self._pruned.append(entry.path)  # Symlink loop: look inside on disk
+                    else:
+                        stack.append((entry.path, ancestors | {identity}))
+
+    def _covers(self, key: str) -> bool:
+        """Whether ``key`` (absolute) lies inside the indexed snapshot."""
+        if key in self._entries:
+            return True
+        inside = any(key.startswith(root + os.sep) for root in self._dir_roots)
+        return inside and not any(
+            key == pruned or key.startswith(pruned + os.sep) for pruned in self._pruned
+        )
+
+    # -- Queries ---------------------------------------------------------------
+
+    def covers(self, path: Path) -> bool:
+        """Whether ``path`` lies inside the indexed snapshot, so queries about it never touch the disk."""
+        return self._covers(os.path.abspath(path))
+
+    def stat(self, path: Path) -> IndexEntry | None:
+        """Return the entry for ``path``, or None if it does not exist."""
+        key = os.path.abspath(path)
+        entry = self._entries.get(key)
+        if entry is not None or self._covers(key):
+            return entry
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        return IndexEntry(os.path.isdir(key), st.st_size, st.st_mtime_ns)
+
+    def exists(self, path: Path) -> bool:
+        return self.stat(path) is not None
+
+    def is_dir(self, path: Path) -> bool:
+        entry = self.stat(path)
+        return entry is not None and entry.is_dir
+
+    def is_file(self, path: Path) -> bool:
+        entry = self.stat(path)
+        return entry is not None and not entry.is_dir
+
+    def iterdir(self, path: Path) -> list[Path]:
+        """Children of directory ``path`` (empty if it is not a directory)."""
+        path = Path(path)
+        key = os.path.abspath(path)
+        if key in self._children:
+            return [path / name for name in self._children[key]]
+        if self._covers(key):
+            return []
+        try:
+            return list(path.iterdir())
+        except OSError:
+            return []
+
+    def glob(self, path: Path, pattern: str) -> list[Path]:
+        """Direct children of ``path`` whose names match ``pattern``."""
+        return [p for p in self.iterdir(path) if fnmatch.fnmatchcase(p.name, pattern)]
+
+    def rglob(self, path: Path, pattern: str) -> list[Path]:
+        """Files and directories anywhere under ``path`` whose names match ``pattern``."""
+        matches = []
+        stack = [Path(path)]
+        while stack:
+            for child in self.iterdir(stack.pop()):
+                if fnmatch.fnmatchcase(child.name, pattern):
+                    matches.append(child)
+                if self.is_dir(child):
+                    stack.append(child)
+        return matches
+
+    def read_bytes(self, path: Path) -> bytes:
+        """File contents, read from disk on first access only.
+
+        Files over MAX_RETAINED_SIZE are read again on every call, so a
+        large manuscript is not held in memory for the rest of the run.
+        """
+        key = os.path.abspath(path)
+        data = self._contents.get(key)
+        if data is None:
+            with PROFILER.measure("phase", "read"), PROFILER.measure("file", str(path)):
+                with open(key, "rb") as f:
+                    data = f.read()
+            if key in self._entries and len(data) <= MAX_RETAINED_SIZE:
+                self._contents[key] = data
+        return data
+
+    def overlay_bytes(self, path: Path) -> bytes | None:
+        """Contents of ``path`` if it is overlaid (see overlay), else None."""
+        key = os.path.abspath(path)
+        return self._contents.get(key) if key in self._overlaid else None
+
+    def read_text(self, path: Path) -> str:
+        """File contents decoded as UTF-8 with universal newlines, like Path.read_text."""
+        text = self.read_bytes(path).decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def mtimes(self) -> dict[Path, int]:
+        """Map every indexed file, as a path under the root it was given as, to its mtime in ns."""
+        stamps = {}
+        for root in self.roots:
+            for path in [root] if self.is_file(root) else self.rglob(root, "*"):
+                entry = self.stat(path)
+                if entry is not None and not entry.is_dir:
+                    stamps[path] = entry.mtime_ns
+        return stamps
+
+    # -- Overlays --------------------------------------------------------------
+
+    def overlay(self, path: Path, text: str) -> None:
+        """Serve ``text`` as the contents of file ``path`` instead of what is on disk.
+
+        Used for unsaved editor buffers. The file may not exist yet, but its
+        directory must already be indexed for it to show up in iterdir().
+        """
+        key = os.path.abspath(path)
+        data = text.encode("utf-8")
+        if key not in self._overlaid:
+            self._overlaid[key] = self._entries.get(key)
+            if self._overlaid[key] is None and os.path.dirname(key) in self._children:
+                self._children[os.path.dirname(key)].append(os.path.basename(key))
+        self._entries[key] = IndexEntry(False, len(data), time.time_ns())
+        self._contents[key] = data
+
+    def discard_overlay(self, path: Path) -> None:
+        """Drop the overlay on ``path``; its contents are read from disk again."""
+        key = os.path.abspath(path)
+        if key not in self._overlaid:
+            return
+        original = self._overlaid.pop(key)
+        self._contents.pop(key, None)
+        if original is not None:
+            self._entries[key] = original
+        else:
+            del self._entries[key]
+            siblings = self._children.get(os.path.dirname(key), [])
+            if os.path.basename(key) in siblings:
+                siblings.remove(os.path.basename(key))
+
+    def inherit_contents(self, other: "TreeIndex") -> None:
+        """Reuse contents ``other`` already loaded for files that have not changed since."""
+        for key, data in other._contents.items():
+            entry = self._entries.get(key)
+            if entry is not None and entry == other._entries.get(key):
+                self._contents[key] = data
+
+    def __getstate__(self) -> dict:
+        # Worker processes re-read what they need; don't ship loaded contents
+        state = self.__dict__.copy()
+        state["_contents"] = {}
+        return state
+
+
+# =============================================================================
+# Watching
+# =============================================================================
+
+def changed_files(previous: dict[Path, int], current: dict[Path, int]) -> set[Path]:
+    """Files added, modified or deleted between two TreeIndex.mtimes() snapshots."""
+    return {
+        path for path in previous.keys() | current.keys()
+        if previous.get(path) != current.get(path)
+    }
+
+
+def watch_changes(roots: list[Path], interval: float) -> Iterator[tuple[set[Path], TreeIndex]]:
+    """Poll ``roots`` every ``interval`` seconds, yielding each batch of changed files.
+
+    Added, modified and deleted files are all reported, together with the
+    fresh TreeIndex the change was detected from (already holding any
+    contents loaded through the previous one for files that did not change).
+    Polling needs no platform file-notification support.
+    """
+    index = TreeIndex(roots)
+    previous = index.mtimes()
+    while True:
+        time.sleep(interval)
+        fresh = TreeIndex(roots)
+        current = fresh.mtimes()
+        changed = changed_files(previous, current)
+        previous = current
+        if changed:
+            fresh.inherit_contents(index)
+            index = fresh
+            yield changed, index
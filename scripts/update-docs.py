@@ -18,6 +18,7 @@ Usage:
     python scripts/update-docs.py           # Update all files
     python scripts/update-docs.py --check   # Check if files are in sync (no changes)
     python scripts/update-docs.py --dry-run # Show what would change
+    python scripts/update-docs.py --check --profile  # Time and memory per phase/file
 
 Exit codes:
     0 = Success (or in sync for --check)
@@ -30,6 +31,8 @@ import re
 import sys
 from pathlib import Path
 
+from common import PROFILER, TreeIndex
+
 
 # =============================================================================
 # Configuration
@@ -59,31 +62,39 @@ MARKERS = {
 # Count Functions
 # =============================================================================
 
-def count_skills(base_path: Path) -> int:
+def build_index(base_path: Path) -> TreeIndex:
+    """Index the trees the counters query, in one filesystem walk."""
+    return TreeIndex([base_path / SKILLS_DIR, base_path / COMMANDS_DIR])
+
+
+def count_skills(base_path: Path, index: TreeIndex | None = None) -> int:
     """Count skill directories that contain a SKILL.md file."""
+    index = index or build_index(base_path)
     skills_dir = base_path / SKILLS_DIR
-    if not skills_dir.exists():
+    if not index.exists(skills_dir):
         return 0
     return sum(
-        1 for d in skills_dir.iterdir()
-        if d.is_dir() and (d / "SKILL.md").exists()
+        1 for d in index.iterdir(skills_dir)
+        if index.is_dir(d) and index.exists(d / "SKILL.md")
     )
 
 
-def count_references(base_path: Path) -> int:
-    """Count reference markdown files."""
+def count_references(base_path: Path, index: TreeIndex | None = None) -> int:
+    """Count reference markdown files (any references/*.md under skills/)."""
+    index = index or build_index(base_path)
     skills_dir = base_path / SKILLS_DIR
-    if not skills_dir.exists():
+    if not index.exists(skills_dir):
         return 0
-    return sum(1 for _ in skills_dir.rglob("references/*.md"))
+    return sum(1 for ref in index.rglob(skills_dir, "*.md") if ref.parent.name == "references")
 
 
-def count_workflows(base_path: Path) -> int:
+def count_workflows(base_path: Path, index: TreeIndex | None = None) -> int:
     """Count COMMAND.md files in commands/ subdirectories recursively."""
+    index = index or build_index(base_path)
     commands_dir = base_path / COMMANDS_DIR
-    if not commands_dir.exists():
+    if not index.exists(commands_dir):
         return 0
-    return sum(1 for _ in commands_dir.rglob("COMMAND.md"))
+    return sum(1 for _ in index.rglob(commands_dir, "COMMAND.md"))
 
 
 # =============================================================================
@@ -106,15 +117,8 @@ def replace_marker(content: str, marker: str, value: str) -> str:
     return re.sub(pattern, replacement, content, flags=re.DOTALL)
 
 
-def update_markdown_file(file_path: Path, version: str, counts: dict, dry_run: bool) -> bool:
-    """Update Markdown files using marker-based replacement."""
-    if not file_path.exists():
-        print(f"  Skipping {file_path} (not found)")
-        return False
-
-    content = file_path.read_text()
-    original = content
-
+def render_markdown(content: str, version: str, counts: dict) -> str:
+    """Apply version and counts to Markdown content using marker-based replacement."""
     # Replace markers for each count type
     content = replace_marker(content, MARKERS["skillCount"], str(counts["skillCount"]))
     content = replace_marker(content, MARKERS["workflowCount"], str(counts["workflowCount"]))
@@ -134,59 +138,29 @@ def update_markdown_file(file_path: Path, version: str, counts: dict, dry_run: b
         rf'\g<1>{version}\2',
         content
     )
-
-    if content != original:
-        if dry_run:
-            print(f"  Would update {file_path}")
-        else:
-            file_path.write_text(content)
-            print(f"  Updated {file_path}")
-        return True
-    return False
+    return content
 
 
-def update_html_file(file_path: Path, version: str, counts: dict, dry_run: bool) -> bool:
-    """Update HTML files using marker-based replacement."""
-    if not file_path.exists():
-        print(f"  Skipping {file_path} (not found)")
-        return False
-
-    content = file_path.read_text()
-    original = content
-
+def render_html(content: str, version: str, counts: dict) -> str:
+    """Apply version and counts to HTML content using marker-based replacement."""
     # Replace markers for each count type
     content = replace_marker(content, MARKERS["skillCount"], str(counts["skillCount"]))
     content = replace_marker(content, MARKERS["workflowCount"], str(counts["workflowCount"]))
     content = replace_marker(content, MARKERS["referenceFileCount"], str(counts["referenceFileCount"]))
     content = replace_marker(content, MARKERS["version"], version)
-
-    if content != original:
-        if dry_run:
-            print(f"  Would update {file_path}")
-        else:
-            file_path.write_text(content)
-            print(f"  Updated {file_path}")
-        return True
-    return False
+    return content
 
 
 # =============================================================================
 # JSON File Updates (anchored patterns - no HTML comments in JSON)
 # =============================================================================
 
-def update_json_file(file_path: Path, version: str, counts: dict, dry_run: bool) -> bool:
-    """Update JSON files using anchored regex patterns.
+def render_json(content: str, version: str, counts: dict) -> str:
+    """Apply version and counts to JSON content using anchored regex patterns.
 
     JSON files can't use HTML comments, so we use patterns anchored to
     specific JSON keys/contexts.
     """
-    if not file_path.exists():
-        print(f"  Skipping {file_path} (not found)")
-        return False
-
-    content = file_path.read_text()
-    original = content
-
     # Update version in "version": "X.Y.Z" pattern
     content = re.sub(
         r'"version":\s*"[^"]*"',
@@ -209,17 +183,77 @@ def update_json_file(file_path: Path, version: str, counts: dict, dry_run: bool)
         rf'\g<1>{counts["workflowCount"]} project workflow commands',
         content
     )
+    return content
+
+
+RENDERERS = {
+    "json": render_json,
+    "markdown": render_markdown,
+    "html": render_html,
+}
+
+
+# =============================================================================
+# File Updates
+# =============================================================================
+
+def update_file(file_path: Path, file_type: str, version: str, counts: dict, dry_run: bool) -> bool:
+    """Rewrite one documentation file; return True if its content changes."""
+    if not file_path.exists():
+        print(f"  Skipping {file_path} (not found)")
+        return False
+
+    with PROFILER.measure("file", str(file_path)):
+        with PROFILER.measure("phase", "read"):
+            content = file_path.read_text()
+        with PROFILER.measure("phase", "check"):
+            updated = RENDERERS[file_type](content, version, counts)
 
-    if content != original:
+    if updated != content:
         if dry_run:
             print(f"  Would update {file_path}")
         else:
-            file_path.write_text(content)
+            file_path.write_text(updated)
             print(f"  Updated {file_path}")
         return True
     return False
 
 
+def compute_counts(base_path: Path, index: TreeIndex | None = None) -> dict:
+    """Compute skill, workflow and reference counts from the filesystem."""
+    index = index or build_index(base_path)
+    with PROFILER.measure("phase", "count"):
+        return {
+            "skillCount": count_skills(base_path, index),
+            "workflowCount": count_workflows(base_path, index),
+            "referenceFileCount": count_references(base_path, index),
+        }
+
+
+def find_out_of_sync(base_path: Path, index: TreeIndex | None = None) -> list[str]:
+    """Return the files ``--check`` would report as out of sync, without printing.
+
+    Raises:
+        FileNotFoundError: version.json is missing.
+    """
+    index = index or build_index(base_path)
+    version_data = json.loads(index.read_text(base_path / VERSION_FILE))
+    version = version_data.get("version", "0.0.0")
+    counts = compute_counts(base_path, index)
+
+    stale = []
+    if any(version_data.get(key) != value for key, value in counts.items()):
+        stale.append(VERSION_FILE)
+    for file_path, file_type in FILES_TO_UPDATE.items():
+        full_path = base_path / file_path
+        if not index.exists(full_path):
+            continue
+        content = index.read_text(full_path)
+        if RENDERERS[file_type](content, version, counts) != content:
+            stale.append(file_path)
+    return stale
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -239,8 +273,18 @@ def main():
         action="store_true",
         help="Show what would change without making changes",
     )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+        help="Print time, calls and peak memory per phase and file to stderr",
+    )
     args = parser.parse_args()
 
+    if args.profile:
+        PROFILER.enable()
+
     base_path = Path(".")
     version_path = base_path / VERSION_FILE
 
@@ -256,11 +300,7 @@ def main():
 
     # Compute counts
     print("Computing counts...")
-    counts = {
-        "skillCount": count_skills(base_path),
-        "workflowCount": count_workflows(base_path),
-        "referenceFileCount": count_references(base_path),
-    }
+    counts = compute_counts(base_path)
     print(f"  Skills: {counts['skillCount']}")
     print(f"  Workflows: {counts['workflowCount']}")
     print(f"  Reference files: {counts['referenceFileCount']}")
@@ -286,17 +326,11 @@ def main():
     print(f"\nUpdating files with version {version}...")
     files_changed = 0
 
-    update_funcs = {
-        "json": update_json_file,
-        "markdown": update_markdown_file,
-        "html": update_html_file,
-    }
-
     for file_path, file_type in FILES_TO_UPDATE.items():
-        update_func = update_funcs.get(file_type)
-        if update_func:
-            changed = update_func(
+        if file_type in RENDERERS:
+            changed = update_file(
                 base_path / file_path,
+                file_type,
                 version,
                 counts,
                 dry_run=args.dry_run or args.check,
@@ -307,6 +341,9 @@ def main():
     # Summary
     print(f"\n{'Would update' if args.dry_run or args.check else 'Updated'} {files_changed} files")
 
+    if PROFILER.enabled:
+        print(PROFILER.format(args.profile), file=sys.stderr)
+
     if args.check and (files_changed > 0 or needs_update):
         print("\nFiles are out of sync. Run 'python scripts/update-docs.py' to update.")
         sys.exit(1)
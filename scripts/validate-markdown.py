@@ -4,20 +4,37 @@ Validate markdown files for common parsing errors.
 
 Checks for:
 - HTML comments breaking tables
-- Unclosed code blocks
+- Unclosed code blocks (``` and ~~~ fences)
 - Missing table separator rows
 - Inconsistent column counts in tables
+- With --links: relative links, images, [[wikilinks]] and SKILL.md Reference
+  Guide pointers to missing files or headings
 
 Usage:
     python scripts/validate-markdown.py [--check] [--path PATH]
+    python scripts/validate-markdown.py --changed-since origin/main
+    python scripts/validate-markdown.py --staged
+    python scripts/validate-markdown.py --watch
+    python scripts/validate-markdown.py --shard 2/4   # One of 4 parallel CI jobs
+    python scripts/validate-markdown.py --path . --jobs 0  # One worker process per CPU
+    python scripts/validate-markdown.py --path . --cache-dir .validate-cache  # Re-check only edited files
+    python scripts/validate-markdown.py --path . --links  # Also check local links and anchors
 """
 
 from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from enum import StrEnum
 import argparse
+import io
+import os
 import re
 import sys
+import time
+
+from common import (
+    CACHE_DIR, PROFILER, TreeIndex, git_changed_files, in_shard, parse_shard, watch_changes, write_atomic,
+)
 
 
 class IssueType(StrEnum):
@@ -25,9 +42,11 @@ class IssueType(StrEnum):
     UNCLOSED_CODE_BLOCK = "unclosed-code-block"
     MISSING_SEPARATOR = "missing-table-separator"
     COLUMN_MISMATCH = "column-count-mismatch"
+    BROKEN_LINK = "broken-link"
+    BROKEN_ANCHOR = "broken-anchor"
 
 
-@dataclass
+@dataclass(frozen=True)
 class MarkdownIssue:
     file: Path
     line: int
@@ -37,6 +56,14 @@ class MarkdownIssue:
     def __str__(self) -> str:
         return f"{self.file}:{self.line}: [{self.issue_type}] {self.message}"
 
+    def to_dict(self) -> dict:
+        return {
+            "file": str(self.file),
+            "line": self.line,
+            "type": str(self.issue_type),
+            "message": self.message,
+        }
+
 
 def count_columns(line: str) -> int:
     """Count table columns, accounting for escaped pipes."""
@@ -44,155 +71,832 @@ def count_columns(line: str) -> int:
     return cleaned.count("|") - 1
 
 
-def is_table_row(line: str) -> bool:
-    """Check if a line is a table row."""
-    stripped = line.strip()
-    return stripped.startswith("|") and stripped.endswith("|") and len(stripped) > 2
+# =============================================================================
+# Block Tokenizer
+# =============================================================================
+
+class BlockKind(StrEnum):
+    FENCE_OPEN = "fence-open"
+    FENCE_CLOSE = "fence-close"
+    CODE = "code"  # A line inside a fenced code block
+    HEADING = "heading"
+    TABLE_ROW = "table-row"
+    HTML_COMMENT = "html-comment"  # A line that opens an HTML comment or is inside one
+    BLANK = "blank"
+    TEXT = "text"
+
+
+# One line of a markdown file as (kind, line number, stripped text, info),
+# where info is the info string of a fence opener, the title of a heading,
+# or "<!--" for an HTML comment line on which a comment opens.
+# Plain tuples: one is built per line, and they are several times cheaper
+# to create than a dataclass or namedtuple.
+Block = tuple[BlockKind, int, str, str]
+
+
+# A fence is three or more backticks or tildes; backtick info strings cannot contain "`"
+FENCE_PATTERN = re.compile(r"(`{3,}|~{3,})(.*)")
+HEADING_PATTERN = re.compile(r"(#{1,6})(?:\s+(.*?))?(?:\s+#+)?")
+SEPARATOR_PATTERN = re.compile(r"\|[\s\-:|]+\|")
+BACKTICKS_PATTERN = re.compile(r"`+")
+
+
+def tokenize_blocks(lines: Iterable[str]) -> Iterator[Block]:
+    """Classify ``lines`` one at a time, tracking fenced code blocks and HTML comments.
+
+    A generator over any iterable of lines (an open file streams it), so
+    memory does not grow with the file. A fence is closed by a line of the
+    same character, at least as long, with no info string. An HTML comment
+    opens at a "<!--" outside fences and code spans and runs to the next
+    "-->", across lines if need be; fences inside it are not fences.
+    """
+    return _tokenize_numbered(enumerate(lines, 1))
+
+
+def _tokenize_numbered(numbered: Iterable[tuple[int, str]]) -> Iterator[Block]:
+    """tokenize_blocks over ``(line number, line)`` pairs, which may skip lines outside fences."""
+    fence_char = ""
+    fence_len = 0
+    in_comment = False
+    for lineno, line in numbered:
+        stripped = line.strip()
+        first = stripped[:1]
+
+        if fence_char:
+            if first == fence_char and (match := FENCE_PATTERN.fullmatch(stripped)):
+                marker, rest = match.groups()
+                if marker[0] == fence_char and len(marker) >= fence_len and not rest.strip():
+                    fence_char = ""
+                    yield (BlockKind.FENCE_CLOSE, lineno, stripped, "")
+                    continue
+            yield (BlockKind.CODE, lineno, stripped, "")
+        elif in_comment:
+            end = stripped.find("-->")
+            start = -1 if end < 0 else _find_comment(stripped, end + 3)
+            in_comment = end < 0 or (start >= 0 and _comment_open(stripped, start))
+            yield (BlockKind.HTML_COMMENT, lineno, stripped, "<!--" if start >= 0 else "")
+        elif not stripped:
+            yield (BlockKind.BLANK, lineno, stripped, "")
+        elif first == "|" and stripped[-1] == "|" and len(stripped) > 2 and "<!--" not in stripped:
+            yield (BlockKind.TABLE_ROW, lineno, stripped, "")
+        elif first == "#" and (match := HEADING_PATTERN.fullmatch(stripped)):
+            if "<!--" in stripped and (start := _find_comment(stripped)) >= 0:
+                in_comment = _comment_open(stripped, start)
+            yield (BlockKind.HEADING, lineno, stripped, match[2] or "")
+        elif (
+            (first == "`" or first == "~")
+            and (match := FENCE_PATTERN.fullmatch(stripped))
+            and not (first == "`" and "`" in match[2])
+        ):
+            fence_char, fence_len = first, len(match[1])
+            yield (BlockKind.FENCE_OPEN, lineno, stripped, match[2].strip())
+        elif "<!--" in stripped and (start := _find_comment(stripped)) >= 0:
+            in_comment = _comment_open(stripped, start)
+            yield (BlockKind.HTML_COMMENT, lineno, stripped, "<!--")
+        elif first == "|" and stripped[-1] == "|" and len(stripped) > 2:
+            # A row whose "<!--" is inside a code span
+            yield (BlockKind.TABLE_ROW, lineno, stripped, "")
+        else:
+            yield (BlockKind.TEXT, lineno, stripped, "")
+
+
+def _find_comment(text: str, pos: int = 0) -> int:
+    """Index of the first "<!--" in ``text`` from ``pos`` that is not inside a code span, or -1."""
+    while (start := text.find("<!--", pos)) >= 0:
+        tick = text.find("`", pos, start)
+        if tick < 0:
+            return start
+        # A code span closes at the next backtick run of the same length; an unclosed run is literal
+        run = BACKTICKS_PATTERN.match(text, tick).end() - tick
+        close = next((m for m in BACKTICKS_PATTERN.finditer(text, tick + run) if m.end() - m.start() == run), None)
+        pos = close.end() if close else tick + run
+    return -1
+
+
+def _comment_open(text: str, start: int) -> bool:
+    """Whether the comment opening at ``start`` in ``text``, or a later one, is still open at its end."""
+    while (end := text.find("-->", start + 2)) >= 0:
+        if text.find("<!--", end + 3) < 0 or (start := _find_comment(text, end + 3)) < 0:
+            return False
+    return True
+
+
+# =============================================================================
+# Byte Scanner
+# =============================================================================
+
+# Files at least this large are scanned as bytes rather than decoded line by line
+SCAN_THRESHOLD = 4 * 1024 * 1024
+FENCE_NEEDLES = (b"```", b"~~~")
+COMMENT_NEEDLES = (b"<!--", b"-->")
+# Newlines are counted in slices of this size, so a long skipped run is never copied whole
+COUNT_CHUNK = 1024 * 1024
+# A "\r" not followed by "\n" ends a line in text mode but not for the scanner
+LONE_CR_PATTERN = re.compile(rb"\r(?!\n)")
+
 
+def scan_blocks(data: bytes, needles: Iterable[bytes]) -> Iterator[Block]:
+    """Tokenize only the lines of ``data`` (UTF-8, e.g. an mmap) that can matter to a check.
 
-def is_separator_row(line: str) -> bool:
-    """Check if a line is a table separator row."""
-    stripped = line.strip()
-    return bool(re.match(r"^\|[\s\-:|]+\|$", stripped))
+    Lines containing a fence marker, an HTML comment delimiter or one of
+    ``needles`` are found with byte searches and decoded; of each run of
+    lines between them only the first is decoded and the rest are skipped.
+    Each block yielded is the one tokenize_blocks would yield for that line,
+    since fence and comment state only change on those lines. Lines must
+    end in "\n" or "\r\n".
+    """
+    return _tokenize_numbered(_scan_lines(data, (*FENCE_NEEDLES, *COMMENT_NEEDLES, *needles)))
 
 
-def is_html_comment(line: str) -> bool:
-    """Check if a line contains an HTML comment."""
-    return "<!--" in line
+def scannable(data: bytes) -> bool:
+    """Whether scan_blocks splits ``data`` into the same lines as text mode (no lone "\r")."""
+    return data.find(b"\r") < 0 or not LONE_CR_PATTERN.search(data)
 
 
-def validate_file(path: Path) -> list[MarkdownIssue]:
-    """Validate a single markdown file for issues."""
-    issues: list[MarkdownIssue] = []
+def _scan_lines(data: bytes, needles: tuple[bytes, ...]) -> Iterator[tuple[int, str]]:
+    """``(line number, line)`` for every line scan_blocks tokenizes."""
+    size = len(data)
+    hits = [data.find(needle) for needle in needles]
+    pos = 0
+    lineno = 1
+    while pos < size:
+        for i, hit in enumerate(hits):
+            if 0 <= hit < pos:
+                hits[i] = data.find(needles[i], pos)
+        found = [hit for hit in hits if hit >= 0]
+        start = max(pos, data.rfind(b"\n", pos, min(found)) + 1) if found else size
 
-    with open(path, encoding="utf-8") as f:
-        lines = f.readlines()
+        if start > pos:
+            # Lines without a needle: only the first can change a check's state
+            end = data.find(b"\n", pos)
+            yield lineno, data[pos:size if end < 0 else end].decode("utf-8")
+            if not found:
+                return
+            for chunk in range(pos, start, COUNT_CHUNK):
+                lineno += data[chunk:min(start, chunk + COUNT_CHUNK)].count(b"\n")
 
-    # Check for unclosed code blocks
-    in_code_block = False
-    last_fence_line = 0
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = size
+        yield lineno, data[start:end].decode("utf-8")
+        lineno += 1
+        pos = end + 1
 
-    for i, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            if not in_code_block:
-                last_fence_line = i
-            in_code_block = not in_code_block
 
-    if in_code_block:
-        issues.append(
-            MarkdownIssue(
-                file=path,
-                line=last_fence_line,
-                issue_type=IssueType.UNCLOSED_CODE_BLOCK,
-                message=f"Code block opened at line {last_fence_line} is never closed",
+# =============================================================================
+# Checks
+# =============================================================================
+
+class MarkdownCheck:
+    """A check fed every block of a file, in order, whose kind is in ``kinds``.
+
+    ``needles`` lets large files be scanned as bytes (see scan_blocks): a
+    check that only acts on lines containing one of them, fence lines, and
+    the first line after such a line lists them; None needs every line.
+    """
+
+    kinds: frozenset[BlockKind] = frozenset(BlockKind)
+    needles: frozenset[bytes] | None = None
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.issues: list[MarkdownIssue] = []
+
+    def _issue(self, line: int, issue_type: IssueType, message: str) -> None:
+        self.issues.append(MarkdownIssue(file=self.path, line=line, issue_type=issue_type, message=message))
+
+    def feed(self, block: Block) -> None:
+        pass
+
+    def finish(self) -> list[MarkdownIssue]:
+        return self.issues
+
+
+class FenceCheck(MarkdownCheck):
+    """Code blocks that are opened and never closed."""
+
+    kinds = frozenset({BlockKind.FENCE_OPEN, BlockKind.FENCE_CLOSE})
+    needles = frozenset()
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.open_line = 0
+
+    def feed(self, block: Block) -> None:
+        kind, line, _, _ = block
+        self.open_line = line if kind is BlockKind.FENCE_OPEN else 0
+
+    def finish(self) -> list[MarkdownIssue]:
+        if self.open_line:
+            self._issue(
+                self.open_line,
+                IssueType.UNCLOSED_CODE_BLOCK,
+                f"Code block opened at line {self.open_line} is never closed",
             )
-        )
+        return self.issues
 
-    # Check tables
-    in_code_block = False
-    i = 0
 
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+class TableCheck(MarkdownCheck):
+    """Tables broken by HTML comments, missing separators or uneven column counts.
 
-        # Track code blocks
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
-            i += 1
-            continue
-
-        if in_code_block:
-            i += 1
-            continue
-
-        # Check for table
-        if is_table_row(line):
-            table_start = i
-            header_cols = count_columns(line)
-
-            # Check next line
-            i += 1
-            if i >= len(lines):
-                break
-
-            next_line = lines[i]
-
-            # Check for HTML comment between header and separator
-            if is_html_comment(next_line):
-                issues.append(
-                    MarkdownIssue(
-                        file=path,
-                        line=i + 1,
-                        issue_type=IssueType.HTML_IN_TABLE,
-                        message="HTML comment interrupts table structure",
-                    )
-                )
-                i += 1
-                continue
-
-            # Check for separator row
-            if not is_separator_row(next_line):
-                issues.append(
-                    MarkdownIssue(
-                        file=path,
-                        line=i + 1,
-                        issue_type=IssueType.MISSING_SEPARATOR,
-                        message="Table header not followed by separator row",
-                    )
-                )
-                i += 1
-                continue
-
-            # Check data rows
-            i += 1
-            while i < len(lines):
-                data_line = lines[i]
-                data_stripped = data_line.strip()
-
-                # Check for HTML comment in table
-                if is_html_comment(data_line):
-                    issues.append(
-                        MarkdownIssue(
-                            file=path,
-                            line=i + 1,
-                            issue_type=IssueType.HTML_IN_TABLE,
-                            message="HTML comment interrupts table structure",
-                        )
-                    )
-
-                # End of table
-                if data_stripped == "" or not is_table_row(data_line):
-                    break
-
-                # Check column count
-                cols = count_columns(data_line)
-                if cols != header_cols:
-                    issues.append(
-                        MarkdownIssue(
-                            file=path,
-                            line=i + 1,
-                            issue_type=IssueType.COLUMN_MISMATCH,
-                            message=f"Expected {header_cols} columns, got {cols}",
-                        )
-                    )
-
-                i += 1
-        else:
-            i += 1
+    The line after a header row must be its separator; a line that is not
+    is reported and skipped. Data rows continue until the first line that
+    is not a table row. A line on which an HTML comment opens is reported
+    inside a table and otherwise treated by its shape; the lines inside a
+    multi-line comment are ignored.
+    """
+
+    kinds = frozenset(BlockKind) - {BlockKind.CODE}
+    needles = frozenset({b"|"})
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.header_cols = 0
+        self.after_header = False
+        self.in_body = False
+
+    def feed(self, block: Block) -> None:
+        kind, line, text, info = block
+        comment = kind is BlockKind.HTML_COMMENT
+        if comment:
+            if not info:
+                return
+            row = text[0] == "|" and text[-1] == "|" and len(text) > 2
+            kind = BlockKind.TABLE_ROW if row else BlockKind.TEXT
+
+        if self.after_header:
+            self.after_header = False
+            if comment:
+                self._issue(line, IssueType.HTML_IN_TABLE, "HTML comment interrupts table structure")
+            elif kind is not BlockKind.TABLE_ROW or not SEPARATOR_PATTERN.fullmatch(text):
+                self._issue(line, IssueType.MISSING_SEPARATOR, "Table header not followed by separator row")
+            else:
+                self.in_body = True
+            return
+
+        if self.in_body:
+            if comment:
+                self._issue(line, IssueType.HTML_IN_TABLE, "HTML comment interrupts table structure")
+            if kind is BlockKind.TABLE_ROW:
+                cols = count_columns(text)
+                if cols != self.header_cols:
+                    self._issue(line, IssueType.COLUMN_MISMATCH, f"Expected {self.header_cols} columns, got {cols}")
+                return
+            self.in_body = False
+
+        if kind is BlockKind.TABLE_ROW:
+            self.header_cols = count_columns(text)
+            self.after_header = True
+
+
+# Every check sees the blocks it subscribes to in order; issues are listed check by check
+MARKDOWN_CHECKS = (FenceCheck, TableCheck)
+
+# Lines large files are scanned for, or None when a check needs every line
+SCAN_NEEDLES = (
+    None if any(check.needles is None for check in MARKDOWN_CHECKS)
+    else frozenset().union(*(check.needles for check in MARKDOWN_CHECKS))
+)
+
+
+def validate_file(
+    path: Path, index: TreeIndex | None = None, links: "LinkIndex | None" = None
+) -> list[MarkdownIssue]:
+    """Validate a single markdown file for issues (read through ``index`` if given).
+
+    With ``links``, LinkCheck runs in the same pass as MARKDOWN_CHECKS.
+    """
+    with PROFILER.measure("file", str(path)):
+        if links is None:
+            return check_blocks(path, iter_blocks(path, index, SCAN_NEEDLES))
+        checks = [check(path) for check in MARKDOWN_CHECKS] + [LinkCheck(path, links)]
+        needles = None if SCAN_NEEDLES is None else SCAN_NEEDLES | LinkCheck.needles
+        return check_blocks(path, iter_blocks(path, index, needles), checks)
+
+
+def iter_blocks(
+    path: Path, index: TreeIndex | None = None, needles: frozenset[bytes] | None = None
+) -> Iterator[Block]:
+    """Blocks of the file at ``path`` (read through ``index`` if given).
+
+    With ``needles``, files of at least SCAN_THRESHOLD bytes are
+    memory-mapped and scanned with scan_blocks, so only candidate lines are
+    decoded; other files are streamed line by line through tokenize_blocks.
+    A large file is mapped from disk even with ``index``, which then only
+    supplies its size (and an overlay, if any), so its contents are never
+    held in memory.
+    """
+    if index is not None:
+        entry = index.stat(path)
+        if needles is None or entry is None or entry.size < SCAN_THRESHOLD:
+            yield from tokenize_blocks(io.StringIO(index.read_text(path)))
+            return
+        overlay = index.overlay_bytes(path)
+        if overlay is not None:
+            if scannable(overlay):
+                yield from scan_blocks(overlay, needles)
+            else:
+                yield from tokenize_blocks(io.StringIO(index.read_text(path)))
+            return
+
+    with open(path, "rb") as f:
+        if needles is not None and os.fstat(f.fileno()).st_size >= SCAN_THRESHOLD:
+            import mmap
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if scannable(data):
+                    yield from scan_blocks(data, needles)
+                    return
+        yield from tokenize_blocks(io.TextIOWrapper(f, encoding="utf-8"))
+
+
+def check_lines(path: Path, lines: Iterable[str]) -> list[MarkdownIssue]:
+    """Run every check over one pass of ``tokenize_blocks(lines)``."""
+    return check_blocks(path, tokenize_blocks(lines))
+
+
+def check_blocks(
+    path: Path, blocks: Iterable[Block], checks: list[MarkdownCheck] | None = None
+) -> list[MarkdownIssue]:
+    """Feed each of ``blocks`` to the checks subscribed to its kind and collect their issues.
+
+    ``checks`` defaults to one instance of each of MARKDOWN_CHECKS.
+    """
+    with PROFILER.measure("phase", "check"):
+        if checks is None:
+            checks = [check(path) for check in MARKDOWN_CHECKS]
+        handlers = {kind: [c.feed for c in checks if kind in c.kinds] for kind in BlockKind}
+        for block in blocks:
+            for feed in handlers[block[0]]:
+                feed(block)
+        return [issue for check in checks for issue in check.finish()]
+
+
+# =============================================================================
+# Link Check
+# =============================================================================
+
+# Inline links and images: [text](target "title"), with an optional <target>
+LINK_PATTERN = re.compile(r"!?\[(?:[^\]\\]|\\.)*\]\(\s*(<[^>]*>|[^)\s]*)(?:\s+[\"'(][^)]*)?\)")
+REFERENCE_DEFINITION_PATTERN = re.compile(r"\[[^\]]+\]:\s*(<[^>]*>|\S+)")
+WIKILINK_PATTERN = re.compile(r"!?\[\[([^\[\]|#]*)(?:#([^\[\]|]*))?(?:\|[^\[\]]*)?\]\]")
+CODE_SPAN_PATTERN = re.compile(r"(`+).+?\1")
+# Targets with a scheme (https:, mailto:) or an absolute path (site routes) are not checked
+EXTERNAL_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*:|/")
+REFERENCE_GUIDE_HEADING = "Reference Guide"
+REFERENCE_POINTER_PATTERN = re.compile(r"`(references/[^`]+\.md)`")
+SLUG_DROP_PATTERN = re.compile(r"[^\w\- ]")
+HEADING_NEEDLES = frozenset({b"#"})
+
+
+def heading_anchors(titles: Iterable[str]) -> frozenset[str]:
+    """GitHub-style anchors for headings titled ``titles``, in document order.
+
+    Link markup is reduced to its text, the title is lower-cased, anything
+    but letters, digits, "_", "-" and spaces is dropped and spaces become
+    hyphens; repeated anchors get "-1", "-2", ... appended.
+    """
+    seen: dict[str, int] = {}
+    anchors = set()
+    for title in titles:
+        slug = SLUG_DROP_PATTERN.sub("", LINK_PATTERN.sub(_link_text, title).lower()).replace(" ", "-")
+        count = seen.get(slug, 0)
+        seen[slug] = count + 1
+        anchors.add(f"{slug}-{count}" if count else slug)
+    return frozenset(anchors)
+
+
+def _link_text(match: re.Match) -> str:
+    text = match[0]
+    return text[text.index("[") + 1:text.rindex("](")]
+
+
+class LinkIndex:
+    """Files and heading anchors under ``root`` that links are resolved against.
+
+    Existence comes from the TreeIndex walk, so no target is stat'ed on its
+    own (targets outside the index fall through to the filesystem). Wikilink
+    names are built from the same walk on first use, and a file's anchors
+    when a link first needs them; LinkCheck records the anchors of each file
+    it checks, so a checked file is never read again for its headings.
+    """
+
+    def __init__(self, root: Path, index: TreeIndex):
+        self.root = root
+        self.index = index
+        self._anchors: dict[str, frozenset[str]] = {}
+        self._notes: dict[str, Path] | None = None
+
+    def exists(self, path: Path) -> bool:
+        return self.index.exists(path)
+
+    def anchors(self, path: Path) -> frozenset[str]:
+        """Anchors of the headings in markdown file ``path``."""
+        key = os.path.abspath(path)
+        anchors = self._anchors.get(key)
+        if anchors is None:
+            blocks = iter_blocks(path, self.index, HEADING_NEEDLES)
+            anchors = heading_anchors(info for kind, _, _, info in blocks if kind is BlockKind.HEADING)
+            self._anchors[key] = anchors
+        return anchors
+
+    def add_anchors(self, path: Path, anchors: frozenset[str]) -> None:
+        self._anchors[os.path.abspath(path)] = anchors
+
+    def note(self, name: str) -> Path | None:
+        """The file a ``[[name]]`` wikilink points to, or None.
+
+        Like Obsidian, ``name`` matches a file's name or trailing path under
+        ``root``, case-insensitively and with or without ``.md``; when
+        several files match, the first in sorted order wins.
+        """
+        if self._notes is None:
+            self._notes = {}
+            for path in sorted(self.index.rglob(self.root, "*")):
+                if self.index.is_dir(path):
+                    continue
+                parts = path.relative_to(self.root).as_posix().lower().split("/")
+                for i in range(len(parts)):
+                    suffix = "/".join(parts[i:])
+                    self._notes.setdefault(suffix, path)
+                    if suffix.endswith(".md"):
+                        self._notes.setdefault(suffix[:-3], path)
+        return self._notes.get(name.strip().lower())
+
+
+class LinkCheck(MarkdownCheck):
+    """Links whose target file or heading anchor does not exist.
+
+    Covers inline links and images, reference definitions, ``[[wikilinks]]``
+    (outside code spans) and the ``references/*.md`` pointers in a SKILL.md
+    "Reference Guide" table; links inside HTML comments are not rendered and
+    are skipped. Targets are resolved once the whole file has
+    been fed, so links to the file's own headings work from anywhere in it.
+    Links into other files depend on those files, so this check is not one
+    of MARKDOWN_CHECKS: it needs a LinkIndex, runs only in the main process
+    and its issues are never cached.
+    """
+
+    kinds = frozenset({BlockKind.HEADING, BlockKind.TABLE_ROW, BlockKind.TEXT})
+    needles = frozenset({b"[", b"#", b"|"})
+
+    def __init__(self, path: Path, links: LinkIndex):
+        super().__init__(path)
+        self.links = links
+        self.is_skill = path.name == "SKILL.md"
+        self.in_reference_guide = False
+        self.titles: list[str] = []
+        self.targets: list[tuple[int, str]] = []  # (line, relative link target)
+        self.wikilinks: list[tuple[int, str, str]] = []  # (line, name, heading)
+
+    def feed(self, block: Block) -> None:
+        kind, line, text, info = block
+        if kind is BlockKind.HEADING:
+            self.titles.append(info)
+            self.in_reference_guide = self.is_skill and info == REFERENCE_GUIDE_HEADING
+        elif kind is BlockKind.TABLE_ROW and self.in_reference_guide:
+            self.targets.extend((line, target) for target in REFERENCE_POINTER_PATTERN.findall(text))
+
+        if "[" not in text:
+            return
+        if "`" in text:
+            text = CODE_SPAN_PATTERN.sub("", text)
+        for match in LINK_PATTERN.finditer(text):
+            self.targets.append((line, match[1]))
+        if match := REFERENCE_DEFINITION_PATTERN.match(text):
+            self.targets.append((line, match[1]))
+        for match in WIKILINK_PATTERN.finditer(text):
+            self.wikilinks.append((line, match[1], match[2] or ""))
+
+    def finish(self) -> list[MarkdownIssue]:
+        self.links.add_anchors(self.path, heading_anchors(self.titles))
+        for line, target in self.targets:
+            self._check_target(line, target)
+        for line, name, heading in self.wikilinks:
+            self._check_wikilink(line, name, heading)
+        self.issues.sort(key=lambda issue: issue.line)
+        return self.issues
+
+    def _check_target(self, line: int, target: str) -> None:
+        from urllib.parse import unquote
+
+        target = target.removeprefix("<").removesuffix(">")
+        if not target or EXTERNAL_PATTERN.match(target):
+            return
+        path, _, anchor = target.partition("#")
+        path = unquote(path.partition("?")[0])
+        resolved = Path(os.path.normpath(self.path.parent / path)) if path else self.path
+        if path and not self.links.exists(resolved):
+            self._issue(line, IssueType.BROKEN_LINK, f"Link target '{target}' does not exist ({resolved})")
+        elif anchor and resolved.suffix == ".md" and self.links.index.is_file(resolved):
+            if unquote(anchor).lower() not in self.links.anchors(resolved):
+                self._issue(line, IssueType.BROKEN_ANCHOR, f"No heading for anchor '#{anchor}' in {resolved}")
+
+    def _check_wikilink(self, line: int, name: str, heading: str) -> None:
+        resolved = self.links.note(name) if name.strip() else self.path
+        if resolved is None:
+            self._issue(line, IssueType.BROKEN_LINK, f"Wikilink [[{name}]] matches no file under {self.links.root}")
+        elif heading and resolved.suffix == ".md":
+            if heading_anchors([heading]) - self.links.anchors(resolved):
+                self._issue(line, IssueType.BROKEN_ANCHOR, f"No heading '{heading}' in {resolved}")
 
-    return issues
 
+def check_links(path: Path, links: LinkIndex) -> list[MarkdownIssue]:
+    """Run LinkCheck alone over ``path``, for files whose other checks ran elsewhere."""
+    with PROFILER.measure("phase", "links"):
+        return check_blocks(path, iter_blocks(path, links.index, LinkCheck.needles), [LinkCheck(path, links)])
 
-def validate_directory(root: Path) -> list[MarkdownIssue]:
-    """Validate all markdown files in a directory."""
-    all_issues: list[MarkdownIssue] = []
 
-    for md_file in sorted(root.rglob("*.md")):
-        issues = validate_file(md_file)
-        all_issues.extend(issues)
+# =============================================================================
+# Result Cache
+# =============================================================================
 
-    return all_issues
+class MarkdownCache:
+    """On-disk store of per-file issue lists, keyed by a content hash.
+
+    Every entry lives in one JSON file, ``<cache_dir>/markdown.json``, so a
+    run loads the cache with a single read; pointing ``--cache-dir`` at
+    validate-skills.py's cache directory keeps both scripts' results in one
+    place. Entries are stored under the file's absolute path, so runs from
+    any working directory or root share them. An entry is reused only when
+    the SHA-256 of the file still matches, and the whole store is discarded
+    when this script or common.py changes, so a checker change never serves
+    stale issues.
+    """
+
+    FILE_NAME = "markdown.json"
+
+    def __init__(self, cache_dir: Path):
+        self.path = cache_dir / self.FILE_NAME
+        self.version = self.fingerprint()
+        self.entries = self._load()
+        self.updates: dict[str, dict] = {}
+
+    @staticmethod
+    def fingerprint() -> str:
+        """Hash of the checker itself."""
+        import hashlib
+
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(Path(__file__).with_name("common.py").read_bytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def file_key(path: Path, index: TreeIndex | None = None) -> str:
+        """SHA-256 of the file's bytes (read through ``index`` if given).
+
+        Files of at least SCAN_THRESHOLD bytes are hashed from disk in
+        chunks, like iter_blocks maps them, rather than read into memory.
+        """
+        import hashlib
+
+        if index is not None:
+            data = index.overlay_bytes(path)
+            entry = index.stat(path)
+            if data is None and entry is not None and entry.size < SCAN_THRESHOLD:
+                data = index.read_bytes(path)
+            if data is not None:
+                return hashlib.sha256(data).hexdigest()
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def _load(self) -> dict:
+        """Entries on disk for this checker version; empty if missing, unreadable or stale."""
+        import json
+
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def get(self, path: Path, key: str) -> list[MarkdownIssue] | None:
+        """Return cached issues for ``path`` if stored under ``key``."""
+        entry = self.entries.get(os.path.abspath(path))
+        try:
+            if entry is None or entry["key"] != key:
+                return None
+            return [MarkdownIssue(path, line, IssueType(t), message) for line, t, message in entry["issues"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, path: Path, key: str, issues: list[MarkdownIssue]) -> None:
+        """Record issues for ``path``; written by ``save``."""
+        self.updates[os.path.abspath(path)] = {
+            "key": key,
+            "issues": [[i.line, str(i.issue_type), i.message] for i in issues],
+        }
+
+    def save(self, index: TreeIndex | None = None) -> None:
+        """Write recorded entries over the current file; failures to write are ignored.
+
+        The file is re-read first so entries written by another run since
+        this one loaded (a concurrent shard, say) are kept. With ``index``,
+        entries for files inside its snapshot that no longer exist are
+        dropped; entries outside it belong to other runs and are kept.
+        """
+        if not self.updates:
+            return
+        import json
+
+        entries = {**self._load(), **self.updates}
+        if index is not None:
+            entries = {
+                path: entry for path, entry in entries.items()
+                if not index.covers(path) or index.is_file(path)
+            }
+        try:
+            write_atomic(self.path, json.dumps({"version": self.version, "files": entries}))
+        except OSError:
+            pass
+        self.updates = {}
+
+
+# =============================================================================
+# Running
+# =============================================================================
+
+def _check_files(
+    files: list[Path], index: TreeIndex | None, jobs: int, links: LinkIndex | None = None
+) -> Iterator[list[MarkdownIssue]]:
+    """Issues of each of ``files``, in order, from a process pool when ``jobs`` > 1.
+
+    LinkCheck needs the LinkIndex, so with a pool it runs here as each
+    result arrives; serially it shares the file's single pass.
+    """
+    if jobs > 1 and len(files) > 1 and not PROFILER.enabled:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Workers read from disk; small chunks keep the first results coming quickly
+        chunksize = max(1, len(files) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for md_file, issues in zip(files, executor.map(validate_file, files, chunksize=chunksize)):
+                yield issues if links is None else issues + check_links(md_file, links)
+    else:
+        for md_file in files:
+            yield validate_file(md_file, index, links)
+
+
+def iter_files(
+    files: list[Path],
+    index: TreeIndex | None = None,
+    jobs: int = 1,
+    cache: MarkdownCache | None = None,
+    links: LinkIndex | None = None,
+) -> Iterator[tuple[Path, list[MarkdownIssue]]]:
+    """Validate ``files``, yielding ``(file, issues)`` in the order given.
+
+    With ``jobs`` > 1, files are checked in a process pool and each result
+    is yielded as soon as it and every file before it are done, so output
+    streams in the same order as a serial run. Profiling stays serial.
+    With ``cache``, files whose contents are unchanged since they were last
+    checked are not re-checked, and the cache is saved once every file has
+    been yielded. With ``links``, each file's LinkCheck issues follow its
+    other issues; they are checked in this process and never cached.
+    """
+    if cache is None:
+        yield from zip(files, _check_files(files, index, jobs, links))
+        return
+    for md_file, issues in _check_cached(files, index, jobs, cache):
+        yield md_file, issues if links is None else issues + check_links(md_file, links)
+
+
+def _check_cached(
+    files: list[Path], index: TreeIndex | None, jobs: int, cache: MarkdownCache
+) -> Iterator[tuple[Path, list[MarkdownIssue]]]:
+    """iter_files with ``cache``: only files whose key missed are checked."""
+    keys: dict[Path, str] = {}
+    cached: dict[Path, list[MarkdownIssue]] = {}
+    with PROFILER.measure("phase", "cache"):
+        for md_file in files:
+            keys[md_file] = cache.file_key(md_file, index)
+            hit = cache.get(md_file, keys[md_file])
+            if hit is not None:
+                cached[md_file] = hit
+
+    checked = _check_files([f for f in files if f not in cached], index, jobs)
+    for md_file in files:
+        issues = cached.get(md_file)
+        if issues is None:
+            issues = next(checked)
+            cache.put(md_file, keys[md_file], issues)
+        yield md_file, issues
+    cache.save(index)
+
+
+def iter_directory(
+    root: Path,
+    only: set[Path] | None = None,
+    index: TreeIndex | None = None,
+    shard: tuple[int, int] | None = None,
+    jobs: int = 1,
+    cache: MarkdownCache | None = None,
+    links: LinkIndex | None = None,
+) -> Iterator[tuple[Path, list[MarkdownIssue]]]:
+    """Validate the markdown files in a directory, yielding ``(file, issues)`` in sorted order.
+
+    Only files in ``only`` (if given) and, with ``shard``, whose
+    shard_key hashes into that slice are validated (see ``iter_files``
+    for ``jobs``, ``cache`` and ``links``).
+    """
+    index = index or TreeIndex([root])
+    files = [
+        md_file for md_file in sorted(index.rglob(root, "*.md"))
+        if (only is None or md_file.resolve() in only)
+        and not (shard and not in_shard(shard_key(md_file), shard))
+    ]
+    yield from iter_files(files, index, jobs, cache, links)
+
+
+def shard_key(path: Path) -> str:
+    """The key ``path`` is sharded by: its path relative to the working directory.
+
+    A file gets the same key whether it is checked alone or as part of
+    any directory, so N ``--shard`` jobs are disjoint and complete however
+    each is invoked.
+    """
+    return Path(os.path.relpath(path)).as_posix()
+
+
+def validate_directory(
+    root: Path,
+    only: set[Path] | None = None,
+    index: TreeIndex | None = None,
+    shard: tuple[int, int] | None = None,
+    jobs: int = 1,
+    cache: MarkdownCache | None = None,
+    links: LinkIndex | None = None,
+) -> list[MarkdownIssue]:
+    """Validate all markdown files in a directory (see ``iter_directory``)."""
+    results = iter_directory(root, only, index, shard, jobs, cache, links)
+    return [issue for _, issues in results for issue in issues]
+
+
+def format_text(issues: list[MarkdownIssue]) -> str:
+    """Human-readable report, grouped by issue type."""
+    if not issues:
+        return "No markdown issues found."
+
+    by_type: dict[IssueType, list[MarkdownIssue]] = {}
+    for issue in issues:
+        by_type.setdefault(issue.issue_type, []).append(issue)
+
+    lines = []
+    for issue_type, type_issues in sorted(by_type.items()):
+        lines.append(f"\n{issue_type.upper()} ({len(type_issues)} issues):")
+        lines.extend(f"  {issue}" for issue in type_issues)
+    lines.append(f"\nTotal: {len(issues)} issues found")
+    return "\n".join(lines)
+
+
+def format_summary(counts: dict[IssueType, int]) -> str:
+    """Issue counts per type, printed after the streamed text output."""
+    total = sum(counts.values())
+    if not total:
+        return "No markdown issues found."
+    lines = [""]
+    lines.extend(f"{issue_type.upper()}: {count} issues" for issue_type, count in sorted(counts.items()))
+    lines.append(f"\nTotal: {total} issues found")
+    return "\n".join(lines)
+
+
+def watch_directory(root: Path, interval: float) -> None:
+    """Validate ``root`` once, then re-validate only changed files and print issue diffs."""
+    files = sorted(TreeIndex([root]).rglob(root, "*.md")) if root.is_dir() else [root]
+    state = {path.resolve(): validate_file(path) for path in files}
+    for issues in state.values():
+        for issue in issues:
+            print(f"  {issue}")
+    total = sum(len(issues) for issues in state.values())
+    print(f"\n{total} issues in {len(state)} files. Watching every {interval}s (Ctrl+C to stop)...", flush=True)
+
+    try:
+        for changed, _ in watch_changes([root], interval):
+            started = time.perf_counter()
+            diff: list[tuple[str, MarkdownIssue]] = []
+            for path in sorted(changed):
+                if path.suffix != ".md":
+                    continue
+                before = set(state.pop(path.resolve(), []))
+                after = set(validate_file(path)) if path.exists() else set()
+                if path.exists():
+                    state[path.resolve()] = sorted(after, key=lambda i: i.line)
+                diff.extend(("+", i) for i in sorted(after - before, key=lambda i: i.line))
+                diff.extend(("-", i) for i in sorted(before - after, key=lambda i: i.line))
+            elapsed = time.perf_counter() - started
+
+            print(f"\n[{time.strftime('%H:%M:%S')}] {len(changed)} file(s) changed, re-checked in {elapsed:.3f}s")
+            for sign, issue in diff:
+                print(f"  {sign} {issue}")
+            if not diff:
+                print("  No change in issues")
+            total = sum(len(issues) for issues in state.values())
+            print(f"  Now {total} issues", flush=True)
+    except KeyboardInterrupt:
+        pass
 
 
 def main() -> int:
@@ -217,48 +921,152 @@ def main() -> int:
         default="text",
         help="Output format (default: text)",
     )
+    changes = parser.add_mutually_exclusive_group()
+    changes.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="Validate only markdown files changed since git REF",
+    )
+    changes.add_argument(
+        "--staged",
+        action="store_true",
+        help="Validate only markdown files staged in the git index",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-validate changed files, printing new and resolved issues",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="Polling interval for --watch (default: 0.5)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate files in N worker processes (0 = one per CPU, default: 1); output order is unchanged",
+    )
+
+    parser.add_argument(
+        "--links",
+        nargs="?",
+        const=Path("."),
+        type=Path,
+        metavar="ROOT",
+        help="Also check that relative links, images, [[wikilinks]] and SKILL.md Reference Guide pointers "
+        "resolve to existing files and headings, indexing ROOT once (default: .)",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        metavar="DIR",
+        help=f"Reuse results for files unchanged since the last run, cached in DIR/{MarkdownCache.FILE_NAME} "
+        f"({CACHE_DIR} shares validate-skills.py's cache directory)",
+    )
+
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Validate only slice I of N of the files (by a stable hash of their path relative to the working directory)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+        help="Print time, calls and peak memory per phase and file to stderr",
+    )
 
     args = parser.parse_args()
 
+    if args.profile:
+        PROFILER.enable()
+
     if not args.path.exists():
         print(f"Error: Path does not exist: {args.path}", file=sys.stderr)
         return 1
 
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if args.watch:
+            print("Error: --shard cannot be combined with --watch", file=sys.stderr)
+            return 1
+
+    for flag, value in (("--cache-dir", args.cache_dir), ("--links", args.links)):
+        if args.watch and value:
+            print(f"Error: {flag} cannot be combined with --watch", file=sys.stderr)
+            return 1
+
+    if args.watch:
+        watch_directory(args.path, args.interval)
+        return 0
+
+    cache = MarkdownCache(args.cache_dir) if args.cache_dir else None
+
+    index = links = None
+    if args.links:
+        if not args.links.is_dir():
+            print(f"Error: --links root is not a directory: {args.links}", file=sys.stderr)
+            return 1
+        index = TreeIndex([args.path, args.links])
+        links = LinkIndex(args.links, index)
+
+    only = None
+    if args.changed_since or args.staged:
+        try:
+            changed = git_changed_files(args.changed_since, staged=args.staged)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        only = {p.resolve() for p in changed if p.suffix == ".md"}
+
     if args.path.is_file():
-        issues = validate_file(args.path)
+        skipped = (only is not None and args.path.resolve() not in only) or (
+            shard and not in_shard(shard_key(args.path), shard)
+        )
+        results = [] if skipped else iter_files([args.path], index, cache=cache, links=links)
     else:
-        issues = validate_directory(args.path)
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        results = iter_directory(args.path, only, index, shard, jobs, cache, links)
 
+    # Text streams each file's issues as soon as it is checked; JSON is one list
+    counts: dict[IssueType, int] = {}
     if args.format == "json":
         import json
 
-        output = [
-            {
-                "file": str(i.file),
-                "line": i.line,
-                "type": str(i.issue_type),
-                "message": i.message,
-            }
-            for i in issues
-        ]
-        print(json.dumps(output, indent=2))
-    else:
-        # Group by issue type
-        by_type: dict[IssueType, list[MarkdownIssue]] = {}
+        issues = [issue for _, file_issues in results for issue in file_issues]
         for issue in issues:
-            by_type.setdefault(issue.issue_type, []).append(issue)
-
-        if issues:
-            for issue_type, type_issues in sorted(by_type.items()):
-                print(f"\n{issue_type.upper()} ({len(type_issues)} issues):")
-                for issue in type_issues:
-                    print(f"  {issue}")
+            counts[issue.issue_type] = counts.get(issue.issue_type, 0) + 1
+        with PROFILER.measure("phase", "format"):
+            output = json.dumps([i.to_dict() for i in issues], indent=2)
+    else:
+        for _, file_issues in results:
+            for issue in file_issues:
+                counts[issue.issue_type] = counts.get(issue.issue_type, 0) + 1
+                print(f"  {issue}")
+            if file_issues:
+                sys.stdout.flush()
+        output = format_summary(counts)
+    print(output)
 
-            print(f"\nTotal: {len(issues)} issues found")
-        else:
-            print("No markdown issues found.")
+    if PROFILER.enabled:
+        print(PROFILER.format(args.profile), file=sys.stderr)
 
-    return 1 if issues else 0
+    return 1 if counts else 0
 
 
 if __name__ == "__main__":
@@ -12,119 +12,448 @@ Usage:
     python scripts/validate-skills.py --check workflows   # Workflow definition checks only
     python scripts/validate-skills.py --skill content-strategist  # Single skill
     python scripts/validate-skills.py --format json  # JSON for CI
+    python scripts/validate-skills.py --format ndjson  # One issue per line, streamed
+    python scripts/validate-skills.py --summary-only   # Counts per check plus 20 sample issues
+    python scripts/validate-skills.py --jobs 0       # One worker process per CPU
+    python scripts/validate-skills.py --no-cache     # Ignore .validate-cache/
+    python scripts/validate-skills.py --changed-since origin/main  # Only what git says changed
+    python scripts/validate-skills.py --staged       # Only what is staged (pre-commit)
+    python scripts/validate-skills.py --watch        # Re-validate on every save
+    python scripts/validate-skills.py --serve        # JSON-RPC over stdio for editors and agents
+    python scripts/validate-skills.py --profile      # Where does the time go?
+    python scripts/validate-skills.py --fail-fast    # Stop at the first error (CI gate)
+    python scripts/validate-skills.py --shard 2/4 --format json > shard-2.json  # One of 4 CI jobs
+    python scripts/validate-skills.py --merge shard-*.json  # Combine shards, run global checks once
 
 Exit codes:
     0 = Success (warnings allowed)
     1 = Errors found
 """
 
+# Startup matters: editor integrations run this script on every save. Modules
+# only some runs need (PyYAML, json, hashlib, concurrent.futures, datetime)
+# are imported where they are used; abc and enum are already loaded by the
+# interpreter and re. benchmarks/startup.py enforces this.
 import argparse
-import json
+import os
 import re
 import sys
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from enum import Enum, IntEnum
+from enum import Enum
+from functools import cache
 from pathlib import Path
 
-# Try to import PyYAML, fall back to simple parser if not available
-try:
-    import yaml
-    HAS_PYYAML = True
-except ImportError:
-    HAS_PYYAML = False
+from common import (
+    CACHE_DIR, PROFILER, TreeIndex, changed_files, git_changed_files, in_shard, parse_shard,
+    watch_changes, write_atomic,
+)
 
 
-def simple_yaml_parse(yaml_str: str) -> dict:
-    """
-    Simple YAML frontmatter parser for skill files.
-    Handles the basic structure used in this project:
-    - Simple key: value pairs
-    - Lists with - prefix
-    - One level of nested mappings (e.g., metadata: with indented key: value)
-    """
-    result = {}
-    current_key = None
-    current_collection = None  # list or dict
-    collection_type = None  # "list" or "dict" or None (undetermined)
-
-    def _save_current():
-        nonlocal current_key, current_collection, collection_type
-        if current_key and current_collection is not None:
-            result[current_key] = current_collection
-        current_key = None
-        current_collection = None
-        collection_type = None
-
-    for line in yaml_str.strip().split("\n"):
-        # Skip empty lines
-        if not line.strip():
-            continue
+@cache
+def load_pyyaml():
+    """Import PyYAML on first use; None if it is not installed (use the simple parser)."""
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
 
-        # Check for list item (indented with -)
-        if line.startswith("  - ") or line.startswith("    - "):
-            if current_key is not None:
-                if collection_type is None:
-                    # First child is a list item — this is a list
-                    current_collection = []
-                    collection_type = "list"
-                if collection_type == "list":
-                    item = line.strip().lstrip("- ").strip()
-                    current_collection.append(item)
-            continue
 
-        # Check for nested key: value (indented, part of a mapping)
-        if line.startswith("  ") and ":" in line and not line.startswith("  - "):
-            if current_key is not None:
-                if collection_type is None:
-                    # First child is a key: value — this is a dict
-                    current_collection = {}
-                    collection_type = "dict"
-                if collection_type == "dict":
-                    nested_parts = line.strip().split(":", 1)
-                    nested_key = nested_parts[0].strip()
-                    nested_value = nested_parts[1].strip() if len(nested_parts) > 1 else ""
-                    # Strip surrounding quotes from values
-                    if nested_value.startswith('"') and nested_value.endswith('"'):
-                        nested_value = nested_value[1:-1]
-                    current_collection[nested_key] = nested_value
+# =============================================================================
+# Fallback YAML Parser
+# =============================================================================
+
+# One match per line: indentation, optional "- " entry marker, optional "key:", rest
+YAML_LINE_PATTERN = re.compile(r"""
+    ^(?P<indent>\ *)
+    (?P<dash>-(?:\ +|$))?
+    (?:(?P<key>"(?:[^"\\\n]|\\.)*"|'(?:[^'\n]|'')*'|[^\s#'"\[\]{},&*!|>%@`-][^#\n]*?|-[^\s#][^#\n]*?)
+       \ *:(?:\ +|$))?
+    (?P<rest>.*)
+""", re.VERBOSE | re.MULTILINE)
+YAML_BLOCK_HEADER_PATTERN = re.compile(r"([|>])([+-]?)([1-9]?)(?: +#.*| *)$")
+YAML_DOUBLE_QUOTED_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"', re.DOTALL)
+YAML_SINGLE_QUOTED_PATTERN = re.compile(r"'((?:[^']|'')*)'", re.DOTALL)
+YAML_ESCAPE_PATTERN = re.compile(r"\\(x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)")
+YAML_ESCAPES = {
+    "0": "\0", "a": "\a", "b": "\b", "t": "\t", "\t": "\t", "n": "\n", "v": "\v",
+    "f": "\f", "r": "\r", "e": "\x1b", " ": " ", '"': '"', "/": "/", "\\": "\\",
+    "N": "\x85", "_": "\xa0", "L": "\u2028", "P": "\u2029",
+}
+
+# Plain scalar resolution, following PyYAML's YAML 1.1 resolver (dates, no timestamps)
+YAML_NULL_VALUES = {"", "~", "null", "Null", "NULL"}
+YAML_BOOL_VALUES = {
+    **dict.fromkeys(["yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON"], True),
+    **dict.fromkeys(["no", "No", "NO", "false", "False", "FALSE", "off", "Off", "OFF"], False),
+}
+YAML_SPECIAL_FLOATS = {
+    **{f"{sign}.{inf}": float(f"{sign or '+'}inf") for sign in ("", "+", "-") for inf in ("inf", "Inf", "INF")},
+    **{f".{nan}": float("nan") for nan in ("nan", "NaN", "NAN")},
+}
+YAML_NUMBER_PATTERN = re.compile(r"""
+    (?P<int>[-+]?(?:0|[1-9][0-9_]*))
+  | (?P<base>[-+]?0(?:b[0-1_]+|x[0-9a-fA-F_]+|[0-7_]+))
+  | (?P<float>[-+]?[0-9][0-9_]*\.[0-9_]*(?:[eE][-+][0-9]+)?|\.[0-9][0-9_]*(?:[eE][-+][0-9]+)?)
+  | (?P<sexagesimal>[-+]?[1-9][0-9_]*(?::[0-5]?[0-9])+(?:\.[0-9_]*)?)
+  | (?P<date>[0-9]{4}-[0-9]{2}-[0-9]{2})
+""", re.VERBOSE)
+# Only plain scalars starting with one of these can resolve to something other than str
+YAML_IMPLICIT_START = set("~nNyYtTfFoO0123456789+-.")
+
+
+def resolve_plain_scalar(value: str):
+    """Convert an unquoted scalar to None, bool, int, float, date or str."""
+    if value in YAML_NULL_VALUES:
+        return None
+    if value[0] not in YAML_IMPLICIT_START:
+        return value
+    if value in YAML_BOOL_VALUES:
+        return YAML_BOOL_VALUES[value]
+    if value in YAML_SPECIAL_FLOATS:
+        return YAML_SPECIAL_FLOATS[value]
+    match = YAML_NUMBER_PATTERN.fullmatch(value)
+    if match is None:
+        return value
+    kind = match.lastgroup
+    digits = value.replace("_", "")
+    if kind == "int":
+        return int(digits)
+    if kind == "base":
+        sign = -1 if digits[0] == "-" else 1
+        digits = digits.lstrip("+-")
+        prefix = digits[:2]
+        if prefix in ("0b", "0x"):
+            return sign * int(digits[2:], 2 if prefix == "0b" else 16)
+        return sign * int(digits, 8)
+    if kind == "float":
+        return float(digits)
+    if kind == "sexagesimal":
+        sign = -1 if digits[0] == "-" else 1
+        total = 0
+        for part in digits.lstrip("+-").split(":"):
+            total = total * 60 + (float(part) if "." in part else int(part))
+        return sign * total
+    from datetime import date
+
+    return date.fromisoformat(value)
+
+
+def fold_quoted_lines(text: str) -> str:
+    """Fold the line breaks of a multi-line quoted scalar the way YAML does."""
+    if "\n" not in text:
+        return text
+    lines = text.split("\n")
+    result = lines[0].rstrip(" \t")
+    blanks = 0
+    last = len(lines) - 1
+    for i, line in enumerate(lines[1:], 1):
+        line = line.strip(" \t")
+        if not line and i < last:
+            blanks += 1
             continue
+        if result.endswith("\\") and (len(result) - len(result.rstrip("\\"))) % 2:
+            result = result[:-1] + "\n" * blanks  # escaped line break joins directly
+        else:
+            result += "\n" * blanks if blanks else " "
+        result += line
+        blanks = 0
+    return result
+
+
+class YamlSubsetParser:
+    """Single-pass recursive-descent parser for the YAML subset our files use.
 
-        # Check for top-level key: value pair
-        if ":" in line and not line.startswith(" "):
-            _save_current()
+    Block mappings and sequences at any depth (including sequences of
+    mappings), plain, single- and double-quoted scalars over one or more
+    lines, literal and folded block scalars, one-line flow collections of
+    scalars, and comments. Each line is matched against YAML_LINE_PATTERN at
+    most once, in one finditer pass. Anything outside the subset raises ValueError.
+    """
+
+    def __init__(self, text: str):
+        self.lines = text.split("\n")
+        # Per line: False for blank and comment lines, else (indent, dash, key, rest)
+        self.tokens = [self._tokenize(m) for m in YAML_LINE_PATTERN.finditer(text)]
+        self.pos = 0
+        self.value_line = 0
+
+    def parse(self):
+        token = self._peek()
+        if token is None:
+            return None
+        node = self._node(token[0])
+        if self._peek() is not None:
+            self._fail("unexpected content")
+        return node
 
-            parts = line.split(":", 1)
-            key = parts[0].strip()
-            value = parts[1].strip() if len(parts) > 1 else ""
+    def _fail(self, message: str):
+        raise ValueError(f"line {self.pos + 1}: {message}")
 
-            if not value:
-                # Starts a collection — type determined by first child
-                current_key = key
-                current_collection = None
-                collection_type = None
+    def _fail_value(self, message: str):
+        raise ValueError(f"line {self.value_line}: {message}")
+
+    @staticmethod
+    def _tokenize(match: re.Match) -> tuple | bool:
+        indent, dash, key, rest = match.groups()
+        if dash is None and key is None and (not rest.strip() or rest.lstrip()[0] == "#"):
+            return False
+        return len(indent), dash, key, rest
+
+    def _peek(self) -> tuple | None:
+        """Next non-blank, non-comment line, skipping the ones before it."""
+        tokens = self.tokens
+        while self.pos < len(tokens):
+            if token := tokens[self.pos]:
+                return token
+            self.pos += 1
+        return None
+
+    def _rewrite(self, column: int, rest: str) -> None:
+        """Re-tokenize the content after a "- " marker as a line at ``column``."""
+        self.lines[self.pos] = " " * column + rest
+        self.tokens[self.pos] = self._tokenize(YAML_LINE_PATTERN.match(self.lines[self.pos]))
+
+    def _node(self, indent: int):
+        _, dash, key, rest = self.tokens[self.pos]
+        if dash:
+            return self._sequence(indent)
+        if key is not None:
+            return self._mapping(indent)
+        self.pos += 1
+        return self._scalar(rest, indent - 1)
+
+    def _mapping(self, indent: int) -> dict:
+        result = {}
+        while (token := self._peek()) is not None and token[0] >= indent:
+            line_indent, dash, key, rest = token
+            if line_indent > indent:
+                self._fail("unexpected indentation")
+            if dash or key is None:
+                self._fail("expected a 'key: value' pair")
+            key = self._key(key)
+            self.pos += 1
+            result[key] = self._value(rest, indent, in_mapping=True)
+        return result
+
+    def _sequence(self, indent: int) -> list:
+        result = []
+        while (token := self._peek()) is not None and token[0] >= indent:
+            line_indent, dash, key, _ = token
+            if line_indent > indent:
+                self._fail("unexpected indentation")
+            if not dash:
+                break
+            column = indent + len(dash)
+            rest = self.lines[self.pos][column:]
+            if key is not None or rest.startswith("- ") or rest == "-":
+                self._rewrite(column, rest)
+                result.append(self._node(column))
             else:
-                # Strip surrounding quotes from values
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                result[key] = value
-
-    # Save any remaining collection
-    if current_key is not None:
-        if current_collection is None:
-            # Key with no children — store as empty dict
-            result[current_key] = {}
-        else:
-            result[current_key] = current_collection
+                self.pos += 1
+                result.append(self._value(rest, indent, in_mapping=False))
+        return result
+
+    def _key(self, raw: str):
+        if raw[0] in "\"'":
+            return self._quoted(raw)
+        if "\t" in raw:
+            self._fail("tabs are not allowed in a plain key")
+        return resolve_plain_scalar(raw.rstrip())
+
+    def _value(self, rest: str, indent: int, in_mapping: bool):
+        if not rest or rest.startswith("#"):
+            token = self._peek()
+            if token is None:
+                return None
+            child = token[0]
+            if child > indent or (in_mapping and child == indent and token[1]):
+                return self._node(child)
+            return None
+        if in_mapping and (rest == "-" or rest.startswith(("- ", "-\t"))):
+            self.value_line = self.pos
+            self._fail_value("sequence entries are not allowed in a mapping value")
+        if rest[0] in "|>":
+            return self._block_scalar(rest, indent)
+        return self._scalar(rest, indent)
+
+    def _scalar(self, rest: str, indent: int):
+        self.value_line = self.pos
+        if rest[0] in "\"'":
+            return self._quoted(self._gather_quoted(rest))
+        if rest[0] in "[{":
+            return self._flow(rest)
+        if rest[0] in "&*!%@`":
+            self._fail_value(f"unsupported YAML syntax: {rest[0]}")
+        return resolve_plain_scalar(self._plain(rest, indent))
+
+    def _gather_quoted(self, rest: str) -> str:
+        """Join continuation lines until the quote opened in ``rest`` closes."""
+        pattern = YAML_DOUBLE_QUOTED_PATTERN if rest[0] == '"' else YAML_SINGLE_QUOTED_PATTERN
+        text = rest
+        while (match := pattern.match(text)) is None:
+            if self.pos >= len(self.lines):
+                self._fail_value("unterminated quoted scalar")
+            text += "\n" + self.lines[self.pos]
+            self.pos += 1
+        self._check_trailing(text[match.end():], "quoted scalar")
+        return match.group(0)
+
+    def _check_trailing(self, trailing: str, what: str) -> None:
+        """Reject anything but spaces and a comment after a quoted scalar or flow collection."""
+        stripped = trailing.lstrip(" ")
+        if stripped and not stripped.startswith("#"):
+            self._fail_value(f"unexpected text after {what}")
 
-    return result
+    @staticmethod
+    def _quoted(raw: str) -> str:
+        text = fold_quoted_lines(raw[1:-1])
+        if raw[0] == "'":
+            return text.replace("''", "'")
+        return YAML_ESCAPE_PATTERN.sub(
+            lambda m: (
+                chr(int(m.group(1)[1:], 16)) if len(m.group(1)) > 1
+                else YAML_ESCAPES.get(m.group(1), m.group(0))
+            ),
+            text,
+        )
+
+    def _plain(self, rest: str, indent: int) -> str:
+        """A plain scalar plus any more-indented continuation lines."""
+        text, _, comment = rest.partition(" #")
+        if "\t" in text:
+            self._fail_value("tabs are not allowed in a plain scalar")
+        text = text.rstrip()
+        blanks = 0
+        i = self.pos
+        while not comment and i < len(self.lines):
+            token = self.tokens[i]
+            if not token:
+                if self.lines[i].strip():
+                    break  # a comment line ends the scalar
+                blanks += 1
+                i += 1
+                continue
+            if token[0] <= indent:
+                break
+            continued, _, comment = self.lines[i].lstrip(" ").partition(" #")
+            if "\t" in continued:
+                self.value_line = i
+                self._fail_value("tabs are not allowed in a plain scalar")
+            text += ("\n" * blanks if blanks else " ") + continued.rstrip()
+            blanks = 0
+            i += 1
+            self.pos = i
+            if comment:
+                break
+        if ": " in text or text.endswith(":"):
+            self._fail_value("mapping values are not allowed in a plain scalar")
+        return text
+
+    def _flow(self, rest: str):
+        closing = "]" if rest[0] == "[" else "}"
+        body, _, trailing = rest[1:].partition(closing)
+        if "[" in body or "{" in body:
+            self._fail_value("unsupported flow collection")
+        if not rest[1:].count(closing):
+            self._fail_value("unterminated flow collection")
+        self._check_trailing(trailing, "flow collection")
+        items = [item.strip() for item in body.split(",")]
+        if items and not items[-1]:
+            items.pop()
+        values = [self._quoted(item) if item[:1] in "\"'" else resolve_plain_scalar(item) for item in items]
+        if closing == "]":
+            return values
+        result = {}
+        for item in items:
+            key, _, value = item.partition(":")
+            result[self._key(key.strip())] = (
+                self._quoted(value.strip()) if value.strip()[:1] in "\"'"
+                else resolve_plain_scalar(value.strip())
+            )
+        return result
+
+    def _block_scalar(self, rest: str, indent: int) -> str:
+        self.value_line = self.pos
+        header = YAML_BLOCK_HEADER_PATTERN.match(rest)
+        if header is None:
+            self._fail_value("invalid block scalar header")
+        style, chomping, explicit = header.groups()
+        content_indent = indent + int(explicit) if explicit else None
+
+        lines = []
+        last = len(self.lines) - 1
+        while self.pos < len(self.lines):
+            line = self.lines[self.pos]
+            if not line.strip():
+                if self.pos == last:
+                    break  # no line break ends it, so it is not a line of the scalar
+                lines.append(line[content_indent:] if content_indent else "")
+                self.pos += 1
+                continue
+            line_indent = len(line) - len(line.lstrip(" "))
+            if content_indent is None:
+                if line_indent <= indent:
+                    break
+                content_indent = line_indent
+            if line_indent < content_indent:
+                break
+            lines.append(line[content_indent:])
+            self.pos += 1
+
+        trailing = 0
+        while lines and not lines[-1].strip():
+            lines.pop()
+            trailing += 1
+
+        text = ""
+        previous = None
+        blanks = 0
+        for line in lines:
+            if not line:
+                blanks += 1
+                continue
+            if previous is None:
+                text = "\n" * blanks + line
+            elif style == ">" and not previous.startswith((" ", "\t")) and not line.startswith((" ", "\t")):
+                text += ("\n" * blanks if blanks else " ") + line
+            else:
+                text += "\n" * (blanks + 1) + line
+            previous = line
+            blanks = 0
+
+        # Only a last content line that ends the document has no line break
+        newline = "\n" if text and self.pos <= last else ""
+        if chomping == "-":
+            return text
+        if chomping == "+":
+            return text + newline + "\n" * trailing
+        return text + newline if text else ""
+
+
+def simple_yaml_parse(yaml_str: str) -> dict:
+    """Parse YAML without PyYAML, matching ``yaml.safe_load`` on the subset we use."""
+    return YamlSubsetParser(yaml_str).parse()
 
 
 def parse_yaml(yaml_str: str) -> dict:
     """Parse YAML using PyYAML if available, otherwise use simple parser."""
-    if HAS_PYYAML:
-        return yaml.safe_load(yaml_str) or {}
-    return simple_yaml_parse(yaml_str)
+    with PROFILER.measure("phase", "parse"):
+        yaml = load_pyyaml()
+        if yaml is None:
+            return simple_yaml_parse(yaml_str) or {}
+        # libyaml's C loader when PyYAML was built against it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        try:
+            return yaml.load(yaml_str, Loader=loader) or {}
+        except yaml.YAMLError:
+            if loader is yaml.SafeLoader:
+                raise
+            # libyaml's errors omit the offending line; the pure-Python loader quotes it
+            return yaml.safe_load(yaml_str) or {}
 
 
 # =============================================================================
@@ -132,6 +461,7 @@ def parse_yaml(yaml_str: str) -> dict:
 # =============================================================================
 
 SKILLS_DIR = "skills"
+DEFAULT_SAMPLE_SIZE = 20  # Issues kept by --summary-only
 REQUIRED_FIELDS = ["name", "description"]
 MAX_DESCRIPTION_LENGTH = 1024
 DESCRIPTION_PREFIX = "Use when"
@@ -165,18 +495,18 @@ CANONICAL_SECTIONS = [
     "Knowledge Reference",
     "Related Skills",
 ]
+CANONICAL_SECTION_SET = frozenset(CANONICAL_SECTIONS)
 
 # Line count thresholds for SKILL.md
 MIN_NON_BLANK_LINES = 80
 MAX_NON_BLANK_LINES = 100
 
-# Compiled regex patterns for body content checks
+# Compiled regex patterns for body content checks (matched one line at a time)
 CORE_WORKFLOW_PATTERN = re.compile(r"##\s*Core\s+Workflow")
 WHEN_TO_USE_PATTERN = re.compile(r"##\s*When\s+to\s+Use(?:\s+This\s+Skill)?", re.IGNORECASE)
-NUMBERED_STEP_PATTERN = re.compile(r"^\d+\.\s", re.MULTILINE)
-BULLET_PATTERN = re.compile(r"^\s*[-*]\s")
-NEXT_SECTION_PATTERN = re.compile(r"\n##\s+")
-H2_HEADER_PATTERN = re.compile(r"^##\s+(.+)$", re.MULTILINE)
+BULLET_PATTERN = re.compile(r"\s*[-*]\s")
+LIST_ITEM_PATTERN = re.compile(r"(\d+\.)(?:\s|$)|\s*[-*]\s")  # Numbered step or bullet
+HEADING_PATTERN = re.compile(r"(#{1,6})\s+(.+)")
 
 # Files to check for count consistency
 COUNT_FILES = [
@@ -207,6 +537,17 @@ VALID_PHASES = {"writing", "capture"}
 VALID_DEPENDENCY_STRENGTHS = {"required", "recommended"}
 
 
+
+def index_roots(skills_dir: Path, base_path: Path) -> list[Path]:
+    """Everything the skill, count and workflow checks read, for one TreeIndex walk."""
+    return [
+        skills_dir,
+        base_path / COMMANDS_DIR_WORKFLOW,
+        base_path / "docs",
+        *(skills_dir.parent / f for f in COUNT_FILES),
+    ]
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -216,22 +557,168 @@ class Severity(Enum):
     WARNING = "warning"
 
 
-class DFSColor(IntEnum):
-    """Colors for DFS cycle detection."""
-    WHITE = 0  # Unvisited
-    GRAY = 1   # In progress
-    BLACK = 2  # Completed
+@dataclass
+class PhaseGraph:
+    """Dependency analysis of the manifest phases.
+
+    ``cycles`` holds one cycle per strongly connected component that has
+    one. When there are none, ``levels`` groups the phases into sets that
+    can run concurrently (each depends only on earlier levels) and
+    ``critical_path`` is the longest dependency chain, first phase first.
+    """
+    phases: int
+    cycles: list[list[str]] = field(default_factory=list)
+    levels: list[list[str]] | None = None
+    critical_path: list[str] | None = None
+
+    @classmethod
+    def analyze(cls, graph: dict[str, list[str]]) -> "PhaseGraph":
+        """Analyze ``graph`` (phase -> the phases it depends on).
+
+        Iterative Tarjan, so deep ``depends_on`` chains do not hit the
+        recursion limit. Components come out dependencies first, which is
+        the order levels are assigned in. Undefined phases are ignored.
+        """
+        order = {node: i for i, node in enumerate(graph)}
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components: list[list[str]] = []
+
+        for root in graph:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph[root]))]
+            while work:
+                node, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if neighbor not in graph:
+                        continue
+                    if neighbor not in index:
+                        index[neighbor] = low[neighbor] = len(index)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(graph[neighbor])))
+                        break
+                    if neighbor in on_stack:
+                        low[node] = min(low[node], index[neighbor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(component, key=order.__getitem__))
+
+        analysis = cls(phases=len(graph))
+        for component in components:
+            if len(component) > 1 or component[0] in graph[component[0]]:
+                analysis.cycles.append(cls._cycle_through(component, graph))
+        analysis.cycles.sort(key=lambda cycle: order[cycle[0]])
+        if analysis.cycles:
+            return analysis
+
+        level: dict[str, int] = {}
+        for (node,) in components:
+            level[node] = max((level[dep] + 1 for dep in graph[node] if dep in graph), default=0)
+        analysis.levels = [[] for _ in range(max(level.values(), default=-1) + 1)]
+        for node in graph:
+            analysis.levels[level[node]].append(node)
+
+        path = []
+        node = next((n for n in graph if level[n] == len(analysis.levels) - 1), None)
+        while node is not None:
+            path.append(node)
+            node = next((d for d in graph[node] if d in graph and level[d] == level[node] - 1), None)
+        analysis.critical_path = path[::-1]
+        return analysis
+
+    @staticmethod
+    def _cycle_through(component: list[str], graph: dict[str, list[str]]) -> list[str]:
+        """Shortest cycle from the component's first phase back to itself (breadth-first)."""
+        start = component[0]
+        members = set(component)
+        parent = {start: None}
+        queue = [start]
+        for node in queue:
+            for neighbor in graph[node]:
+                if neighbor == start:
+                    cycle = [start]
+                    while node is not None:
+                        cycle.append(node)
+                        node = parent[node]
+                    return cycle[::-1]
+                if neighbor in members and neighbor not in parent:
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+        return [start, start]  # Unreachable for a strongly connected component
+
+    def to_dict(self) -> dict:
+        return {
+            "phases": self.phases,
+            "cycles": self.cycles,
+            "levels": self.levels,
+            "critical_path": self.critical_path,
+        }
 
 
 @dataclass
-class FrontmatterResult:
-    """Result of frontmatter extraction."""
-    frontmatter: dict
-    body: str
+class SkillDocument:
+    """A skill's SKILL.md, read and parsed once per run and shared by all checkers.
+
+    ``frontmatter`` is None when the file is missing, has no frontmatter
+    block, or fails to parse; ``error`` then says why (YamlChecker reports it,
+    every other checker skips the skill). ``rule_states`` holds each
+    DocumentRule's state once a RuleEngine has scanned the document.
+    """
+    skill_path: Path
+    skill_name: str
     skill_md: Path
+    index: TreeIndex = field(repr=False)
+    exists: bool = False
+    frontmatter: dict | None = None
+    body: str = ""
+    body_line: int = 1  # File line number of the body's first line
+    error: str | None = None
+    rule_states: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def load(cls, skill_path: Path, index: TreeIndex) -> "SkillDocument":
+        """Read and parse ``skill_path/SKILL.md`` through ``index``."""
+        doc = cls(skill_path, skill_path.name, skill_path / "SKILL.md", index)
+        if not index.exists(doc.skill_md):
+            doc.error = "Missing SKILL.md file"
+            return doc
+        doc.exists = True
+        content = index.read_text(doc.skill_md)
+        if not content.startswith("---"):
+            doc.error = "SKILL.md does not start with YAML frontmatter (---)"
+            return doc
+        parts = content.split("---", 2)
+        if len(parts) < 3:
+            doc.error = "Invalid YAML frontmatter structure (missing closing ---)"
+            return doc
+        doc.body = parts[2]
+        doc.body_line = parts[1].count("\n") + 1
+        try:
+            doc.frontmatter = parse_yaml(parts[1])
+        except Exception as e:
+            doc.error = f"YAML parsing error: {e}"
+        return doc
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationIssue:
     """Individual validation issue."""
     skill: str
@@ -249,20 +736,90 @@ class ValidationIssue:
             "file": self.file,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ValidationIssue":
+        return cls(
+            skill=data["skill"],
+            check=data["check"],
+            severity=Severity(data["severity"]),
+            message=data["message"],
+            file=data["file"],
+        )
+
+
+@dataclass
+class IssueBudget:
+    """How many issues a run may report before it stops (--fail-fast, --max-issues).
+
+    Validators pass each checker's issues through ``take`` and, before each
+    further skill or checker, ask ``spent`` whether to stop. The budget is
+    ``exhausted`` once it is full; the report is ``truncated`` only if
+    issues were then actually dropped or work skipped, so a run that ends
+    exactly at the limit is complete. The default budget is unlimited.
+    """
+    max_issues: int | None = None
+    fail_fast: bool = False  # Stop after the first error
+    taken: int = 0
+    exhausted: bool = False
+    truncated: bool = False
+
+    def take(self, issues: list[ValidationIssue]) -> list[ValidationIssue]:
+        """Return the leading part of ``issues`` that fits in the budget."""
+        if self.exhausted:
+            self.truncated = self.truncated or bool(issues)
+            return []
+        kept = issues
+        if self.fail_fast:
+            for i, issue in enumerate(kept):
+                if issue.severity == Severity.ERROR:
+                    kept = kept[:i + 1]
+                    self.exhausted = True
+                    break
+        if self.max_issues is not None and self.taken + len(kept) >= self.max_issues:
+            kept = kept[:self.max_issues - self.taken]
+            self.exhausted = True
+        self.truncated = self.truncated or len(kept) < len(issues)
+        self.taken += len(kept)
+        return kept
+
+    def spent(self) -> bool:
+        """Whether to skip the next skill or checker; skipping it marks the run truncated."""
+        if self.exhausted:
+            self.truncated = True
+        return self.exhausted
+
+    def fresh(self) -> "IssueBudget":
+        """An unspent budget with the same limits."""
+        return IssueBudget(self.max_issues, self.fail_fast)
+
 
 @dataclass
 class ValidationResult:
-    """Per-skill validation results."""
+    """Per-skill validation results, with running error and warning counts."""
     skill: str
     issues: list[ValidationIssue] = field(default_factory=list)
+    errors: int = field(default=0, init=False)
+    warnings: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        issues, self.issues = self.issues, []
+        self.add(issues)
+
+    def add(self, issues: list[ValidationIssue]) -> None:
+        for issue in issues:
+            if issue.severity == Severity.ERROR:
+                self.errors += 1
+            else:
+                self.warnings += 1
+        self.issues.extend(issues)
 
     @property
     def has_errors(self) -> bool:
-        return any(i.severity == Severity.ERROR for i in self.issues)
+        return self.errors > 0
 
     @property
     def has_warnings(self) -> bool:
-        return any(i.severity == Severity.WARNING for i in self.issues)
+        return self.warnings > 0
 
     def to_dict(self) -> dict:
         return {
@@ -272,49 +829,122 @@ class ValidationResult:
             "has_warnings": self.has_warnings,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ValidationResult":
+        return cls(data["skill"], [ValidationIssue.from_dict(i) for i in data["issues"]])
+
 
 @dataclass
 class ValidationReport:
-    """Full validation report."""
+    """Full validation report, accumulated as results arrive.
+
+    The add_* methods keep running counts per severity, check and skill, so
+    totals never rescan the issue lists. With ``sample`` set (summary-only
+    mode) no results or issue lists are kept, only the counts and the first
+    ``sample`` issues. ``on_issues`` is called with each batch as it is added.
+    """
     results: list[ValidationResult] = field(default_factory=list)
     count_issues: list[ValidationIssue] = field(default_factory=list)
     workflow_issues: list[ValidationIssue] = field(default_factory=list)
+    truncated: bool = False  # Stopped early by an IssueBudget
+    shard: str | None = None  # "i/N" when only one --shard of the skills was validated
+    phase_graph: PhaseGraph | None = None  # Set when the workflow checks ran
+    sample: int | None = None
+    on_issues: Callable[[list[ValidationIssue]], None] | None = field(default=None, repr=False)
+    skills: int = field(default=0, init=False)
+    by_severity: dict[str, int] = field(init=False)
+    by_check: dict[str, dict[str, int]] = field(init=False)
+    by_skill: dict[str, dict[str, int]] = field(init=False)
+    sampled: list[ValidationIssue] = field(init=False)
+
+    def __post_init__(self):
+        self.by_severity = {s.value: 0 for s in Severity}
+        self.by_check = {}
+        self.by_skill = {}
+        self.sampled = []
+        results, count_issues, workflow_issues = self.results, self.count_issues, self.workflow_issues
+        self.results, self.count_issues, self.workflow_issues = [], [], []
+        for result in results:
+            self.add_result(result)
+        self.add_count_issues(count_issues)
+        self.add_workflow_issues(workflow_issues)
+
+    @property
+    def summary_only(self) -> bool:
+        return self.sample is not None
+
+    def _tally(self, issues: list[ValidationIssue]) -> None:
+        for issue in issues:
+            severity = issue.severity.value
+            self.by_severity[severity] += 1
+            for counts, key in ((self.by_check, issue.check), (self.by_skill, issue.skill)):
+                if key not in counts:
+                    counts[key] = {s.value: 0 for s in Severity}
+                counts[key][severity] += 1
+        if self.summary_only and len(self.sampled) < self.sample:
+            self.sampled.extend(issues[:self.sample - len(self.sampled)])
+        if self.on_issues:
+            self.on_issues(issues)
+
+    def add_result(self, result: ValidationResult) -> None:
+        self.skills += 1
+        self._tally(result.issues)
+        if not self.summary_only:
+            self.results.append(result)
+
+    def add_count_issues(self, issues: list[ValidationIssue]) -> None:
+        self._tally(issues)
+        if not self.summary_only:
+            self.count_issues.extend(issues)
+
+    def add_workflow_issues(self, issues: list[ValidationIssue]) -> None:
+        self._tally(issues)
+        if not self.summary_only:
+            self.workflow_issues.extend(issues)
 
     @property
     def has_errors(self) -> bool:
-        return (
-            any(r.has_errors for r in self.results)
-            or any(i.severity == Severity.ERROR for i in self.count_issues)
-            or any(i.severity == Severity.ERROR for i in self.workflow_issues)
-        )
+        return self.total_errors > 0
 
     @property
     def total_errors(self) -> int:
-        count = sum(1 for r in self.results for i in r.issues if i.severity == Severity.ERROR)
-        count += sum(1 for i in self.count_issues if i.severity == Severity.ERROR)
-        count += sum(1 for i in self.workflow_issues if i.severity == Severity.ERROR)
-        return count
+        return self.by_severity[Severity.ERROR.value]
 
     @property
     def total_warnings(self) -> int:
-        count = sum(1 for r in self.results for i in r.issues if i.severity == Severity.WARNING)
-        count += sum(1 for i in self.count_issues if i.severity == Severity.WARNING)
-        count += sum(1 for i in self.workflow_issues if i.severity == Severity.WARNING)
-        return count
+        return self.by_severity[Severity.WARNING.value]
 
-    def to_dict(self) -> dict:
+    @property
+    def summary(self) -> dict:
         return {
-            "results": [r.to_dict() for r in self.results],
-            "count_issues": [i.to_dict() for i in self.count_issues],
-            "workflow_issues": [i.to_dict() for i in self.workflow_issues],
-            "summary": {
-                "total_skills": len(self.results),
-                "total_errors": self.total_errors,
-                "total_warnings": self.total_warnings,
-                "has_errors": self.has_errors,
-            },
+            "total_skills": self.skills,
+            "total_errors": self.total_errors,
+            "total_warnings": self.total_warnings,
+            "has_errors": self.has_errors,
+            "truncated": self.truncated,
         }
 
+    def to_dict(self) -> dict:
+        if self.summary_only:
+            data = {
+                "summary": self.summary,
+                "by_check": self.by_check,
+                "by_skill": self.by_skill,
+                "sample": [i.to_dict() for i in self.sampled],
+            }
+        else:
+            data = {
+                "results": [r.to_dict() for r in self.results],
+                "count_issues": [i.to_dict() for i in self.count_issues],
+                "workflow_issues": [i.to_dict() for i in self.workflow_issues],
+                "summary": self.summary,
+            }
+        if self.phase_graph:
+            data["phase_graph"] = self.phase_graph.to_dict()
+        if self.shard:
+            data["shard"] = self.shard
+        return data
+
 
 # =============================================================================
 # Checker Classes (Strategy Pattern)
@@ -326,89 +956,193 @@ class BaseChecker(ABC):
     name: str = "base"
     category: str = "general"
 
-    @staticmethod
-    def _extract_frontmatter(skill_path: Path) -> FrontmatterResult | None:
-        """Extract frontmatter safely, returning None if invalid."""
-        skill_md = skill_path / "SKILL.md"
-        if not skill_md.exists():
-            return None
-        content = skill_md.read_text()
-        if not content.startswith("---"):
-            return None
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return None
-        try:
-            frontmatter = parse_yaml(parts[1])
-            if frontmatter is None:
-                return None
-            return FrontmatterResult(frontmatter, parts[2], skill_md)
-        except Exception:
-            return None
-
     @abstractmethod
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        """Run the check and return any issues found."""
+    def check(self, doc: SkillDocument) -> list[ValidationIssue]:
+        """Run the check against a loaded skill and return any issues found."""
         pass
 
 
-class YamlChecker(BaseChecker):
-    """Validates YAML frontmatter parsing."""
+# =============================================================================
+# Rule Engine
+# =============================================================================
 
-    name = "yaml"
-    category = "yaml"
+class DocumentRule(BaseChecker):
+    """A checker that subscribes to document events instead of scanning SKILL.md itself.
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        issues = []
-        skill_md = skill_path / "SKILL.md"
+    A RuleEngine reads each SKILL.md once and feeds every rule from that
+    pass, so adding a rule adds no passes over the text. Rules declare:
 
-        if not skill_md.exists():
-            issues.append(ValidationIssue(
-                skill=skill_name,
-                check=self.name,
-                severity=Severity.ERROR,
-                message="Missing SKILL.md file",
-                file=str(skill_md),
-            ))
-            return issues
+    - ``frontmatter_keys``: top-level keys, or "metadata.<key>"; ``on_key``
+      is called for each one present.
+    - ``events``: any of "line" (every body line), "heading" (ATX headers),
+      "section" (each line of the ``section`` span) and "list_item" (the
+      bullet and numbered items of that span).
+    - ``section``: header pattern whose first match opens the span, which
+      runs to the next H2 header; ``on_section_start`` marks that it exists.
 
-        content = skill_md.read_text()
-        if not content.startswith("---"):
-            issues.append(ValidationIssue(
-                skill=skill_name,
-                check=self.name,
-                severity=Severity.ERROR,
-                message="SKILL.md does not start with YAML frontmatter (---)",
-                file=str(skill_md),
-            ))
-            return issues
+    Handlers record into the per-document state returned by ``start``, and
+    ``finish`` turns that state into issues.
+    """
 
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            issues.append(ValidationIssue(
-                skill=skill_name,
-                check=self.name,
-                severity=Severity.ERROR,
-                message="Invalid YAML frontmatter structure (missing closing ---)",
-                file=str(skill_md),
-            ))
-            return issues
+    events: frozenset[str] = frozenset()
+    frontmatter_keys: tuple[str, ...] = ()
+    section: re.Pattern | None = None
 
-        try:
-            if HAS_PYYAML:
-                yaml.safe_load(parts[1])
-            else:
-                parse_yaml(parts[1])
-        except Exception as e:
-            issues.append(ValidationIssue(
-                skill=skill_name,
-                check=self.name,
-                severity=Severity.ERROR,
-                message=f"YAML parsing error: {e}",
-                file=str(skill_md),
-            ))
+    def start(self, doc: SkillDocument) -> dict:
+        return {}
 
-        return issues
+    def on_key(self, state: dict, key: str, value) -> None:
+        state[key] = value
+
+    def on_line(self, state: dict, lineno: int, line: str) -> None:
+        pass
+
+    def on_heading(self, state: dict, lineno: int, level: int, title: str) -> None:
+        pass
+
+    def on_section_start(self, state: dict, lineno: int) -> None:
+        pass
+
+    def on_section_line(self, state: dict, lineno: int, line: str) -> None:
+        pass
+
+    def on_list_item(self, state: dict, lineno: int, line: str, ordered: bool) -> None:
+        pass
+
+    @abstractmethod
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
+        """Return the issues recorded in ``state``."""
+        pass
+
+    def check(self, doc: SkillDocument) -> list[ValidationIssue]:
+        if doc.frontmatter is None:
+            return []
+        state = doc.rule_states.get(self)
+        if state is None:
+            # Not part of an engine run (e.g. a rule used on its own)
+            state = RuleEngine([self]).run(doc)[self]
+        return self.finish(doc, state)
+
+
+class RuleEngine:
+    """Feeds a set of DocumentRules from one line-by-line pass over a SKILL.md."""
+
+    def __init__(self, rules: list[DocumentRule]):
+        self.rules = rules
+        self.key_rules: dict[tuple[str, ...], list[DocumentRule]] = {}
+        self.span_rules: dict[re.Pattern, list[DocumentRule]] = {}
+        for rule in rules:
+            for key in rule.frontmatter_keys:
+                self.key_rules.setdefault(tuple(key.split(".", 1)), []).append(rule)
+            # Rules sharing a header pattern share its span
+            if rule.section is not None:
+                self.span_rules.setdefault(rule.section, []).append(rule)
+        self.line_rules = [r for r in rules if "line" in r.events]
+        self.heading_rules = [r for r in rules if "heading" in r.events]
+
+    def run(self, doc: SkillDocument) -> dict[DocumentRule, dict]:
+        """Scan ``doc`` and return each rule's state (also stored in ``doc.rule_states``)."""
+        states = {rule: rule.start(doc) for rule in self.rules}
+        doc.rule_states.update(states)
+        if doc.frontmatter is not None:
+            self._dispatch_keys(doc.frontmatter, states)
+            self._scan_body(doc, states)
+        return states
+
+    def _dispatch_keys(self, frontmatter: dict, states: dict) -> None:
+        for path, rules in self.key_rules.items():
+            mapping = frontmatter if len(path) == 1 else frontmatter.get(path[0])
+            if isinstance(mapping, dict) and path[-1] in mapping:
+                for rule in rules:
+                    rule.on_key(states[rule], ".".join(path), mapping[path[-1]])
+
+    def _scan_body(self, doc: SkillDocument, states: dict) -> None:
+        line_handlers = [(r.on_line, states[r]) for r in self.line_rules]
+        heading_handlers = [(r.on_heading, states[r]) for r in self.heading_rules]
+        pending = dict(self.span_rules)  # Header patterns not matched yet
+        # Handlers of every open span; the next H2 header closes them all
+        section_handlers = []
+        item_handlers = []
+
+        lines = doc.body.split("\n")
+        first = doc.body_line
+        for lineno, line in enumerate(lines, first):
+            for handler, state in line_handlers:
+                handler(state, lineno, line)
+
+            if line[:1] == "#":
+                if line[1:2] == "#" and self._closes_span(lines, lineno - first):
+                    section_handlers = []
+                    item_handlers = []
+                if heading_handlers:
+                    match = HEADING_PATTERN.match(line)
+                    if match:
+                        for handler, state in heading_handlers:
+                            handler(state, lineno, len(match.group(1)), match.group(2).strip())
+
+            if section_handlers or item_handlers:
+                self._feed_span(section_handlers, item_handlers, lineno, line, lines, first)
+
+            if pending and "##" in line:
+                for pattern in list(pending):
+                    match = pattern.search(line)
+                    if not match:
+                        continue
+                    rules = pending.pop(pattern)
+                    opened = [(r.on_section_line, states[r]) for r in rules if "section" in r.events]
+                    opened_items = [(r.on_list_item, states[r]) for r in rules if "list_item" in r.events]
+                    for rule in rules:
+                        rule.on_section_start(states[rule], lineno)
+                    # The span starts right after the header text, on the same line
+                    self._feed_span(opened, opened_items, lineno, line[match.end():], lines, first)
+                    section_handlers = section_handlers + opened
+                    item_handlers = item_handlers + opened_items
+
+    @staticmethod
+    def _closes_span(lines: list[str], index: int) -> bool:
+        """Whether ``lines[index]`` is an H2 header: "##" plus whitespace, or a bare "##" followed by a newline."""
+        line = lines[index]
+        return line[:2] == "##" and (line[2:3].isspace() or (line == "##" and index + 1 < len(lines)))
+
+    @classmethod
+    def _feed_span(
+        cls, section_handlers: list, item_handlers: list, lineno: int, line: str, lines: list[str], first: int
+    ) -> None:
+        """Feed ``line`` (line ``lineno`` of ``lines``, which starts at line ``first``) to the open spans."""
+        for handler, state in section_handlers:
+            handler(state, lineno, line)
+        if item_handlers:
+            match = LIST_ITEM_PATTERN.match(line)
+            # A bare "1." is a step when the span's text goes on past it, as "\s" then matches the newline
+            if match and (
+                match.end() != match.end(1)
+                or ((following := lineno - first + 1) < len(lines) and not cls._closes_span(lines, following))
+            ):
+                ordered = match.group(1) is not None
+                for handler, state in item_handlers:
+                    handler(state, lineno, line, ordered)
+
+
+# =============================================================================
+# Skill Checkers
+# =============================================================================
+
+class YamlChecker(BaseChecker):
+    """Validates YAML frontmatter parsing."""
+
+    name = "yaml"
+    category = "yaml"
+
+    def check(self, doc: SkillDocument) -> list[ValidationIssue]:
+        if doc.error is None:
+            return []
+        return [ValidationIssue(
+            skill=doc.skill_name,
+            check=self.name,
+            severity=Severity.ERROR,
+            message=doc.error,
+            file=str(doc.skill_md),
+        )]
 
 
 class RequiredFieldsChecker(BaseChecker):
@@ -417,105 +1151,95 @@ class RequiredFieldsChecker(BaseChecker):
     name = "required-fields"
     category = "yaml"
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
+    def check(self, doc: SkillDocument) -> list[ValidationIssue]:
+        if doc.frontmatter is None:
             return []  # YamlChecker will report this
 
         issues = []
         for fld in REQUIRED_FIELDS:
-            if fld not in result.frontmatter:
+            if fld not in doc.frontmatter:
                 issues.append(ValidationIssue(
-                    skill=skill_name,
+                    skill=doc.skill_name,
                     check=self.name,
                     severity=Severity.ERROR,
                     message=f"Missing required field: {fld}",
-                    file=str(result.skill_md),
+                    file=str(doc.skill_md),
                 ))
 
         return issues
 
 
-class NameFormatChecker(BaseChecker):
+class NameFormatChecker(DocumentRule):
     """Validates skill name format (letters, numbers, hyphens only)."""
 
     name = "name-format"
     category = "yaml"
+    frontmatter_keys = ("name",)
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
-            return []
-
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
         issues = []
-        name = result.frontmatter.get("name", "")
+        name = state.get("name", "")
         if name and not NAME_PATTERN.match(name):
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.ERROR,
                 message=f"Invalid name format: '{name}'. Use only letters, numbers, and hyphens.",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             ))
 
         # Also check that directory name matches skill name
-        if name and name != skill_name:
+        if name and name != doc.skill_name:
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
-                message=f"Directory name '{skill_name}' doesn't match skill name '{name}'",
-                file=str(result.skill_md),
+                message=f"Directory name '{doc.skill_name}' doesn't match skill name '{name}'",
+                file=str(doc.skill_md),
             ))
 
         return issues
 
 
-class DescriptionLengthChecker(BaseChecker):
+class DescriptionLengthChecker(DocumentRule):
     """Validates description is within max length."""
 
     name = "description-length"
     category = "yaml"
+    frontmatter_keys = ("description",)
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
-            return []
-
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
         issues = []
-        description = result.frontmatter.get("description", "")
+        description = state.get("description", "")
         if description and len(description) > MAX_DESCRIPTION_LENGTH:
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message=f"Description exceeds {MAX_DESCRIPTION_LENGTH} chars ({len(description)} chars)",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             ))
 
         return issues
 
 
-class DescriptionFormatChecker(BaseChecker):
+class DescriptionFormatChecker(DocumentRule):
     """Validates description starts with 'Use when'."""
 
     name = "description-format"
     category = "yaml"
+    frontmatter_keys = ("description",)
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
-            return []
-
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
         issues = []
-        description = result.frontmatter.get("description", "")
+        description = state.get("description", "")
         if description and not description.startswith(DESCRIPTION_PREFIX):
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message=f"Description should start with '{DESCRIPTION_PREFIX}' (trigger-only format)",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             ))
 
         return issues
@@ -527,41 +1251,40 @@ class MetadataFieldsChecker(BaseChecker):
     name = "metadata-fields"
     category = "yaml"
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
+    def check(self, doc: SkillDocument) -> list[ValidationIssue]:
+        if doc.frontmatter is None:
             return []
 
         issues = []
-        metadata = result.frontmatter.get("metadata")
+        metadata = doc.frontmatter.get("metadata")
         if metadata is None:
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.ERROR,
                 message="Missing 'metadata' key",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             ))
             return issues
 
         if not isinstance(metadata, dict):
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.ERROR,
                 message="'metadata' must be a mapping",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             ))
             return issues
 
         for fld in REQUIRED_METADATA_FIELDS:
             if fld not in metadata:
                 issues.append(ValidationIssue(
-                    skill=skill_name,
+                    skill=doc.skill_name,
                     check=self.name,
                     severity=Severity.ERROR,
                     message=f"Missing required metadata field: {fld}",
-                    file=str(result.skill_md),
+                    file=str(doc.skill_md),
                 ))
 
         # Validate triggers is a non-empty string
@@ -569,22 +1292,22 @@ class MetadataFieldsChecker(BaseChecker):
         if triggers is not None:
             if not isinstance(triggers, str) or not triggers.strip():
                 issues.append(ValidationIssue(
-                    skill=skill_name,
+                    skill=doc.skill_name,
                     check=self.name,
                     severity=Severity.ERROR,
                     message="'metadata.triggers' must be a non-empty string",
-                    file=str(result.skill_md),
+                    file=str(doc.skill_md),
                 ))
 
         # Validate domain is a known value (warning, not error)
         domain = metadata.get("domain")
         if domain is not None and domain not in KNOWN_DOMAINS:
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message=f"Unknown domain: '{domain}'. Known: {', '.join(sorted(KNOWN_DOMAINS))}",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             ))
 
         # Validate related-skills is a non-empty string with valid skill references
@@ -592,31 +1315,31 @@ class MetadataFieldsChecker(BaseChecker):
             related = metadata.get("related-skills")
             if related is None or (isinstance(related, str) and not related.strip()):
                 issues.append(ValidationIssue(
-                    skill=skill_name,
+                    skill=doc.skill_name,
                     check=self.name,
                     severity=Severity.WARNING,
                     message="'metadata.related-skills' is empty",
-                    file=str(result.skill_md),
+                    file=str(doc.skill_md),
                 ))
             elif not isinstance(related, str):
                 issues.append(ValidationIssue(
-                    skill=skill_name,
+                    skill=doc.skill_name,
                     check=self.name,
                     severity=Severity.ERROR,
                     message="'metadata.related-skills' must be a string",
-                    file=str(result.skill_md),
+                    file=str(doc.skill_md),
                 ))
             else:
                 # Validate each comma-separated value resolves to an existing skill directory
-                skills_dir = skill_path.parent
+                skills_dir = doc.skill_path.parent
                 for ref in (r.strip() for r in related.split(",")):
-                    if ref and not (skills_dir / ref).is_dir():
+                    if ref and not doc.index.is_dir(skills_dir / ref):
                         issues.append(ValidationIssue(
-                            skill=skill_name,
+                            skill=doc.skill_name,
                             check=self.name,
                             severity=Severity.WARNING,
                             message=f"'metadata.related-skills' references non-existent skill: '{ref}'",
-                            file=str(result.skill_md),
+                            file=str(doc.skill_md),
                         ))
 
         return issues
@@ -628,21 +1351,21 @@ class ReferencesDirectoryChecker(BaseChecker):
     name = "references-directory"
     category = "references"
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
+    def check(self, doc: SkillDocument) -> list[ValidationIssue]:
         issues = []
-        refs_dir = skill_path / "references"
+        refs_dir = doc.skill_path / "references"
 
-        if not refs_dir.exists():
+        if not doc.index.exists(refs_dir):
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.ERROR,
                 message="Missing references/ directory",
                 file=str(refs_dir),
             ))
-        elif not refs_dir.is_dir():
+        elif not doc.index.is_dir(refs_dir):
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.ERROR,
                 message="'references' exists but is not a directory",
@@ -658,17 +1381,17 @@ class ReferenceFileCountChecker(BaseChecker):
     name = "reference-file-count"
     category = "references"
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
+    def check(self, doc: SkillDocument) -> list[ValidationIssue]:
         issues = []
-        refs_dir = skill_path / "references"
+        refs_dir = doc.skill_path / "references"
 
-        if not refs_dir.exists() or not refs_dir.is_dir():
+        if not doc.index.is_dir(refs_dir):
             return issues  # ReferencesDirectoryChecker will report this
 
-        ref_files = list(refs_dir.glob("*.md"))
+        ref_files = doc.index.glob(refs_dir, "*.md")
         if len(ref_files) == 0:
             issues.append(ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message="No reference files found in references/",
@@ -690,16 +1413,15 @@ class NonStandardHeadersChecker(BaseChecker):
     name = "non-standard-headers"
     category = "references"
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
+    def check(self, doc: SkillDocument) -> list[ValidationIssue]:
         issues = []
-        refs_dir = skill_path / "references"
+        refs_dir = doc.skill_path / "references"
 
-        if not refs_dir.exists() or not refs_dir.is_dir():
+        if not doc.index.is_dir(refs_dir):
             return issues
 
-        ref_files = list(refs_dir.glob("*.md"))
-        for ref_file in ref_files:
-            content = ref_file.read_text()
+        for ref_file in doc.index.glob(refs_dir, "*.md"):
+            content = doc.index.read_text(ref_file)
             lines = content.split("\n")[:10]  # Check first 10 lines
             header_text = "\n".join(lines)
 
@@ -713,7 +1435,7 @@ class NonStandardHeadersChecker(BaseChecker):
                 if has_load_when:
                     headers_found.append("'Load when:'")
                 issues.append(ValidationIssue(
-                    skill=skill_name,
+                    skill=doc.skill_name,
                     check=self.name,
                     severity=Severity.ERROR,
                     message=f"Has non-standard headers ({', '.join(headers_found)}) - must be removed",
@@ -723,29 +1445,25 @@ class NonStandardHeadersChecker(BaseChecker):
         return issues
 
 
-class MetadataEnumChecker(BaseChecker):
+class MetadataEnumChecker(DocumentRule):
     """Generic checker for metadata enum fields."""
 
     field_name: str = ""  # e.g., "scope"
     valid_values: frozenset[str] = frozenset()
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
-            return []
-
-        metadata = result.frontmatter.get("metadata", {})
-        if not isinstance(metadata, dict):
-            return []
+    @property
+    def frontmatter_keys(self) -> tuple[str, ...]:
+        return (f"metadata.{self.field_name}",)
 
-        value = metadata.get(self.field_name)
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
+        value = state.get(f"metadata.{self.field_name}")
         if value is not None and value not in self.valid_values:
             return [ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message=f"Unknown {self.field_name}: '{value}'. Expected: {', '.join(sorted(self.valid_values))}",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             )]
         return []
 
@@ -768,120 +1486,114 @@ class OutputFormatEnumChecker(MetadataEnumChecker):
     valid_values = frozenset(VALID_OUTPUT_FORMATS)
 
 
-class CoreWorkflowStepCountChecker(BaseChecker):
+class CoreWorkflowStepCountChecker(DocumentRule):
     """Validates Core Workflow section has exactly 5 numbered steps."""
 
     name = "core-workflow-steps"
     category = "yaml"
+    events = frozenset({"list_item"})
+    section = CORE_WORKFLOW_PATTERN
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
-            return []
+    def start(self, doc: SkillDocument) -> dict:
+        return {"found": False, "steps": 0}
+
+    def on_section_start(self, state: dict, lineno: int) -> None:
+        state["found"] = True
+
+    def on_list_item(self, state: dict, lineno: int, line: str, ordered: bool) -> None:
+        # Count numbered list items (e.g., "1. ", "2. ", etc.)
+        if ordered:
+            state["steps"] += 1
 
-        # Find Core Workflow section
-        workflow_match = CORE_WORKFLOW_PATTERN.search(result.body)
-        if not workflow_match:
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
+        # Core Workflow section: content up to next H2 or end of file
+        if not state["found"]:
             return [ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message="Missing '## Core Workflow' section",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             )]
 
-        # Get section content (up to next H2 or end of file)
-        section_start = workflow_match.end()
-        next_section = NEXT_SECTION_PATTERN.search(result.body[section_start:])
-        if next_section:
-            section_content = result.body[section_start:section_start + next_section.start()]
-        else:
-            section_content = result.body[section_start:]
-
-        # Count numbered list items (e.g., "1. ", "2. ", etc.)
-        steps = NUMBERED_STEP_PATTERN.findall(section_content)
-        step_count = len(steps)
-
+        step_count = state["steps"]
         if step_count != 5:
             return [ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message=f"Core Workflow has {step_count} steps (expected 5)",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             )]
 
         return []
 
 
-class WhenToUseFormatChecker(BaseChecker):
+class WhenToUseFormatChecker(DocumentRule):
     """Validates 'When to Use' section uses bullet list format."""
 
     name = "when-to-use-format"
     category = "yaml"
-
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
-            return []
-
-        # Find "When to Use" section (various forms)
-        section_match = WHEN_TO_USE_PATTERN.search(result.body)
-        if not section_match:
-            # Section is optional; don't warn if missing
-            return []
-
-        # Get section content (up to next H2 or end of file)
-        section_start = section_match.end()
-        next_section = NEXT_SECTION_PATTERN.search(result.body[section_start:])
-        if next_section:
-            section_content = result.body[section_start:section_start + next_section.start()]
-        else:
-            section_content = result.body[section_start:]
-
-        # Check for bullet list format
-        lines = section_content.strip().split("\n")
-        content_lines = [line for line in lines if line.strip() and not line.strip().startswith("#")]
-
-        if not content_lines:
+    events = frozenset({"section", "list_item"})
+    section = WHEN_TO_USE_PATTERN
+
+    def start(self, doc: SkillDocument) -> dict:
+        return {"content": 0, "bullets": 0, "last": ""}
+
+    def on_section_line(self, state: dict, lineno: int, line: str) -> None:
+        stripped = line.strip()
+        if stripped:
+            state["last"] = line
+            # Sub-headers inside the section are not content
+            if not stripped.startswith("#"):
+                state["content"] += 1
+
+    def on_list_item(self, state: dict, lineno: int, line: str, ordered: bool) -> None:
+        if not ordered:
+            state["bullets"] += 1
+
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
+        # Section is optional (no content lines when missing); don't warn if missing
+        content = state["content"]
+        if not content:
             return []
 
-        # Check if lines use bullet format (- or *)
-        non_bullet_lines = [
-            line for line in content_lines
-            if line.strip() and not BULLET_PATTERN.match(line)
-        ]
+        # The section is stripped as a whole, so a trailing "- " is not a bullet
+        bullets = state["bullets"]
+        last = state["last"]
+        if BULLET_PATTERN.match(last) and not BULLET_PATTERN.match(last.rstrip()):
+            bullets -= 1
 
         # Allow some non-bullet lines (like sub-items or code blocks), but warn if majority is prose
-        if len(non_bullet_lines) > len(content_lines) // 2:
+        if content - bullets > content // 2:
             return [ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message="'When to Use' section should use bullet list format (- or *)",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             )]
 
         return []
 
 
-class SectionOrderChecker(BaseChecker):
+class SectionOrderChecker(DocumentRule):
     """Validates H2 sections appear in canonical order."""
 
     name = "section-order"
     category = "yaml"
+    events = frozenset({"heading"})
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
-            return []
+    def start(self, doc: SkillDocument) -> dict:
+        return {"found": []}
 
-        # Extract all H2 headers
-        headers = H2_HEADER_PATTERN.findall(result.body)
+    def on_heading(self, state: dict, lineno: int, level: int, title: str) -> None:
+        # Only canonical H2 sections count (ignore non-standard headers)
+        if level == 2 and title in CANONICAL_SECTION_SET:
+            state["found"].append(title)
 
-        # Filter to only canonical sections (ignore non-standard headers)
-        canonical_set = set(CANONICAL_SECTIONS)
-        found_canonical = [h.strip() for h in headers if h.strip() in canonical_set]
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
+        found_canonical = state["found"]
 
         if len(found_canonical) < 2:
             # Not enough canonical sections to check order
@@ -893,51 +1605,276 @@ class SectionOrderChecker(BaseChecker):
             next_idx = CANONICAL_SECTIONS.index(found_canonical[i + 1])
             if current_idx > next_idx:
                 return [ValidationIssue(
-                    skill=skill_name,
+                    skill=doc.skill_name,
                     check=self.name,
                     severity=Severity.WARNING,
                     message=f"Section order: '{section}' should come after '{found_canonical[i + 1]}'",
-                    file=str(result.skill_md),
+                    file=str(doc.skill_md),
                 )]
 
         return []
 
 
-class LineCountChecker(BaseChecker):
+class LineCountChecker(DocumentRule):
     """Validates SKILL.md has 80-100 non-blank lines (excluding frontmatter)."""
 
     name = "line-count"
     category = "yaml"
+    events = frozenset({"line"})
 
-    def check(self, skill_path: Path, skill_name: str) -> list[ValidationIssue]:
-        result = self._extract_frontmatter(skill_path)
-        if result is None:
-            return []
+    def start(self, doc: SkillDocument) -> dict:
+        return {"count": 0}
+
+    def on_line(self, state: dict, lineno: int, line: str) -> None:
+        if line.strip():
+            state["count"] += 1
 
-        # Count non-blank lines
-        non_blank_lines = [line for line in result.body.split("\n") if line.strip()]
-        count = len(non_blank_lines)
+    def finish(self, doc: SkillDocument, state: dict) -> list[ValidationIssue]:
+        count = state["count"]
 
         if count < MIN_NON_BLANK_LINES:
             return [ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message=f"SKILL.md has {count} non-blank lines (minimum {MIN_NON_BLANK_LINES})",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             )]
         elif count > MAX_NON_BLANK_LINES:
             return [ValidationIssue(
-                skill=skill_name,
+                skill=doc.skill_name,
                 check=self.name,
                 severity=Severity.WARNING,
                 message=f"SKILL.md has {count} non-blank lines (maximum {MAX_NON_BLANK_LINES})",
-                file=str(result.skill_md),
+                file=str(doc.skill_md),
             )]
 
         return []
 
 
+# =============================================================================
+# Workflow Catalog
+# =============================================================================
+
+@dataclass
+class CommandDefinition:
+    """A commands/ YAML definition file, read and parsed once per run.
+
+    ``data`` is None when the file is empty or fails to parse; ``error``
+    then holds the parse error.
+    """
+    path: Path
+    rel_path: str
+    data: dict | None = None
+    error: str | None = None
+
+    @property
+    def command(self) -> str:
+        """The ``command`` field, or "" when missing or not a string."""
+        value = self.data.get("command", "") if isinstance(self.data, dict) else ""
+        return value if isinstance(value, str) else ""
+
+
+@dataclass(frozen=True)
+class ManifestCommand:
+    """A command listed in the manifest, under a phase or under ``utilities``."""
+    command: str
+    definition: str
+    phase: str | None = None  # None for utilities
+
+
+class ReferenceIndex:
+    """File references between workflow files, looked up in either direction.
+
+    Sources are definitions and the manifest; each reference has a kind:
+
+    - ``"path"``: definition -> its command .md file
+    - ``"description"``: definition or manifest phase -> its docs page
+    - ``"definition"``: manifest -> a definition file
+
+    Paths are relative to base_path. ``set`` replaces one source's
+    references, so a changed file only updates its own entries.
+    """
+
+    def __init__(self):
+        self._forward: dict[str, set[tuple[str, str]]] = {}
+        self._reverse: dict[str, set[tuple[str, str]]] = {}
+
+    def set(self, source: str, refs: list[tuple[str, object]]) -> None:
+        """Replace the references of ``source`` with ``refs`` (kind, target); non-path targets are skipped."""
+        self.discard(source)
+        edges = {(kind, str(Path(target))) for kind, target in refs if isinstance(target, str) and target}
+        if edges:
+            self._forward[source] = edges
+        for kind, target in edges:
+            self._reverse.setdefault(target, set()).add((kind, source))
+
+    def discard(self, source: str) -> None:
+        for kind, target in self._forward.pop(source, ()):
+            sources = self._reverse[target]
+            sources.discard((kind, source))
+            if not sources:
+                del self._reverse[target]
+
+    def targets(self, source: str, kind: str | None = None) -> list[str]:
+        """What ``source`` references (of ``kind``, if given), sorted."""
+        return sorted(t for k, t in self._forward.get(source, ()) if kind is None or k == kind)
+
+    def sources(self, target: str, kind: str | None = None) -> list[str]:
+        """What references ``target`` (with ``kind``, if given), sorted."""
+        return sorted(s for k, s in self._reverse.get(str(Path(target)), ()) if kind is None or k == kind)
+
+
+class WorkflowCatalog:
+    """The manifest and every commands/**/*.yaml definition, each parsed once.
+
+    The workflow checkers query these instead of re-reading and re-parsing
+    the same files:
+
+    - ``definitions``: every definition file, sorted by path
+    - ``by_command``: ``command`` field -> the definitions declaring it
+    - ``by_phase``: manifest phase -> the commands it lists (``utilities``
+      holds the rest)
+    - ``references``: a ReferenceIndex of what links to what
+    - ``definition(path)``: the definition at a manifest ``definition`` path
+
+    ``update`` reloads only the changed files, for watch and server mode.
+    """
+
+    def __init__(self, base_path: Path, index: TreeIndex):
+        self.base_path = base_path
+        self.index = index
+        self.commands_dir = base_path / COMMANDS_DIR_WORKFLOW
+        self.manifest_path = base_path / MANIFEST_FILE
+        self.manifest_source = str(Path(MANIFEST_FILE))
+        self.has_commands_dir = index.exists(self.commands_dir)
+
+        self._by_file: dict[Path, CommandDefinition] = {}
+        self.definitions: list[CommandDefinition] = []
+        self.by_command: dict[str, list[CommandDefinition]] = {}
+        self.references = ReferenceIndex()
+        if self.has_commands_dir:
+            for yaml_file in sorted(index.rglob(self.commands_dir, "*.yaml")):
+                if yaml_file.name != "workflow-manifest.yaml":
+                    self._add_definition(self._load(yaml_file))
+
+        self._load_manifest()
+
+    def _load(self, path: Path) -> CommandDefinition:
+        definition = CommandDefinition(path=path, rel_path=str(path.relative_to(self.base_path)))
+        try:
+            # parse_yaml returns {} for an empty document; keep it as None
+            definition.data = parse_yaml(self.index.read_text(path)) or None
+        except Exception as e:
+            definition.error = str(e)
+        self._by_file[path] = definition
+        return definition
+
+    def _add_definition(self, definition: CommandDefinition) -> None:
+        self.definitions.append(definition)
+        self.by_command.setdefault(definition.command, []).append(definition)
+        if isinstance(definition.data, dict):
+            self.references.set(definition.rel_path, [
+                ("path", definition.data.get("path")),
+                ("description", definition.data.get("description")),
+            ])
+
+    def _remove_definition(self, path: Path) -> None:
+        definition = self._by_file.pop(path, None)
+        if definition is None or definition not in self.definitions:
+            return
+        self.definitions.remove(definition)
+        declaring = self.by_command[definition.command]
+        declaring.remove(definition)
+        if not declaring:
+            del self.by_command[definition.command]
+        self.references.discard(definition.rel_path)
+
+    def _load_manifest(self) -> None:
+        self.manifest: dict | None = None
+        self.manifest_error: str | None = None
+        self.by_phase: dict[str, list[ManifestCommand]] = {}
+        self.utilities: list[ManifestCommand] = []
+        self.references.discard(self.manifest_source)
+        if not self.index.exists(self.manifest_path):
+            return
+        try:
+            self.manifest = parse_yaml(self.index.read_text(self.manifest_path))
+        except Exception as e:
+            self.manifest_error = str(e)
+        if not isinstance(self.manifest, dict):
+            return
+
+        refs = []
+        phases = self.manifest.get("phases", {})
+        if isinstance(phases, dict):
+            for phase_name, phase_data in phases.items():
+                if not isinstance(phase_data, dict):
+                    continue
+                refs.append(("description", phase_data.get("description")))
+                commands = phase_data.get("commands", [])
+                self.by_phase[phase_name] = [
+                    ManifestCommand(cmd.get("command", ""), cmd.get("definition", ""), phase_name)
+                    for cmd in (commands if isinstance(commands, list) else [])
+                    if isinstance(cmd, dict)
+                ]
+        utilities = self.manifest.get("utilities", [])
+        if isinstance(utilities, list):
+            self.utilities = [
+                ManifestCommand(util.get("command", ""), util.get("definition", ""))
+                for util in utilities
+                if isinstance(util, dict)
+            ]
+        refs.extend(("definition", cmd.definition) for cmd in self.manifest_commands)
+        self.references.set(self.manifest_source, refs)
+
+    def update(self, changed: set[Path], index: TreeIndex) -> None:
+        """Reload the definitions and manifest among ``changed`` from the fresh ``index``."""
+        self.index = index
+        self.has_commands_dir = index.exists(self.commands_dir)
+        base = self.base_path.resolve()
+        commands_root = self.commands_dir.resolve()
+        reload_manifest = False
+        for changed_path in changed:
+            full = changed_path.resolve()
+            if not full.is_relative_to(base):
+                continue
+            path = self.base_path / full.relative_to(base)
+            if path == self.manifest_path:
+                reload_manifest = True
+                continue
+            self._remove_definition(path)
+            if (
+                full.is_relative_to(commands_root) and path.suffix == ".yaml"
+                and path.name != "workflow-manifest.yaml" and index.exists(path)
+            ):
+                self._add_definition(self._load(path))
+        self.definitions.sort(key=lambda d: d.path)
+        for declaring in self.by_command.values():
+            declaring.sort(key=lambda d: d.path)
+        if reload_manifest:
+            self._load_manifest()
+
+    @property
+    def manifest_commands(self) -> list[ManifestCommand]:
+        """Every command the manifest lists: phases in order, then utilities."""
+        return [cmd for commands in self.by_phase.values() for cmd in commands] + self.utilities
+
+    def definition(self, rel_path: str) -> CommandDefinition | None:
+        """The definition at ``rel_path`` (relative to base_path), or None if no such file.
+
+        Paths outside commands/ are loaded on first use and kept.
+        """
+        if not rel_path:
+            return None
+        path = self.base_path / rel_path
+        if path in self._by_file:
+            return self._by_file[path]
+        if not self.index.exists(path):
+            return None
+        return self._load(path)
+
+
 # =============================================================================
 # Workflow Checkers
 # =============================================================================
@@ -947,25 +1884,24 @@ class WorkflowDefinitionChecker:
 
     name = "workflow-definition"
 
-    def check(self, base_path: Path) -> list[ValidationIssue]:
+    def __init__(self, only: set[Path] | None = None):
+        # Definition paths (relative to base_path) to validate; None means all
+        self.only = only
+
+    def check(self, catalog: WorkflowCatalog) -> list[ValidationIssue]:
         issues = []
-        commands_dir = base_path / COMMANDS_DIR_WORKFLOW
 
-        if not commands_dir.exists():
+        if not catalog.has_commands_dir:
             issues.append(ValidationIssue(
                 skill="__workflow__",
                 check=self.name,
                 severity=Severity.ERROR,
-                message=f"Commands directory not found: {commands_dir}",
+                message=f"Commands directory not found: {catalog.commands_dir}",
             ))
             return issues
 
-        yaml_files = sorted([
-            f for f in commands_dir.rglob("*.yaml")
-            if f.name != "workflow-manifest.yaml"
-        ])
-
-        if not yaml_files:
+        definitions = catalog.definitions
+        if not definitions:
             issues.append(ValidationIssue(
                 skill="__workflow__",
                 check=self.name,
@@ -974,34 +1910,38 @@ class WorkflowDefinitionChecker:
             ))
             return issues
 
-        for yaml_file in yaml_files:
-            rel_path = str(yaml_file.relative_to(base_path))
-            issues.extend(self._validate_definition(yaml_file, rel_path, base_path))
+        if self.only is not None:
+            definitions = [d for d in definitions if d.path.relative_to(catalog.base_path) in self.only]
+
+        for definition in definitions:
+            issues.extend(self._validate_definition(definition, catalog))
 
         return issues
 
     def _validate_definition(
-        self, yaml_file: Path, rel_path: str, base_path: Path
+        self, definition: CommandDefinition, catalog: WorkflowCatalog
     ) -> list[ValidationIssue]:
         issues = []
+        rel_path = definition.rel_path
+        base_path = catalog.base_path
+        index = catalog.index
 
-        try:
-            data = parse_yaml(yaml_file.read_text())
-            if data is None:
-                issues.append(ValidationIssue(
-                    skill=rel_path,
-                    check=self.name,
-                    severity=Severity.ERROR,
-                    message="YAML file is empty",
-                    file=rel_path,
-                ))
-                return issues
-        except Exception as e:
+        if definition.error is not None:
+            issues.append(ValidationIssue(
+                skill=rel_path,
+                check=self.name,
+                severity=Severity.ERROR,
+                message=f"YAML parse error: {definition.error}",
+                file=rel_path,
+            ))
+            return issues
+        data = definition.data
+        if data is None:
             issues.append(ValidationIssue(
                 skill=rel_path,
                 check=self.name,
                 severity=Severity.ERROR,
-                message=f"YAML parse error: {e}",
+                message="YAML file is empty",
                 file=rel_path,
             ))
             return issues
@@ -1020,6 +1960,17 @@ class WorkflowDefinitionChecker:
                     file=rel_path,
                 ))
 
+        # Each command is defined by exactly one file
+        others = [d.rel_path for d in catalog.by_command.get(definition.command, []) if d is not definition]
+        if definition.command and others:
+            issues.append(ValidationIssue(
+                skill=rel_path,
+                check=self.name,
+                severity=Severity.ERROR,
+                message=f"Command '{definition.command}' is also defined in: {', '.join(others)}",
+                file=rel_path,
+            ))
+
         if not is_utility and "phase" not in data:
             issues.append(ValidationIssue(
                 skill=rel_path,
@@ -1067,7 +2018,7 @@ class WorkflowDefinitionChecker:
         # Validate path resolves (when status is existing)
         cmd_path = data.get("path", "")
         if cmd_path and status == "existing":
-            if not (base_path / cmd_path).exists():
+            if not index.exists(base_path / cmd_path):
                 issues.append(ValidationIssue(
                     skill=rel_path,
                     check=self.name,
@@ -1079,7 +2030,7 @@ class WorkflowDefinitionChecker:
         # Validate description path resolves
         desc_path = data.get("description", "")
         if desc_path:
-            if not (base_path / desc_path).exists():
+            if not index.exists(base_path / desc_path):
                 issues.append(ValidationIssue(
                     skill=rel_path,
                     check=self.name,
@@ -1153,15 +2104,25 @@ class WorkflowDefinitionChecker:
 
 
 class ManifestDagChecker:
-    """Validates workflow-manifest.yaml structure and DAG integrity."""
+    """Validates workflow-manifest.yaml structure and DAG integrity.
 
-    name = "manifest-dag"
+    After ``check``, ``graph`` holds the phase dependency analysis (None when
+    the manifest is missing, unreadable or has no phases).
+    """
+
+    name = "manifest-dag"
 
-    def check(self, base_path: Path) -> list[ValidationIssue]:
+    def __init__(self):
+        self.graph: PhaseGraph | None = None
+
+    def check(self, catalog: WorkflowCatalog) -> list[ValidationIssue]:
         issues = []
-        manifest_path = base_path / MANIFEST_FILE
+        self.graph = None
+        base_path = catalog.base_path
+        index = catalog.index
+        manifest_path = catalog.manifest_path
 
-        if not manifest_path.exists():
+        if not index.exists(manifest_path):
             issues.append(ValidationIssue(
                 skill="__manifest__",
                 check=self.name,
@@ -1170,23 +2131,22 @@ class ManifestDagChecker:
             ))
             return issues
 
-        try:
-            data = parse_yaml(manifest_path.read_text())
-            if data is None:
-                issues.append(ValidationIssue(
-                    skill="__manifest__",
-                    check=self.name,
-                    severity=Severity.ERROR,
-                    message="Manifest is empty",
-                    file=str(manifest_path),
-                ))
-                return issues
-        except Exception as e:
+        if catalog.manifest_error is not None:
             issues.append(ValidationIssue(
                 skill="__manifest__",
                 check=self.name,
                 severity=Severity.ERROR,
-                message=f"YAML parse error: {e}",
+                message=f"YAML parse error: {catalog.manifest_error}",
+                file=str(manifest_path),
+            ))
+            return issues
+        data = catalog.manifest
+        if data is None:
+            issues.append(ValidationIssue(
+                skill="__manifest__",
+                check=self.name,
+                severity=Severity.ERROR,
+                message="Manifest is empty",
                 file=str(manifest_path),
             ))
             return issues
@@ -1218,7 +2178,7 @@ class ManifestDagChecker:
 
             # Check description path
             desc = phase_data.get("description", "")
-            if desc and not (base_path / desc).exists():
+            if desc and not index.exists(base_path / desc):
                 issues.append(ValidationIssue(
                     skill="__manifest__",
                     check=self.name,
@@ -1252,71 +2212,59 @@ class ManifestDagChecker:
                             ))
 
             # Check commands
-            commands = phase_data.get("commands", [])
-            if isinstance(commands, list):
-                for cmd in commands:
-                    if isinstance(cmd, dict):
-                        cmd_name = cmd.get("command", "")
-                        if cmd_name:
-                            if cmd_name in all_commands:
-                                issues.append(ValidationIssue(
-                                    skill="__manifest__",
-                                    check=self.name,
-                                    severity=Severity.ERROR,
-                                    message=f"Duplicate command: '{cmd_name}'",
-                                    file=str(manifest_path),
-                                ))
-                            all_commands.add(cmd_name)
-
-                        definition = cmd.get("definition", "")
-                        if definition and not (base_path / definition).exists():
-                            issues.append(ValidationIssue(
-                                skill="__manifest__",
-                                check=self.name,
-                                severity=Severity.ERROR,
-                                message=f"Command '{cmd_name}' definition not found: {definition}",
-                                file=str(manifest_path),
-                            ))
-
-        # Check utilities
-        utilities = data.get("utilities", [])
-        if isinstance(utilities, list):
-            for util in utilities:
-                if isinstance(util, dict):
-                    cmd_name = util.get("command", "")
-                    if cmd_name:
-                        if cmd_name in all_commands:
-                            issues.append(ValidationIssue(
-                                skill="__manifest__",
-                                check=self.name,
-                                severity=Severity.ERROR,
-                                message=f"Duplicate command: '{cmd_name}'",
-                                file=str(manifest_path),
-                            ))
-                        all_commands.add(cmd_name)
-
-                    definition = util.get("definition", "")
-                    if definition and not (base_path / definition).exists():
+            for cmd in catalog.by_phase.get(phase_name, []):
+                if cmd.command:
+                    if cmd.command in all_commands:
                         issues.append(ValidationIssue(
                             skill="__manifest__",
                             check=self.name,
                             severity=Severity.ERROR,
-                            message=f"Utility '{cmd_name}' definition not found: {definition}",
+                            message=f"Duplicate command: '{cmd.command}'",
                             file=str(manifest_path),
                         ))
+                    all_commands.add(cmd.command)
+
+                if cmd.definition and not index.exists(base_path / cmd.definition):
+                    issues.append(ValidationIssue(
+                        skill="__manifest__",
+                        check=self.name,
+                        severity=Severity.ERROR,
+                        message=f"Command '{cmd.command}' definition not found: {cmd.definition}",
+                        file=str(manifest_path),
+                    ))
+
+        # Check utilities
+        for util in catalog.utilities:
+            if util.command:
+                if util.command in all_commands:
+                    issues.append(ValidationIssue(
+                        skill="__manifest__",
+                        check=self.name,
+                        severity=Severity.ERROR,
+                        message=f"Duplicate command: '{util.command}'",
+                        file=str(manifest_path),
+                    ))
+                all_commands.add(util.command)
+
+            if util.definition and not index.exists(base_path / util.definition):
+                issues.append(ValidationIssue(
+                    skill="__manifest__",
+                    check=self.name,
+                    severity=Severity.ERROR,
+                    message=f"Utility '{util.command}' definition not found: {util.definition}",
+                    file=str(manifest_path),
+                ))
 
         # DAG cycle detection
         issues.extend(self._detect_cycles(phases, manifest_path))
 
         # Cross-check: manifest commands match their definition files
-        issues.extend(self._check_definition_consistency(
-            phases, utilities, base_path, manifest_path
-        ))
+        issues.extend(self._check_definition_consistency(catalog))
 
         return issues
 
     def _detect_cycles(self, phases: dict, manifest_path: Path) -> list[ValidationIssue]:
-        """Detect cycles in the phase dependency graph using DFS."""
+        """Analyze the phase dependency graph into ``self.graph``; report each cycle."""
         issues = []
 
         # Build adjacency list
@@ -1332,79 +2280,39 @@ class ManifestDagChecker:
                         deps.append(dep_phase)
             graph[phase_name] = deps
 
-        color = {node: DFSColor.WHITE for node in graph}
-        path: list[str] = []
-
-        def dfs(node: str) -> None:
-            color[node] = DFSColor.GRAY
-            path.append(node)
-            for neighbor in graph.get(node, []):
-                if neighbor not in color:
-                    continue  # Reference to undefined phase (caught elsewhere)
-                if color[neighbor] == DFSColor.GRAY:
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    issues.append(ValidationIssue(
-                        skill="__manifest__",
-                        check=self.name,
-                        severity=Severity.ERROR,
-                        message=f"DAG cycle detected: {' -> '.join(cycle)}",
-                        file=str(manifest_path),
-                    ))
-                    path.pop()
-                    return
-                if color[neighbor] == DFSColor.WHITE:
-                    dfs(neighbor)
-            path.pop()
-            color[node] = DFSColor.BLACK
-
-        for node in graph:
-            if color[node] == DFSColor.WHITE:
-                dfs(node)
+        self.graph = PhaseGraph.analyze(graph)
+        for cycle in self.graph.cycles:
+            issues.append(ValidationIssue(
+                skill="__manifest__",
+                check=self.name,
+                severity=Severity.ERROR,
+                message=f"DAG cycle detected: {' -> '.join(cycle)}",
+                file=str(manifest_path),
+            ))
 
         return issues
 
-    def _check_definition_consistency(
-        self,
-        phases: dict,
-        utilities: list,
-        base_path: Path,
-        manifest_path: Path,
-    ) -> list[ValidationIssue]:
+    def _check_definition_consistency(self, catalog: WorkflowCatalog) -> list[ValidationIssue]:
         """Verify manifest command names match the command field in their YAML definitions."""
         issues = []
 
-        def check_cmd(cmd_name: str, definition_path: str):
-            full_path = base_path / definition_path
-            if not full_path.exists():
-                return  # Missing file already reported
-            try:
-                data = parse_yaml(full_path.read_text())
-                if data and data.get("command", "") != cmd_name:
-                    issues.append(ValidationIssue(
-                        skill="__manifest__",
-                        check=self.name,
-                        severity=Severity.ERROR,
-                        message=(
-                            f"Manifest command '{cmd_name}' doesn't match "
-                            f"definition command '{data.get('command', '')}' in {definition_path}"
-                        ),
-                        file=str(manifest_path),
-                    ))
-            except Exception:
-                pass  # Parse errors reported elsewhere
-
-        for phase_data in phases.values():
-            if not isinstance(phase_data, dict):
+        for cmd in catalog.manifest_commands:
+            definition = catalog.definition(cmd.definition)
+            # Missing files and parse errors are reported elsewhere
+            if definition is None or not isinstance(definition.data, dict) or not definition.data:
                 continue
-            for cmd in phase_data.get("commands", []):
-                if isinstance(cmd, dict):
-                    check_cmd(cmd.get("command", ""), cmd.get("definition", ""))
-
-        if isinstance(utilities, list):
-            for util in utilities:
-                if isinstance(util, dict):
-                    check_cmd(util.get("command", ""), util.get("definition", ""))
+            declared = definition.data.get("command", "")
+            if declared != cmd.command:
+                issues.append(ValidationIssue(
+                    skill="__manifest__",
+                    check=self.name,
+                    severity=Severity.ERROR,
+                    message=(
+                        f"Manifest command '{cmd.command}' doesn't match "
+                        f"definition command '{declared}' in {cmd.definition}"
+                    ),
+                    file=str(catalog.manifest_path),
+                ))
 
         return issues
 
@@ -1414,34 +2322,22 @@ class WorkflowOrphanChecker:
 
     name = "workflow-orphans"
 
-    def check(self, base_path: Path) -> list[ValidationIssue]:
+    def check(self, catalog: WorkflowCatalog) -> list[ValidationIssue]:
         issues = []
-        commands_dir = base_path / COMMANDS_DIR_WORKFLOW
+        base_path = catalog.base_path
 
-        if not commands_dir.exists():
+        if not catalog.has_commands_dir:
             return issues
 
-        # Collect path references from all per-command YAML files
-        referenced_paths = set()
-        for yaml_file in commands_dir.rglob("*.yaml"):
-            if yaml_file.name == "workflow-manifest.yaml":
-                continue
-            try:
-                data = parse_yaml(yaml_file.read_text())
-                if data and "path" in data:
-                    referenced_paths.add(data["path"])
-            except Exception:
-                pass  # Parse errors reported by WorkflowDefinitionChecker
-
         # Collect command .md files (exclude references/, skip COMMAND.md pattern)
-        for md_file in sorted(commands_dir.rglob("*.md")):
+        for md_file in sorted(catalog.index.rglob(catalog.commands_dir, "*.md")):
             if "references" in md_file.parts:
                 continue
             if md_file.name == "COMMAND.md":
                 continue
 
             md_rel = str(md_file.relative_to(base_path))
-            if md_rel not in referenced_paths:
+            if not catalog.references.sources(md_rel, "path"):
                 issues.append(ValidationIssue(
                     skill="__orphans__",
                     check=self.name,
@@ -1460,28 +2356,29 @@ class WorkflowOrphanChecker:
 class CountConsistencyChecker:
     """Validates count consistency across documentation files."""
 
-    def check(self, skills_dir: Path) -> list[ValidationIssue]:
+    def check(self, skills_dir: Path, index: TreeIndex) -> list[ValidationIssue]:
         issues = []
         base_path = skills_dir.parent
 
         # Count actual skills
         skill_count = sum(
-            1 for d in skills_dir.iterdir()
-            if d.is_dir() and (d / "SKILL.md").exists()
+            1 for d in index.iterdir(skills_dir)
+            if index.is_dir(d) and index.exists(d / "SKILL.md")
         )
 
-        # Count actual reference files
+        # Count actual reference files (any references/*.md under skills/)
         ref_count = sum(
-            1 for ref in skills_dir.rglob("references/*.md")
+            1 for ref in index.rglob(skills_dir, "*.md")
+            if ref.parent.name == "references"
         )
 
         # Check each file for count mentions
         for file_path in COUNT_FILES:
             full_path = base_path / file_path
-            if not full_path.exists():
+            if not index.exists(full_path):
                 continue
 
-            content = full_path.read_text()
+            content = index.read_text(full_path)
 
             # Check for skill count mentions
             skill_patterns = [
@@ -1532,21 +2429,174 @@ class CountConsistencyChecker:
 class WorkflowValidator:
     """Orchestrates workflow definition and manifest validation."""
 
-    def __init__(self, base_path: Path):
+    def __init__(
+        self,
+        base_path: Path,
+        definitions: set[Path] | None = None,
+        index: TreeIndex | None = None,
+        budget: IssueBudget | None = None,
+        catalog: WorkflowCatalog | None = None,
+    ):
         self.base_path = base_path
+        self.index = index or TreeIndex([base_path / COMMANDS_DIR_WORKFLOW, base_path / "docs"])
+        self.budget = budget or IssueBudget()
+        self.catalog = catalog  # Loaded by validate() unless an up-to-date one is passed in
+        self.manifest_checker = ManifestDagChecker()
         self.checkers = [
-            WorkflowDefinitionChecker(),
-            ManifestDagChecker(),
+            WorkflowDefinitionChecker(only=definitions),
+            self.manifest_checker,
             WorkflowOrphanChecker(),
         ]
 
-    def validate(self) -> list[ValidationIssue]:
+    @property
+    def phase_graph(self) -> PhaseGraph | None:
+        """The manifest's phase dependency analysis from the last ``validate``."""
+        return self.manifest_checker.graph
+
+    def validate(self, on_issues: Callable[[list[ValidationIssue]], None] | None = None) -> list[ValidationIssue]:
+        """Run the workflow checkers; ``on_issues`` gets each checker's issues as it finishes.
+
+        The manifest and definitions are loaded once into a WorkflowCatalog
+        that every checker queries.
+        """
         issues = []
-        for checker in self.checkers:
-            issues.extend(checker.check(self.base_path))
+        with PROFILER.measure("phase", "check"):
+            if self.budget.spent():
+                return issues
+            if self.catalog is None:
+                with PROFILER.measure("checker", "WorkflowCatalog"):
+                    self.catalog = WorkflowCatalog(self.base_path, self.index)
+            for checker in self.checkers:
+                if self.budget.spent():
+                    break
+                with PROFILER.measure("checker", type(checker).__name__):
+                    found = self.budget.take(checker.check(self.catalog))
+                issues.extend(found)
+                if on_issues:
+                    on_issues(found)
         return issues
 
 
+# =============================================================================
+# Change Scope
+# =============================================================================
+
+@dataclass
+class ChangeScope:
+    """What needs validating after a set of file changes (None means everything)."""
+    skills: set[str] | None = field(default_factory=set)
+    definitions: set[Path] | None = field(default_factory=set)
+
+    @classmethod
+    def from_paths(cls, changed: list[Path], skills_dir: Path, base_path: Path) -> "ChangeScope":
+        """Map changed files to the skill directories and workflow definitions they affect.
+
+        Deleting a skill can break ``related-skills`` anywhere, so it widens the
+        scope to every skill. Any change under docs/ may break a definition's
+        description path, so it widens the scope to every definition.
+        """
+        scope = cls()
+        skills_root = skills_dir.resolve()
+        commands_root = (base_path / COMMANDS_DIR_WORKFLOW).resolve()
+        docs_root = (base_path / "docs").resolve()
+
+        for path in changed:
+            full = path.resolve()
+            if full.is_relative_to(skills_root):
+                parts = full.relative_to(skills_root).parts
+                if len(parts) < 2 or parts[0].startswith((".", "_")):
+                    continue
+                if not (skills_root / parts[0]).is_dir():
+                    scope.skills = None
+                elif scope.skills is not None:
+                    scope.skills.add(parts[0])
+            elif full.is_relative_to(commands_root) and scope.definitions is not None:
+                if full.suffix == ".yaml":
+                    if full.name != Path(MANIFEST_FILE).name:
+                        scope.definitions.add(full.relative_to(base_path.resolve()))
+                elif full.parent.is_dir():
+                    # COMMAND.md and friends live beside the definition that points at them
+                    scope.definitions.update(
+                        f.relative_to(base_path.resolve()) for f in full.parent.glob("*.yaml")
+                    )
+            elif full.is_relative_to(docs_root):
+                scope.definitions = None
+
+        return scope
+
+
+# =============================================================================
+# Validation Cache
+# =============================================================================
+
+class ValidationCache:
+    """On-disk store of per-skill issue lists, keyed by a content hash.
+
+    Each skill gets one JSON file under ``<cache_dir>/skills/``. An entry is
+    reused only when its key matches, and the key covers everything a skill's
+    checks read: SKILL.md and references/*.md contents, the skill's path, the
+    active checkers, the set of sibling skill names (``related-skills`` is a
+    cross-skill check) and a fingerprint of this script and common.py, so any
+    change to the validator or its constants invalidates the whole cache. Global checks
+    (counts, workflows) are cheap and always re-run.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.skills_dir = cache_dir / "skills"
+
+    @staticmethod
+    def fingerprint() -> bytes:
+        """Hash of the validator itself and the YAML backend it runs with."""
+        import hashlib
+
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(Path(__file__).with_name("common.py").read_bytes())
+        digest.update(b"pyyaml" if load_pyyaml() else b"simple")
+        return digest.digest()
+
+    @staticmethod
+    def skill_key(skill_dir: Path, salt: bytes, index: TreeIndex) -> str:
+        """Hash the inputs of every per-skill check for ``skill_dir``."""
+        import hashlib
+
+        digest = hashlib.sha256(salt)
+        digest.update(str(skill_dir).encode())
+        refs_dir = skill_dir / "references"
+        digest.update(b"\0refs-exists=%d refs-dir=%d" % (index.exists(refs_dir), index.is_dir(refs_dir)))
+        files = [skill_dir / "SKILL.md"]
+        if index.is_dir(refs_dir):
+            files.extend(sorted(index.glob(refs_dir, "*.md")))
+        for path in files:
+            digest.update(b"\0" + path.name.encode() + b"\0")
+            if index.is_file(path):
+                digest.update(hashlib.sha256(index.read_bytes(path)).digest())
+            else:
+                digest.update(b"<missing>")
+        return digest.hexdigest()
+
+    def get(self, skill: str, key: str) -> list[ValidationIssue] | None:
+        """Return cached issues for ``skill`` if stored under ``key``."""
+        import json
+
+        try:
+            entry = json.loads((self.skills_dir / f"{skill}.json").read_text())
+            if entry.get("key") != key:
+                return None
+            return [ValidationIssue.from_dict(i) for i in entry["issues"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, skill: str, key: str, issues: list[ValidationIssue]) -> None:
+        """Store issues for ``skill``; failures to write are ignored."""
+        import json
+
+        entry = {"key": key, "issues": [i.to_dict() for i in issues]}
+        try:
+            write_atomic(self.skills_dir / f"{skill}.json", json.dumps(entry))
+        except OSError:
+            pass
+
+
 # =============================================================================
 # Formatters
 # =============================================================================
@@ -1563,6 +2613,9 @@ class TableFormatter:
         lines.append("=" * 80)
         lines.append("")
 
+        if report.summary_only:
+            self._format_counts(report, lines)
+
         # Skill issues
         skills_with_issues = [r for r in report.results if r.issues]
         if skills_with_issues:
@@ -1601,9 +2654,13 @@ class TableFormatter:
         lines.append("=" * 80)
         lines.append("SUMMARY")
         lines.append("=" * 80)
-        lines.append(f"  Skills validated: {len(report.results)}")
+        lines.append(f"  Skills validated: {report.skills}")
         lines.append(f"  Total errors:     {report.total_errors}")
         lines.append(f"  Total warnings:   {report.total_warnings}")
+        if report.truncated:
+            lines.append("  Truncated:        stopped early (--fail-fast/--max-issues); later checks were skipped")
+        if report.shard:
+            lines.append(f"  Shard:            {report.shard} (count and workflow checks run in --merge)")
         lines.append("")
 
         if report.has_errors:
@@ -1617,13 +2674,60 @@ class TableFormatter:
         return "\n".join(lines)
 
 
+    @staticmethod
+    def _format_counts(report: ValidationReport, lines: list[str]) -> None:
+        """Per-check counts and the issue sample kept by summary-only reports."""
+        if report.by_check:
+            lines.append("ISSUES BY CHECK:")
+            lines.append("-" * 80)
+            for check, counts in sorted(report.by_check.items()):
+                lines.append(f"  {check:<32}{counts['error']:>8} errors{counts['warning']:>8} warnings")
+            lines.append("")
+        if report.sampled:
+            total = report.total_errors + report.total_warnings
+            lines.append(f"SAMPLE ({len(report.sampled)} of {total} issues):")
+            lines.append("-" * 80)
+            for issue in report.sampled:
+                icon = "ERROR" if issue.severity == Severity.ERROR else "WARN "
+                file_info = f" ({issue.file})" if issue.file else ""
+                lines.append(f"  [{icon}] {issue.skill}: {issue.check}: {issue.message}{file_info}")
+
+
 class JsonFormatter:
     """Machine-readable JSON output."""
 
     def format(self, report: ValidationReport) -> str:
+        import json
+
         return json.dumps(report.to_dict(), indent=2)
 
 
+class NdjsonFormatter:
+    """Streaming newline-delimited JSON: one line per issue as it is produced, then a summary.
+
+    Issue lines are ``ValidationIssue.to_dict()`` with ``"type": "issue"``;
+    the last line is ``{"type": "summary", ...}`` with the --format json
+    summary. Issues come out in the order --format json lists them.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def emit(self, issues: list[ValidationIssue]) -> None:
+        """Write ``issues`` and flush, so consumers see them before the run ends."""
+        import json
+
+        for issue in issues:
+            self.stream.write(json.dumps({"type": "issue", **issue.to_dict()}) + "\n")
+        if issues:
+            self.stream.flush()
+
+    def format(self, report: ValidationReport) -> str:
+        import json
+
+        return json.dumps({"type": "summary", **report.summary})
+
+
 # =============================================================================
 # Skill Validator
 # =============================================================================
@@ -1636,10 +2740,23 @@ class SkillValidator:
         skills_dir: str = SKILLS_DIR,
         check_category: str | None = None,
         skill_filter: str | None = None,
+        jobs: int = 1,
+        cache_dir: str | None = CACHE_DIR,
+        only_skills: set[str] | None = None,
+        index: TreeIndex | None = None,
+        budget: IssueBudget | None = None,
+        shard: tuple[int, int] | None = None,
     ):
         self.skills_dir = Path(skills_dir)
+        self.index = index or TreeIndex(index_roots(self.skills_dir, Path(".")))
         self.check_category = check_category
         self.skill_filter = skill_filter
+        self.only_skills = only_skills
+        self.shard = shard
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.cache = ValidationCache(Path(cache_dir)) if cache_dir else None
+        self._cache_salt = b""
+        self.budget = budget or IssueBudget()
 
         # Register all checkers
         all_checkers = [
@@ -1665,25 +2782,30 @@ class SkillValidator:
             self.checkers = [c for c in all_checkers if c.category == check_category]
         else:
             self.checkers = all_checkers
+        self.engine = RuleEngine([c for c in self.checkers if isinstance(c, DocumentRule)])
 
         self.count_checker = CountConsistencyChecker()
 
-    def validate(self) -> ValidationReport:
-        """Run all validations and return report."""
-        report = ValidationReport()
+    @property
+    def runs_count_check(self) -> bool:
+        """Count consistency is skipped when filtering to a single skill, category or shard."""
+        return not self.skill_filter and not self.check_category and not self.shard
 
-        # Find all skill directories
-        if not self.skills_dir.exists():
+    def find_skill_dirs(self) -> list[Path]:
+        """Return every skill directory, sorted by name."""
+        if not self.index.exists(self.skills_dir):
             print(f"Error: Skills directory not found: {self.skills_dir}")
             sys.exit(1)
 
         # Directories prefixed with "_" (e.g. _shared) hold assets shared across
         # skills, not skills themselves. Skip them; they have no SKILL.md.
-        skill_dirs = sorted([
-            d for d in self.skills_dir.iterdir()
-            if d.is_dir() and not d.name.startswith((".", "_"))
+        return sorted([
+            d for d in self.index.iterdir(self.skills_dir)
+            if self.index.is_dir(d) and not d.name.startswith((".", "_"))
         ])
 
+    def select_skill_dirs(self, skill_dirs: list[Path]) -> list[Path]:
+        """Apply the --skill filter, any changed-subset restriction and the --shard slice."""
         # Filter to specific skill if requested
         if self.skill_filter:
             skill_dirs = [d for d in skill_dirs if d.name == self.skill_filter]
@@ -1691,20 +2813,540 @@ class SkillValidator:
                 print(f"Error: Skill not found: {self.skill_filter}")
                 sys.exit(1)
 
-        # Run checks on each skill
-        for skill_dir in skill_dirs:
-            result = ValidationResult(skill=skill_dir.name)
-            for checker in self.checkers:
-                issues = checker.check(skill_dir, skill_dir.name)
-                result.issues.extend(issues)
-            report.results.append(result)
+        # Restrict to a changed subset (counts still run: they are global and cheap)
+        if self.only_skills is not None:
+            skill_dirs = [d for d in skill_dirs if d.name in self.only_skills]
+
+        # Keep this job's slice; the other shards' jobs check the rest
+        if self.shard:
+            skill_dirs = [d for d in skill_dirs if in_shard(d.name, self.shard)]
+
+        return skill_dirs
+
+    def validate(self, report: ValidationReport | None = None) -> ValidationReport:
+        """Run all validations, adding each skill's result to ``report`` as soon as it is final."""
+        if report is None:
+            report = ValidationReport()
+
+        all_skill_dirs = self.find_skill_dirs()
+        if self.cache:
+            import hashlib
+
+            salt = hashlib.sha256(ValidationCache.fingerprint())
+            salt.update(",".join(c.name for c in self.checkers).encode())
+            salt.update(b"\0" + ",".join(d.name for d in all_skill_dirs).encode())
+            self._cache_salt = salt.digest()
+        skill_dirs = self.select_skill_dirs(all_skill_dirs)
+
+        # Run checks on each skill. Chunk results are read in submission order,
+        # so parallel output is identical to a serial run. The validator (and
+        # its index) is shipped to each worker once, not once per task.
+        # Profiling stays serial: worker processes have their own profilers.
+        if self.jobs > 1 and len(skill_dirs) > 1 and not PROFILER.enabled:
+            self._validate_parallel(skill_dirs, report)
+        else:
+            for skill_dir in skill_dirs:
+                if self.budget.spent():
+                    break
+                report.add_result(self._validate_skill(skill_dir, self.budget))
 
-        # Run count consistency check (unless filtering to single skill or category)
-        if not self.skill_filter and not self.check_category:
-            report.count_issues = self.count_checker.check(self.skills_dir)
+        self._check_counts(report)
+        report.truncated = self.budget.truncated
+        return report
 
+    def merge(self, results: list[ValidationResult], report: ValidationReport) -> ValidationReport:
+        """Add per-skill ``results`` from --shard runs to ``report``, then run the count check once."""
+        for result in sorted(results, key=lambda r: r.skill):
+            if self.budget.spent():
+                break
+            report.add_result(ValidationResult(result.skill, self.budget.take(result.issues)))
+        self._check_counts(report)
+        report.truncated = report.truncated or self.budget.truncated
         return report
 
+    def _check_counts(self, report: ValidationReport) -> None:
+        """Run count consistency check (unless filtering to single skill, category or shard)."""
+        if self.runs_count_check and not self.budget.spent():
+            with PROFILER.measure("phase", "check"), PROFILER.measure("checker", "CountConsistencyChecker"):
+                report.add_count_issues(self.budget.take(self.count_checker.check(self.skills_dir, self.index)))
+
+    def _validate_parallel(self, skill_dirs: list[Path], report: ValidationReport) -> None:
+        """Validate ``skill_dirs`` in a process pool, stopping it once the budget is spent.
+
+        Each worker checks its chunk against a fresh copy of the budget: a
+        chunk that spends it alone would exhaust the shared one too, so the
+        rest of the chunk is not needed. Once the shared budget is spent,
+        queued chunks are cancelled and running ones stop at their next skill.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        context = multiprocessing.get_context()
+        cancelled = context.Event()
+        chunksize = max(1, len(skill_dirs) // (self.jobs * 4))
+        chunks = [skill_dirs[i:i + chunksize] for i in range(0, len(skill_dirs), chunksize)]
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self, cancelled),
+        ) as executor:
+            futures = [executor.submit(_validate_chunk_in_worker, chunk) for chunk in chunks]
+            for i, future in enumerate(futures):
+                results, chunk_truncated = future.result()
+                for result in results:
+                    if self.budget.spent():
+                        break
+                    report.add_result(ValidationResult(result.skill, self.budget.take(result.issues)))
+                # A worker only stops early past its own budget, which this one reaches first
+                self.budget.truncated = self.budget.truncated or chunk_truncated
+                if self.budget.exhausted:
+                    cancelled.set()
+                    for pending in futures:
+                        pending.cancel()
+                    if i + 1 < len(futures):
+                        self.budget.spent()
+                    break
+
+    def _validate_skill(self, skill_dir: Path, budget: IssueBudget) -> ValidationResult:
+        """Run every checker on one skill, loading its SKILL.md once for all of them.
+
+        Checkers stop once ``budget`` is spent; a skill cut short is not cached.
+        """
+        with PROFILER.measure("skill", skill_dir.name):
+            result = ValidationResult(skill=skill_dir.name)
+            if self.cache:
+                key = ValidationCache.skill_key(skill_dir, self._cache_salt, self.index)
+                cached = self.cache.get(skill_dir.name, key)
+                if cached is not None:
+                    result.add(budget.take(cached))
+                    return result
+
+            doc = SkillDocument.load(skill_dir, self.index)
+            with PROFILER.measure("phase", "check"):
+                with PROFILER.measure("checker", "RuleEngine"):
+                    self.engine.run(doc)
+                for checker in self.checkers:
+                    if budget.spent():
+                        break
+                    with PROFILER.measure("checker", type(checker).__name__):
+                        result.add(budget.take(checker.check(doc)))
+
+            if self.cache and not budget.truncated:
+                self.cache.put(skill_dir.name, key, result.issues)
+            return result
+
+
+_worker_validator: SkillValidator | None = None
+_worker_cancelled = None  # multiprocessing Event set when the run's budget is spent
+
+
+def _init_worker(validator: SkillValidator, cancelled) -> None:
+    global _worker_validator, _worker_cancelled
+    _worker_validator = validator
+    _worker_cancelled = cancelled
+
+
+def _validate_chunk_in_worker(skill_dirs: list[Path]) -> tuple[list[ValidationResult], bool]:
+    """Results for ``skill_dirs``, and whether the chunk's budget cut any of them short."""
+    budget = _worker_validator.budget.fresh()
+    results = []
+    for skill_dir in skill_dirs:
+        if _worker_cancelled.is_set() or budget.spent():
+            break
+        results.append(_worker_validator._validate_skill(skill_dir, budget))
+    return results, budget.truncated
+
+
+# =============================================================================
+# Watch Mode
+# =============================================================================
+
+class SkillWatcher:
+    """Keeps validation state in memory and re-runs only what a file change affects.
+
+    Per-skill issues are held per checker. A changed SKILL.md re-runs the
+    "yaml" category checkers for that skill, a changed reference file the
+    "references" ones; adding or removing a skill re-checks every skill
+    (related-skills resolves across skills). Commands and docs changes re-run
+    workflow validation, and any skills or count-file change re-runs counts.
+    """
+
+    def __init__(
+        self,
+        validator: SkillValidator,
+        base_path: Path,
+        run_skills: bool = True,
+        run_workflows: bool = True,
+    ):
+        self.validator = validator
+        self.base_path = base_path
+        self.run_skills = run_skills
+        self.run_workflows = run_workflows
+        self.docs: dict[str, SkillDocument] = {}
+        self.skill_issues: dict[str, dict[str, list[ValidationIssue]]] = {}
+        self.count_issues: list[ValidationIssue] = []
+        self.workflow_issues: list[ValidationIssue] = []
+        self.catalog: WorkflowCatalog | None = None
+
+    def report(self) -> ValidationReport:
+        """Build a report from the current in-memory state."""
+        return ValidationReport(
+            results=[
+                ValidationResult(
+                    skill=skill,
+                    issues=[i for c in self.validator.checkers for i in by_checker[c.name]],
+                )
+                for skill, by_checker in sorted(self.skill_issues.items())
+            ],
+            count_issues=list(self.count_issues),
+            workflow_issues=list(self.workflow_issues),
+        )
+
+    def all_issues(self) -> set[ValidationIssue]:
+        report = self.report()
+        return {
+            *(i for r in report.results for i in r.issues),
+            *report.count_issues,
+            *report.workflow_issues,
+        }
+
+    def _check_skill(self, skill_dir: Path, categories: set[str] | None = None) -> None:
+        """(Re)run the checkers in ``categories`` (all when None) for one skill."""
+        if categories is None or "yaml" in categories or skill_dir.name not in self.docs:
+            self.docs[skill_dir.name] = SkillDocument.load(skill_dir, self.validator.index)
+            self.validator.engine.run(self.docs[skill_dir.name])
+        doc = self.docs[skill_dir.name]
+        doc.index = self.validator.index  # Reference checks must see the fresh snapshot
+        by_checker = self.skill_issues.setdefault(skill_dir.name, {})
+        for checker in self.validator.checkers:
+            if categories is None or checker.category in categories or checker.name not in by_checker:
+                by_checker[checker.name] = checker.check(doc)
+
+    def _check_all_skills(self) -> None:
+        skill_dirs = self.validator.select_skill_dirs(self.validator.find_skill_dirs())
+        names = {d.name for d in skill_dirs}
+        for stale in set(self.skill_issues) - names:
+            del self.skill_issues[stale]
+            self.docs.pop(stale, None)
+        for skill_dir in skill_dirs:
+            self._check_skill(skill_dir)
+
+    def _check_counts(self) -> None:
+        if self.run_skills and self.validator.runs_count_check:
+            self.count_issues = self.validator.count_checker.check(
+                self.validator.skills_dir, self.validator.index
+            )
+
+    def _check_workflows(self, changed: set[Path] | None = None) -> None:
+        """Re-run the workflow checks, reloading only ``changed`` workflow files (all when None)."""
+        if not self.run_workflows:
+            return
+        if self.catalog is None or changed is None:
+            self.catalog = WorkflowCatalog(self.base_path, self.validator.index)
+        else:
+            self.catalog.update(changed, self.validator.index)
+        self.workflow_issues = WorkflowValidator(
+            self.base_path, index=self.validator.index, catalog=self.catalog
+        ).validate()
+
+    def validate_all(self) -> ValidationReport:
+        if self.run_skills:
+            self._check_all_skills()
+        self._check_counts()
+        self._check_workflows()
+        return self.report()
+
+    def apply_changes(self, changed: set[Path]) -> set[str]:
+        """Re-run the checks affected by ``changed`` files; return the skills re-checked."""
+        skills_root = self.validator.skills_dir.resolve()
+        commands_root = (self.base_path / COMMANDS_DIR_WORKFLOW).resolve()
+        docs_root = (self.base_path / "docs").resolve()
+        count_files = {(self.base_path / f).resolve() for f in COUNT_FILES}
+
+        rerun: dict[str, set[str]] = {}
+        all_skills = counts = False
+        workflow_changes: set[Path] = set()
+        for path in changed:
+            full = path.resolve()
+            if full.is_relative_to(skills_root):
+                counts = True
+                parts = full.relative_to(skills_root).parts
+                if len(parts) < 2 or parts[0].startswith((".", "_")):
+                    continue
+                if parts[0] not in self.skill_issues or not self.validator.index.is_dir(skills_root / parts[0]):
+                    all_skills = True
+                elif parts[1] == "SKILL.md":
+                    rerun.setdefault(parts[0], set()).add("yaml")
+                elif parts[1] == "references":
+                    rerun.setdefault(parts[0], set()).add("references")
+            elif full.is_relative_to(commands_root) or full.is_relative_to(docs_root):
+                workflow_changes.add(path)
+            elif full in count_files:
+                counts = True
+
+        rechecked = set()
+        if self.run_skills:
+            if all_skills:
+                self._check_all_skills()
+                rechecked = set(self.skill_issues)
+            else:
+                for skill, categories in rerun.items():
+                    self._check_skill(self.validator.skills_dir / skill, categories)
+                rechecked = set(rerun)
+        if counts:
+            self._check_counts()
+        if workflow_changes:
+            self._check_workflows(workflow_changes)
+        return rechecked
+
+    def watch(self, interval: float) -> None:
+        """Validate once, then print new and resolved issues after every change."""
+        print(TableFormatter().format(self.validate_all()))
+        roots = index_roots(self.validator.skills_dir, self.base_path)
+        print(f"Watching for changes every {interval}s (Ctrl+C to stop)...", flush=True)
+
+        try:
+            for changed, index in watch_changes(roots, interval):
+                before = self.all_issues()
+                started = time.perf_counter()
+                self.validator.index = index
+                self.apply_changes(changed)
+                after = self.all_issues()
+                elapsed = time.perf_counter() - started
+
+                names = ", ".join(sorted(str(p) for p in changed)[:3])
+                more = f" (+{len(changed) - 3} more)" if len(changed) > 3 else ""
+                print(f"\n[{time.strftime('%H:%M:%S')}] {names}{more} changed, re-checked in {elapsed:.3f}s")
+                for sign, issues in (("+", after - before), ("-", before - after)):
+                    for issue in sorted(issues, key=lambda i: (i.skill, i.check, i.message)):
+                        icon = "ERROR" if issue.severity == Severity.ERROR else "WARN "
+                        file_info = f" ({issue.file})" if issue.file else ""
+                        print(f"  {sign} [{icon}] {issue.skill}: {issue.check}: {issue.message}{file_info}")
+                if before == after:
+                    print("  No change in issues")
+                report = self.report()
+                print(f"  Now {report.total_errors} errors, {report.total_warnings} warnings", flush=True)
+        except KeyboardInterrupt:
+            pass
+
+
+# =============================================================================
+# Server Mode
+# =============================================================================
+
+class RpcError(Exception):
+    """A JSON-RPC error response."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+# JSON-RPC 2.0 error codes
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_INTERNAL_ERROR = -32603
+
+
+class ValidationServer:
+    """Answers JSON-RPC 2.0 requests on stdin/stdout, one JSON message per line.
+
+    Validation state is held by a SkillWatcher, so a request re-runs only the
+    checks its change affects. Unsaved editor buffers sent with
+    validateBuffer are served from memory in place of the file until
+    closeBuffer; only refresh looks at the disk again.
+
+    Methods:
+        validateBuffer {path, text}  Validate ``text`` as the file at ``path``
+        closeBuffer {path}           Drop a buffer and re-check the file on disk
+        checkSkill {skill}           Issues for one skill
+        checkWorkflows {}            Re-run manifest and workflow definition checks
+        refresh {}                   Re-scan the disk and re-check what changed
+        report {}                    The full report, as --format json prints it
+        shutdown {}                  Stop the server
+    """
+
+    def __init__(self, watcher: SkillWatcher):
+        self.watcher = watcher
+        self.buffers: dict[Path, str] = {}
+        self.mtimes: dict[Path, int] = {}
+        self.running = False
+        self.methods = {
+            "validateBuffer": self.validate_buffer,
+            "closeBuffer": self.close_buffer,
+            "checkSkill": self.check_skill,
+            "checkWorkflows": self.check_workflows,
+            "refresh": self.refresh,
+            "report": self.report,
+            "shutdown": self.shutdown,
+        }
+
+    @property
+    def index(self) -> TreeIndex:
+        return self.watcher.validator.index
+
+    def _changes(self, skills: set[str]) -> dict:
+        """Results for ``skills`` plus the global issues, in --format json's shape."""
+        report = self.watcher.report()
+        return {
+            "results": [r.to_dict() for r in report.results if r.skill in skills],
+            "count_issues": [i.to_dict() for i in report.count_issues],
+            "workflow_issues": [i.to_dict() for i in report.workflow_issues],
+            "summary": report.summary,
+        }
+
+    @staticmethod
+    def _param(params: dict, name: str) -> str:
+        value = params.get(name)
+        if not isinstance(value, str):
+            raise RpcError(RPC_INVALID_PARAMS, f"'{name}' must be a string")
+        return value
+
+    # -- Methods ---------------------------------------------------------------
+
+    def validate_buffer(self, params: dict) -> dict:
+        path = Path(self._param(params, "path"))
+        text = self._param(params, "text")
+        self.buffers[path] = text
+        self.index.overlay(path, text)
+        return self._changes(self.watcher.apply_changes({path}))
+
+    def close_buffer(self, params: dict) -> dict:
+        path = Path(self._param(params, "path"))
+        if self.buffers.pop(path, None) is None:
+            raise RpcError(RPC_INVALID_PARAMS, f"No open buffer for {path}")
+        self.index.discard_overlay(path)
+        return self._changes(self.watcher.apply_changes({path}))
+
+    def check_skill(self, params: dict) -> dict:
+        skill = self._param(params, "skill")
+        if skill not in self.watcher.skill_issues:
+            raise RpcError(RPC_INVALID_PARAMS, f"Skill not found: {skill}")
+        return self._changes({skill})
+
+    def check_workflows(self, params: dict) -> dict:
+        self.watcher._check_workflows()
+        return self._changes(set())
+
+    def refresh(self, params: dict) -> dict:
+        fresh = TreeIndex(self.index.roots)
+        current = fresh.mtimes()
+        changed = changed_files(self.mtimes, current)
+        self.mtimes = current
+        fresh.inherit_contents(self.index)
+        for path, text in self.buffers.items():
+            fresh.overlay(path, text)
+        self.watcher.validator.index = fresh
+        return self._changes(self.watcher.apply_changes(changed))
+
+    def report(self, params: dict) -> dict:
+        return self.watcher.report().to_dict()
+
+    def shutdown(self, params: dict) -> None:
+        self.running = False
+
+    # -- Transport -------------------------------------------------------------
+
+    def handle(self, line: str) -> dict | None:
+        """Answer one JSON-RPC message; notifications (no "id") get no response."""
+        import json
+
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": RPC_PARSE_ERROR, "message": "Parse error"}}
+        if not isinstance(message, dict):
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": RPC_INVALID_REQUEST, "message": "Invalid request"}}
+
+        request_id = message.get("id")
+        try:
+            method = self.methods.get(message.get("method"))
+            if method is None:
+                raise RpcError(RPC_METHOD_NOT_FOUND, f"Method not found: {message.get('method')}")
+            params = message.get("params", {})
+            if not isinstance(params, dict):
+                raise RpcError(RPC_INVALID_PARAMS, "params must be an object")
+            response = {"jsonrpc": "2.0", "id": request_id, "result": method(params)}
+        except RpcError as e:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": e.code, "message": str(e)}}
+        except Exception as e:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": RPC_INTERNAL_ERROR, "message": str(e)}}
+        return response if "id" in message else None
+
+    def serve(self, stdin=None, stdout=None) -> None:
+        """Validate everything once, then answer requests until shutdown or end of input."""
+        import json
+
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+        self.mtimes = self.index.mtimes()
+        self.watcher.validate_all()
+        self.running = True
+        for line in stdin:
+            if not line.strip():
+                continue
+            response = self.handle(line)
+            if response is not None:
+                stdout.write(json.dumps(response) + "\n")
+                stdout.flush()
+            if not self.running:
+                break
+
+
+# =============================================================================
+# Shard Merge
+# =============================================================================
+
+def load_shard_results(paths: list[Path]) -> tuple[list[ValidationResult], bool]:
+    """Read the --format json reports of a complete set of --shard runs.
+
+    Returns:
+        Every skill's result, and whether any shard was truncated.
+
+    Raises:
+        ValueError: A report is unreadable, is not a full sharded report,
+            or the shards do not cover 1/N..N/N exactly once.
+    """
+    import json
+
+    results: list[ValidationResult] = []
+    seen_shards: dict[tuple[int, int], Path] = {}
+    seen_skills: set[str] = set()
+    truncated = False
+    for path in paths:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read shard report {path}: {e}") from e
+        if not isinstance(data, dict) or "results" not in data or "shard" not in data:
+            raise ValueError(
+                f"{path} is not a shard report (run each shard with --shard i/N --format json, "
+                "without --summary-only)"
+            )
+        shard = parse_shard(data["shard"])
+        if shard in seen_shards:
+            raise ValueError(f"Shard {data['shard']} appears in both {seen_shards[shard]} and {path}")
+        seen_shards[shard] = path
+        for entry in data["results"]:
+            result = ValidationResult.from_dict(entry)
+            if result.skill in seen_skills:
+                raise ValueError(f"Skill {result.skill} appears in more than one shard report")
+            seen_skills.add(result.skill)
+            results.append(result)
+        truncated = truncated or data["summary"].get("truncated", False)
+
+    counts = {count for _, count in seen_shards}
+    if len(counts) != 1:
+        raise ValueError(f"Shard reports come from different shard counts: {sorted(counts)}")
+    count = counts.pop()
+    missing = [f"{i}/{count}" for i in range(1, count + 1) if (i, count) not in seen_shards]
+    if missing:
+        raise ValueError(f"Missing shard reports: {', '.join(missing)}")
+    return results, truncated
+
 
 # =============================================================================
 # CLI
@@ -1722,6 +3364,18 @@ Examples:
   python scripts/validate-skills.py --check workflows   # Workflow definition checks only
   python scripts/validate-skills.py --skill content-strategist  # Single skill
   python scripts/validate-skills.py --format json  # JSON for CI
+  python scripts/validate-skills.py --format ndjson  # One issue per line, streamed
+  python scripts/validate-skills.py --summary-only   # Counts per check plus 20 sample issues
+  python scripts/validate-skills.py --jobs 0       # One worker process per CPU
+  python scripts/validate-skills.py --no-cache     # Ignore .validate-cache/
+  python scripts/validate-skills.py --changed-since origin/main  # Only what git says changed
+  python scripts/validate-skills.py --staged       # Only what is staged (pre-commit)
+  python scripts/validate-skills.py --watch        # Re-validate on every save
+  python scripts/validate-skills.py --serve        # JSON-RPC over stdio for editors and agents
+  python scripts/validate-skills.py --profile      # Where does the time go?
+  python scripts/validate-skills.py --fail-fast    # Stop at the first error (CI gate)
+  python scripts/validate-skills.py --shard 2/4 --format json > shard-2.json  # One of 4 CI jobs
+  python scripts/validate-skills.py --merge shard-*.json  # Combine shards, run global checks once
 
 Check categories:
   yaml        - YAML frontmatter validation (parsing, required fields, format)
@@ -1743,9 +3397,9 @@ Check categories:
 
     parser.add_argument(
         "--format",
-        choices=["table", "json"],
+        choices=["table", "json", "ndjson"],
         default="table",
-        help="Output format (default: table)",
+        help="Output format; ndjson streams one issue per line as found (default: table)",
     )
 
     parser.add_argument(
@@ -1754,32 +3408,231 @@ Check categories:
         help=f"Path to skills directory (default: {SKILLS_DIR})",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate skills in N worker processes (0 = one per CPU, default: 1)",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        default=CACHE_DIR,
+        help=f"Directory for cached per-skill results (default: {CACHE_DIR})",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every skill without reading or writing the cache",
+    )
+
+    changes = parser.add_mutually_exclusive_group()
+    changes.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="Validate only skills and workflow definitions changed since git REF",
+    )
+    changes.add_argument(
+        "--staged",
+        action="store_true",
+        help="Validate only skills and workflow definitions staged in the git index",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-validate whatever changes, printing new and resolved issues",
+    )
+
+    parser.add_argument(
+        "--summary-only",
+        nargs="?",
+        type=int,
+        const=DEFAULT_SAMPLE_SIZE,
+        metavar="SAMPLE",
+        help="Report only counts per severity, check and skill plus the first SAMPLE issues "
+             f"(default: {DEFAULT_SAMPLE_SIZE}); memory stays flat however many issues are found",
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first error; the report is marked truncated",
+    )
+
+    parser.add_argument(
+        "--max-issues",
+        type=int,
+        metavar="N",
+        help="Stop after reporting N issues; the report is marked truncated",
+    )
+
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Validate only slice I of N (by a stable hash of the skill name); the count and "
+             "workflow checks are left to --merge",
+    )
+
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        type=Path,
+        metavar="REPORT",
+        help="Combine the --format json reports of shards 1/N..N/N and run the count and "
+             "workflow checks once",
+    )
+
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Stay resident and answer JSON-RPC requests on stdin/stdout (one message per line)",
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="Polling interval for --watch (default: 0.5)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+        help="Print time, calls and peak memory per phase, checker, skill and file to stderr "
+             "(runs serially)",
+    )
+
     args = parser.parse_args()
 
-    report = ValidationReport()
+    if args.summary_only is not None and args.summary_only < 0:
+        print("Error: --summary-only sample size cannot be negative")
+        sys.exit(1)
+    if args.max_issues is not None and args.max_issues < 1:
+        print("Error: --max-issues must be at least 1")
+        sys.exit(1)
+    if (args.fail_fast or args.max_issues) and (args.watch or args.serve):
+        print("Error: --fail-fast and --max-issues cannot be combined with --watch or --serve")
+        sys.exit(1)
+    budget = IssueBudget(max_issues=args.max_issues, fail_fast=args.fail_fast)
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    if (args.shard or args.merge) and (args.skill or args.watch or args.serve):
+        print("Error: --shard and --merge cannot be combined with --skill, --watch or --serve")
+        sys.exit(1)
+    if args.merge and (args.shard or args.changed_since or args.staged):
+        print("Error: --merge cannot be combined with --shard, --changed-since or --staged")
+        sys.exit(1)
+    if args.merge and args.check == "workflows":
+        print("Error: --merge cannot be combined with --check workflows (shard reports hold skill results)")
+        sys.exit(1)
+
+    if args.profile:
+        PROFILER.enable()
+        load_pyyaml()  # so the import is not charged to the first parse span
+
+    base_path = Path(".")
+
+    # One walk of the tree, shared by the skill, count and workflow checks;
+    # workflow-only runs never look at skills/
+    if args.check == "workflows" and not (args.watch or args.serve):
+        index = TreeIndex([base_path / COMMANDS_DIR_WORKFLOW, base_path / "docs"])
+    else:
+        index = TreeIndex(index_roots(Path(args.skills_dir), base_path))
+
+    if args.watch or args.serve:
+        watcher = SkillWatcher(
+            SkillValidator(
+                skills_dir=args.skills_dir,
+                check_category=args.check if args.check != "workflows" else None,
+                skill_filter=args.skill,
+                cache_dir=None,
+                index=index,
+            ),
+            base_path,
+            run_skills=args.check != "workflows",
+            run_workflows=args.check == "workflows" or (args.check is None and not args.skill),
+        )
+        if args.serve:
+            ValidationServer(watcher).serve()
+        else:
+            watcher.watch(args.interval)
+        sys.exit(0)
+
+    if args.format == "json":
+        formatter = JsonFormatter()
+    elif args.format == "ndjson":
+        formatter = NdjsonFormatter()
+    else:
+        formatter = TableFormatter()
+    # ndjson has streamed every issue, so it keeps none
+    if isinstance(formatter, NdjsonFormatter):
+        report = ValidationReport(sample=0, on_issues=formatter.emit)
+    else:
+        report = ValidationReport(sample=args.summary_only)
+    if shard:
+        report.shard = f"{shard[0]}/{shard[1]}"
+
+    scope = ChangeScope(skills=None, definitions=None)
+    if args.changed_since or args.staged:
+        try:
+            changed = git_changed_files(args.changed_since, staged=args.staged)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        scope = ChangeScope.from_paths(changed, Path(args.skills_dir), base_path)
 
-    # Run skill validation (unless --check workflows)
+    # Run skill validation (unless --check workflows); --merge takes the
+    # shards' results instead and only runs the global count check
     if args.check != "workflows":
         validator = SkillValidator(
             skills_dir=args.skills_dir,
             check_category=args.check,
             skill_filter=args.skill,
+            jobs=args.jobs,
+            cache_dir=None if args.no_cache else args.cache_dir,
+            only_skills=scope.skills,
+            index=index,
+            budget=budget,
+            shard=shard,
         )
-        report = validator.validate()
+        if args.merge:
+            try:
+                results, report.truncated = load_shard_results(args.merge)
+            except ValueError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            validator.merge(results, report)
+        else:
+            validator.validate(report)
 
-    # Run workflow validation (unless filtering to skill-specific checks)
-    if args.check == "workflows" or (args.check is None and not args.skill):
-        base_path = Path(".")
-        workflow_validator = WorkflowValidator(base_path)
-        report.workflow_issues = workflow_validator.validate()
+    # Run workflow validation (unless filtering to skill-specific checks or
+    # validating one shard: the workflows are checked once, by --merge)
+    if (args.check == "workflows" or (args.check is None and not args.skill)) and not shard:
+        workflow_validator = WorkflowValidator(
+            base_path, definitions=scope.definitions, index=index, budget=budget
+        )
+        workflow_validator.validate(on_issues=report.add_workflow_issues)
+        report.phase_graph = workflow_validator.phase_graph
+        report.truncated = report.truncated or budget.truncated
 
-    # Format and output
-    if args.format == "json":
-        formatter = JsonFormatter()
-    else:
-        formatter = TableFormatter()
+    # Format and output (ndjson has already streamed the issues)
+    with PROFILER.measure("phase", "format"):
+        output = formatter.format(report)
+    print(output)
 
-    print(formatter.format(report))
+    if PROFILER.enabled:
+        print(PROFILER.format(args.profile), file=sys.stderr)
 
     # Exit with appropriate code
     sys.exit(1 if report.has_errors else 0)
@@ -0,0 +1,32 @@
+"""
+Shared setup for the tests in this directory.
+
+Puts scripts/ and benchmarks/ on sys.path, so tests can import common and
+corpus directly, and imports the hyphen-named scripts with load_script.
+Run the suite with:
+    python -m unittest discover tests
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_DIR / "scripts"
+BENCHMARKS_DIR = REPO_DIR / "benchmarks"
+
+for directory in (SCRIPTS_DIR, BENCHMARKS_DIR):
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
+
+_scripts = {}
+
+
+def load_script(filename: str):
+    """Import ``scripts/<filename>``, whose name is not a valid module name, once per run."""
+    if filename not in _scripts:
+        spec = importlib.util.spec_from_file_location(filename.replace("-", "_")[:-3], SCRIPTS_DIR / filename)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _scripts[filename] = module
+    return _scripts[filename]
@@ -0,0 +1,47 @@
+"""
+Core Workflow step counting in validate-skills.py.
+
+Numbered lines, including a bare "1.", count as steps up to the next H2,
+the way the old whole-section regex counted them.
+"""
+
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+
+
+validate_skills = load_script("validate-skills.py")
+
+
+def step_count_messages(body: str) -> list[str]:
+    doc = validate_skills.SkillDocument(Path("s/x"), "x", Path("s/x/SKILL.md"), None)
+    doc.frontmatter = {"name": "x"}
+    doc.body = body
+    checker = validate_skills.CoreWorkflowStepCountChecker()
+    validate_skills.RuleEngine([checker]).run(doc)
+    return [issue.message for issue in checker.check(doc)]
+
+
+class StepCountTest(unittest.TestCase):
+    """Steps are counted like "^\\d+\\.\\s" over the section text, up to the next H2."""
+
+    def test_bare_number_is_a_step(self):
+        self.assertEqual(step_count_messages("## Core Workflow\n1. a\n1.\n2. b\n"), [
+            "Core Workflow has 3 steps (expected 5)",
+        ])
+
+    def test_bare_number_ending_the_section_is_not_a_step(self):
+        self.assertEqual(step_count_messages("## Core Workflow\n1. a\n2.\n## Next\n3. c\n"), [
+            "Core Workflow has 1 steps (expected 5)",
+        ])
+        self.assertEqual(step_count_messages("## Core Workflow\n1. a\n2."), [
+            "Core Workflow has 1 steps (expected 5)",
+        ])
+
+    def test_five_steps(self):
+        self.assertEqual(step_count_messages("## Core Workflow\n" + "".join(f"{i}.\n" for i in range(1, 6)) + "\n"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+IssueBudget (validate-skills.py --fail-fast and --max-issues).
+
+Which issues a budget keeps and when a report is marked truncated, both
+for take() alone and for a whole run over a generated corpus.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+from corpus import generate_corpus
+
+
+validate_skills = load_script("validate-skills.py")
+IssueBudget = validate_skills.IssueBudget
+
+
+def issues(count: int, severity=None) -> list:
+    severity = severity or validate_skills.Severity.WARNING
+    return [
+        validate_skills.ValidationIssue(skill="s", check="c", severity=severity, message=str(i))
+        for i in range(count)
+    ]
+
+
+class TakeTest(unittest.TestCase):
+    def test_filling_the_budget_exactly_is_not_truncated(self):
+        budget = IssueBudget(max_issues=42)
+        self.assertEqual(len(budget.take(issues(40))), 40)
+        self.assertEqual(len(budget.take(issues(2))), 2)
+        self.assertTrue(budget.exhausted)
+        self.assertFalse(budget.truncated)
+        self.assertEqual(budget.take([]), [])
+        self.assertFalse(budget.truncated)
+
+    def test_cutting_issues_is_truncated(self):
+        budget = IssueBudget(max_issues=42)
+        self.assertEqual(len(budget.take(issues(43))), 42)
+        self.assertTrue(budget.truncated)
+
+    def test_issues_after_exhaustion_are_truncated(self):
+        budget = IssueBudget(max_issues=1)
+        budget.take(issues(1))
+        self.assertEqual(budget.take(issues(1)), [])
+        self.assertTrue(budget.truncated)
+
+    def test_skipping_work_is_truncated(self):
+        budget = IssueBudget(max_issues=1)
+        budget.take(issues(1))
+        self.assertTrue(budget.spent())
+        self.assertTrue(budget.truncated)
+
+    def test_fail_fast_keeps_issues_up_to_the_first_error(self):
+        error = validate_skills.Severity.ERROR
+        budget = IssueBudget(fail_fast=True)
+        self.assertEqual(len(budget.take(issues(2) + issues(1, error))), 3)
+        self.assertTrue(budget.exhausted)
+        self.assertFalse(budget.truncated)
+        budget = IssueBudget(fail_fast=True)
+        self.assertEqual(len(budget.take(issues(1, error) + issues(2))), 1)
+        self.assertTrue(budget.truncated)
+
+
+class MaxIssuesBoundaryTest(unittest.TestCase):
+    """A run whose issue count equals --max-issues reports every issue and is not truncated."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        generate_corpus(root, 3, 0)
+        # Wrong counts: the count check, which runs last, reports them
+        readme = root / "README.md"
+        readme.write_text(readme.read_text() + "\nShips 7 skills and 100 reference files.\n")
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(root)
+
+    def validate(self, max_issues: int | None):
+        budget = IssueBudget(max_issues=max_issues)
+        return validate_skills.SkillValidator(cache_dir=None, budget=budget).validate()
+
+    def test_max_issues_equal_to_total(self):
+        full = self.validate(None)
+        total = len(full.count_issues)
+        self.assertGreater(total, 0)
+        self.assertFalse(any(result.issues for result in full.results))
+
+        exact = self.validate(total)
+        self.assertFalse(exact.truncated)
+        self.assertEqual(exact.to_dict(), full.to_dict())
+
+        short = self.validate(total - 1)
+        self.assertTrue(short.truncated)
+        self.assertEqual(len(short.count_issues), total - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
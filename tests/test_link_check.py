@@ -0,0 +1,77 @@
+"""
+LinkIndex and LinkCheck (validate-markdown.py --links).
+
+Links to missing files and headings are reported, links to a file's own
+headings resolve from anywhere in it, and a wikilink whose name matches
+several files resolves to the first in sorted order, as in Obsidian.
+Links inside HTML comments are not rendered, so they are not checked.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+from common import TreeIndex
+
+
+validate_markdown = load_script("validate-markdown.py")
+
+
+class LinkCheckTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.write("a/note.md", "# Alpha Note\n\nText.\n")
+        self.write("b/note.md", "# Beta Note\n\n## Only In B\n")
+        self.write("guide.md", "# Guide\n\n## Setup & Use\n")
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return path
+
+    def link_issues(self, text: str) -> list[tuple[int, str, str]]:
+        path = self.write("doc.md", text)
+        index = TreeIndex([self.root])
+        links = validate_markdown.LinkIndex(self.root, index)
+        return [
+            (issue.line, issue.issue_type.value, issue.message.split(" in ")[0])
+            for issue in validate_markdown.validate_file(path, index, links)
+        ]
+
+    def test_valid_links(self):
+        self.assertEqual(self.link_issues(
+            "[guide](guide.md#setup--use) [own](#later) [[guide#Setup & Use]] [[b/note#Only In B]]\n"
+            "[ext](https://example.com/x.md) ![img](a/note.md)\n\n## Later\n"
+        ), [])
+
+    def test_broken_file_and_anchor(self):
+        self.assertEqual(self.link_issues("[x](missing.md)\n[y](guide.md#nowhere)\n[z](#nowhere)\n"), [
+            (1, "broken-link", "Link target 'missing.md' does not exist (" + str(self.root / "missing.md") + ")"),
+            (2, "broken-anchor", "No heading for anchor '#nowhere'"),
+            (3, "broken-anchor", "No heading for anchor '#nowhere'"),
+        ])
+
+    def test_ambiguous_wikilink_resolves_to_the_first_match(self):
+        index = TreeIndex([self.root])
+        links = validate_markdown.LinkIndex(self.root, index)
+        self.assertEqual(links.note("Note"), self.root / "a" / "note.md")
+        self.assertEqual(links.note("b/note.md"), self.root / "b" / "note.md")
+        self.assertEqual(self.link_issues("[[note#Only In B]]\n[[nothing]]\n"), [
+            (1, "broken-anchor", "No heading 'Only In B'"),
+            (2, "broken-link", "Wikilink [[nothing]] matches no file under " + str(self.root)),
+        ])
+
+    def test_links_in_comments_are_skipped(self):
+        self.assertEqual(self.link_issues(
+            "<!-- [x](missing.md) -->\n<!--\n[[nothing]]\n| [y](gone.md) |\n-->\n[z](missing.md)\n"
+        ), [
+            (6, "broken-link", "Link target 'missing.md' does not exist (" + str(self.root / "missing.md") + ")"),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+MarkdownCache (validate-markdown.py --cache-dir).
+
+Entries are shared across working directories and roots, and a save
+prunes only deleted files inside the run's TreeIndex.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+from common import TreeIndex
+
+
+validate_markdown = load_script("validate-markdown.py")
+
+
+class SharedCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        for name in ("a", "b"):
+            (self.root / name).mkdir()
+            (self.root / name / "doc.md").write_text("| x |\n| 1 |\n")
+        self.cache_dir = self.root / "cache"
+        self.addCleanup(os.chdir, os.getcwd())
+
+    def run_directory(self, root: Path) -> None:
+        cache = validate_markdown.MarkdownCache(self.cache_dir)
+        list(validate_markdown.iter_directory(root, cache=cache))
+
+    def cached(self, path: Path) -> list | None:
+        cache = validate_markdown.MarkdownCache(self.cache_dir)
+        return cache.get(path, cache.file_key(path))
+
+    def test_entries_are_shared_across_working_directories(self):
+        os.chdir(self.root)
+        self.run_directory(Path("a"))
+        os.chdir(self.root / "a")
+        issues = self.cached(Path("doc.md"))
+        self.assertIsNotNone(issues)
+        self.assertEqual([issue.issue_type.value for issue in issues], ["missing-table-separator"])
+
+    def test_save_keeps_entries_outside_the_index(self):
+        self.run_directory(self.root / "a")
+        self.run_directory(self.root / "b")
+        self.assertIsNotNone(self.cached(self.root / "a" / "doc.md"))
+        self.assertIsNotNone(self.cached(self.root / "b" / "doc.md"))
+
+    def test_save_drops_deleted_files_inside_the_index(self):
+        (self.root / "a" / "gone.md").write_text("text\n")
+        self.run_directory(self.root / "a")
+        (self.root / "a" / "gone.md").unlink()
+        cache = validate_markdown.MarkdownCache(self.cache_dir)
+        cache.put(self.root / "a" / "doc.md", "changed", [])
+        cache.save(TreeIndex([self.root / "a"]))
+        entries = validate_markdown.MarkdownCache(self.cache_dir).entries
+        self.assertEqual(sorted(entries), [str(self.root / "a" / "doc.md")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+HTML comments in validate-markdown.py.
+
+How the tokenizer tracks comments across lines and past code spans, and
+how TableCheck reports them, for streamed and byte-scanned files alike.
+"""
+
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+
+
+validate_markdown = load_script("validate-markdown.py")
+BlockKind = validate_markdown.BlockKind
+
+MULTI_LINE = """\
+| a | b |
+|---|---|
+| 1 | 2 |
+<!--
+| c | d |
+| 3 |
+```
+-->
+text
+"""
+
+
+def issue_types(text: str) -> list[tuple[int, str]]:
+    issues = validate_markdown.check_lines(Path("t.md"), io.StringIO(text))
+    return [(issue.line, issue.issue_type.value) for issue in issues]
+
+
+class TokenizeTest(unittest.TestCase):
+    def test_multi_line_comment(self):
+        kinds = [(kind, info) for kind, _, _, info in validate_markdown.tokenize_blocks(io.StringIO(MULTI_LINE))]
+        self.assertEqual(kinds[3], (BlockKind.HTML_COMMENT, "<!--"))
+        self.assertEqual(kinds[4:8], [(BlockKind.HTML_COMMENT, "")] * 4)
+        self.assertEqual(kinds[8], (BlockKind.TEXT, ""))
+
+    def test_comment_in_code_span_is_text(self):
+        blocks = list(validate_markdown.tokenize_blocks(["Use `<!--` to open", "| `<!--` | x |", "``a ` <!--``"]))
+        self.assertEqual([kind for kind, _, _, _ in blocks], [BlockKind.TEXT, BlockKind.TABLE_ROW, BlockKind.TEXT])
+
+    def test_comment_after_code_span(self):
+        blocks = list(validate_markdown.tokenize_blocks(["`x` <!-- y", "-->"]))
+        self.assertEqual([kind for kind, _, _, _ in blocks], [BlockKind.HTML_COMMENT] * 2)
+
+
+class TableCheckTest(unittest.TestCase):
+    def test_comment_in_table(self):
+        self.assertEqual(issue_types("| a | b |\n|---|---|\n| 1 <!-- x --> | 2 |\n"), [(3, "html-in-table")])
+        self.assertEqual(issue_types("| a | b |\n<!-- x -->\n"), [(2, "html-in-table")])
+
+    def test_comment_in_code_span_is_not_reported(self):
+        self.assertEqual(issue_types("| a | b |\n|---|---|\n| `<!--` | 2 |\n"), [])
+
+    def test_lines_inside_a_comment_are_ignored(self):
+        self.assertEqual(issue_types(MULTI_LINE), [(4, "html-in-table")])
+
+    def test_scanned_file_matches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "t.md"
+            path.write_text(MULTI_LINE * 3 + "| `<!--` | x |\n|---|\n")
+            expected = validate_markdown.validate_file(path)
+            scan_threshold = validate_markdown.SCAN_THRESHOLD
+            validate_markdown.SCAN_THRESHOLD = 0
+            try:
+                self.assertEqual(validate_markdown.validate_file(path), expected)
+            finally:
+                validate_markdown.SCAN_THRESHOLD = scan_threshold
+
+
+if __name__ == "__main__":
+    unittest.main()
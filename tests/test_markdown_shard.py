@@ -0,0 +1,52 @@
+"""
+validate-markdown.py --shard.
+
+Every file hashes into exactly one slice, whether it is checked alone or
+under any root.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+from common import in_shard
+
+
+validate_markdown = load_script("validate-markdown.py")
+
+
+class ShardKeyTest(unittest.TestCase):
+    """A file lands in the same shard however the run is rooted."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        for i in range(40):
+            (root / "skills" / f"s{i}").mkdir(parents=True)
+            (root / "skills" / f"s{i}" / "SKILL.md").write_text("text\n")
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(root)
+
+    def selected(self, root: Path, shard: tuple[int, int]) -> set[str]:
+        results = validate_markdown.iter_directory(root, shard=shard)
+        return {Path(os.path.relpath(path)).as_posix() for path, _ in results}
+
+    def test_shards_are_disjoint_and_complete_across_roots(self):
+        every = self.selected(Path("."), (1, 1))
+        shards = [self.selected(Path("skills") if i % 2 else Path("."), (i, 3)) for i in (1, 2, 3)]
+        self.assertEqual(set().union(*shards), every)
+        self.assertEqual(sum(len(shard) for shard in shards), len(every))
+
+    def test_single_file_matches_directory_run(self):
+        shard = (2, 3)
+        chosen = self.selected(Path("skills"), shard)
+        for path in self.selected(Path("."), (1, 1)):
+            self.assertEqual(in_shard(validate_markdown.shard_key(Path(path)), shard), path in chosen)
+            self.assertEqual(validate_markdown.shard_key(Path(path).resolve()), path)
+
+
+if __name__ == "__main__":
+    unittest.main()
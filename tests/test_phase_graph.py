@@ -0,0 +1,68 @@
+"""
+PhaseGraph, the manifest's phase dependency analysis (validate-skills.py).
+
+Every cycle is found, one per strongly connected component, and an
+acyclic manifest gets its concurrency levels and critical path; a
+manifest with two cycles reports both.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+from corpus import generate_corpus
+
+
+validate_skills = load_script("validate-skills.py")
+PhaseGraph = validate_skills.PhaseGraph
+
+
+class AnalyzeTest(unittest.TestCase):
+    def test_every_cycle_is_reported(self):
+        graph = PhaseGraph.analyze({
+            "a": ["b"], "b": ["a"],
+            "c": ["d"], "d": ["e"], "e": ["c", "a"],
+            "f": ["f"],
+            "g": ["a", "missing"],
+        })
+        self.assertEqual(graph.cycles, [["a", "b", "a"], ["c", "d", "e", "c"], ["f", "f"]])
+        self.assertIsNone(graph.levels)
+        self.assertIsNone(graph.critical_path)
+
+    def test_levels_and_critical_path(self):
+        graph = PhaseGraph.analyze({"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": ["missing"]})
+        self.assertEqual(graph.cycles, [])
+        self.assertEqual(graph.levels, [["a", "e"], ["b", "c"], ["d"]])
+        self.assertEqual(graph.critical_path, ["a", "b", "d"])
+
+    def test_deep_chain_does_not_recurse(self):
+        depth = 5000
+        graph = PhaseGraph.analyze({f"p{i}": [f"p{i - 1}"] if i else [] for i in range(depth)})
+        self.assertEqual(len(graph.levels), depth)
+        self.assertEqual(graph.critical_path, [f"p{i}" for i in range(depth)])
+
+
+class ManifestCyclesTest(unittest.TestCase):
+    def test_two_cycles_in_one_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            generate_corpus(root, 3, 0)
+            phases = {"capture": "writing", "writing": "capture", "review": "publish", "publish": "review"}
+            lines = ["name: cycles", "description: Two independent cycles", 'version: "0.1.0"', "", "phases:"]
+            for phase, dependency in phases.items():
+                lines += [f"  {phase}:", "    depends_on:", f"      - phase: {dependency}", "    commands: []"]
+            (root / validate_skills.MANIFEST_FILE).write_text("\n".join(lines) + "\n")
+
+            validator = validate_skills.WorkflowValidator(root)
+            messages = [issue.message for issue in validator.validate() if "cycle" in issue.message]
+
+        self.assertEqual(messages, [
+            "DAG cycle detected: capture -> writing -> capture",
+            "DAG cycle detected: review -> publish -> review",
+        ])
+        self.assertEqual(len(validator.phase_graph.cycles), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
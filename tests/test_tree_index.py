@@ -0,0 +1,57 @@
+"""
+TreeIndex (scripts/common.py).
+
+Symlinked directories are walked the way pathlib sees them, and a link
+back up the tree does not loop forever.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+from common import TreeIndex
+
+
+class SymlinkTest(unittest.TestCase):
+    """Symlinked directories are indexed like pathlib sees them."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        skills = self.root / "skills"
+        (skills / "real").mkdir(parents=True)
+        (skills / "real" / "SKILL.md").write_text("# Real\n")
+        outside = self.root / "outside" / "linked"
+        (outside / "references").mkdir(parents=True)
+        (outside / "SKILL.md").write_text("# Linked\n")
+        (outside / "references" / "guide.md").write_text("# Guide\n")
+        os.symlink(outside, skills / "linked")
+
+    def test_symlinked_dir_is_a_directory(self):
+        index = TreeIndex([self.root / "skills"])
+        linked = self.root / "skills" / "linked"
+        self.assertEqual(index.is_dir(linked), linked.is_dir())
+        self.assertTrue(index.is_file(linked / "references" / "guide.md"))
+        self.assertEqual(
+            sorted(p.relative_to(self.root / "skills").as_posix() for p in index.rglob(self.root / "skills", "*.md")),
+            ["linked/SKILL.md", "linked/references/guide.md", "real/SKILL.md"],
+        )
+
+    def test_symlinked_skill_is_validated(self):
+        validate_skills = load_script("validate-skills.py")
+        skills = self.root / "skills"
+        validator = validate_skills.SkillValidator(skills_dir=str(skills), cache_dir=None)
+        self.assertEqual([d.name for d in validator.find_skill_dirs()], ["linked", "real"])
+
+    def test_symlink_loop_terminates(self):
+        os.symlink(self.root / "skills", self.root / "skills" / "real" / "loop")
+        index = TreeIndex([self.root / "skills"])
+        self.assertTrue(index.is_dir(self.root / "skills" / "real" / "loop"))
+        self.assertTrue(index.is_file(self.root / "skills" / "real" / "loop" / "real" / "SKILL.md"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+ValidationCache (validate-skills.py --cache-dir).
+
+A second run over an unchanged tree reuses every skill's cached issues
+without loading a SKILL.md, and editing one skill's reference file
+re-checks that skill alone.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from helpers import load_script
+from corpus import generate_corpus, skill_name
+
+
+validate_skills = load_script("validate-skills.py")
+
+
+class CacheReuseTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        generate_corpus(self.root, 3, 0)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+
+    def validate(self):
+        """The report of a run with the cache, and the skills it had to load."""
+        load = validate_skills.SkillDocument.load
+        with mock.patch.object(validate_skills.SkillDocument, "load", wraps=load) as loads:
+            report = validate_skills.SkillValidator(cache_dir=str(self.root / "cache")).validate()
+        return report, sorted(call.args[0].name for call in loads.call_args_list)
+
+    def test_unchanged_tree_is_served_from_the_cache(self):
+        first, loaded = self.validate()
+        self.assertEqual(loaded, [skill_name(i) for i in range(3)])
+        second, loaded = self.validate()
+        self.assertEqual(loaded, [])
+        self.assertEqual(second.to_dict(), first.to_dict())
+
+    def test_changed_reference_rechecks_its_skill(self):
+        self.validate()
+        reference = self.root / "skills" / skill_name(1) / "references" / f"{skill_name(1)}-0.md"
+        reference.write_text("Reference for: old header\n" + reference.read_text())
+
+        report, loaded = self.validate()
+        self.assertEqual(loaded, [skill_name(1)])
+        checks = {
+            result.skill: [issue.check for issue in result.issues if issue.check == "non-standard-headers"]
+            for result in report.results
+        }
+        self.assertEqual(checks, {skill_name(0): [], skill_name(1): ["non-standard-headers"], skill_name(2): []})
+
+
+if __name__ == "__main__":
+    unittest.main()
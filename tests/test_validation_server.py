@@ -0,0 +1,73 @@
+"""
+ValidationServer (validate-skills.py --serve).
+
+An unsaved buffer is validated in place of the file without touching the
+disk, closing it re-checks the file on disk, and errors come back as
+JSON-RPC error responses.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+from corpus import generate_corpus, skill_name
+
+
+validate_skills = load_script("validate-skills.py")
+
+
+class ServeRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        generate_corpus(self.root, 2, 0)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+
+    def serve(self, *requests: dict) -> list[dict]:
+        """Feed ``requests`` to a server over stdio and return its responses."""
+        index = validate_skills.TreeIndex(validate_skills.index_roots(Path("skills"), Path(".")))
+        watcher = validate_skills.SkillWatcher(
+            validate_skills.SkillValidator(skills_dir="skills", cache_dir=None, index=index), Path(".")
+        )
+        stdin = io.StringIO("".join(json.dumps({"jsonrpc": "2.0", **r}) + "\n" for r in requests))
+        stdout = io.StringIO()
+        validate_skills.ValidationServer(watcher).serve(stdin, stdout)
+        return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_validate_and_close_buffer(self):
+        path = f"skills/{skill_name(1)}/SKILL.md"
+        on_disk = Path(path).read_text()
+
+        opened, closed, again = self.serve(
+            {"id": 1, "method": "validateBuffer", "params": {"path": path, "text": "no frontmatter\n"}},
+            {"id": 2, "method": "closeBuffer", "params": {"path": path}},
+            {"id": 3, "method": "closeBuffer", "params": {"path": path}},
+            {"method": "shutdown"},
+        )
+
+        self.assertEqual(opened["id"], 1)
+        [result] = opened["result"]["results"]
+        self.assertEqual(result["skill"], skill_name(1))
+        self.assertEqual(
+            [issue["message"] for issue in result["issues"]],
+            ["SKILL.md does not start with YAML frontmatter (---)"],
+        )
+        self.assertEqual(opened["result"]["summary"]["total_errors"], 1)
+        self.assertEqual(Path(path).read_text(), on_disk)
+
+        self.assertEqual(closed["id"], 2)
+        self.assertEqual(closed["result"]["results"][0]["issues"], [])
+        self.assertEqual(closed["result"]["summary"]["total_errors"], 0)
+
+        self.assertEqual(again["id"], 3)
+        self.assertEqual(again["error"]["code"], validate_skills.RPC_INVALID_PARAMS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+WorkflowCatalog definitions (validate-skills.py workflow checks).
+
+An empty or comment-only commands/ YAML file is recorded with no data and
+reported once as empty, both on the first load and after a watch update.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from helpers import load_script
+from corpus import generate_corpus
+
+
+validate_skills = load_script("validate-skills.py")
+
+
+class EmptyDefinitionTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        generate_corpus(self.root, 2, 0)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+        self.commands = Path(validate_skills.COMMANDS_DIR_WORKFLOW)
+
+    def definition_messages(self, validator) -> dict[str, list[str]]:
+        messages: dict[str, list[str]] = {}
+        for issue in validator.validate():
+            if issue.check == "workflow-definition":
+                messages.setdefault(issue.file, []).append(issue.message)
+        return messages
+
+    def test_empty_files_are_reported_as_empty(self):
+        (self.commands / "blank.yaml").write_text("")
+        (self.commands / "comment.yaml").write_text("# nothing here yet\n")
+
+        validator = validate_skills.WorkflowValidator(Path("."))
+        messages = self.definition_messages(validator)
+
+        for name in ("blank.yaml", "comment.yaml"):
+            self.assertEqual(messages[str(self.commands / name)], ["YAML file is empty"])
+            self.assertIsNone(validator.catalog._by_file[self.commands / name].data)
+
+    def test_update_records_an_emptied_file(self):
+        catalog = validate_skills.WorkflowCatalog(Path("."), validate_skills.TreeIndex([self.commands]))
+        definition = catalog.definitions[0]
+        self.assertIsInstance(definition.data, dict)
+        definition.path.write_text("")
+
+        catalog.update({definition.path}, validate_skills.TreeIndex([self.commands]))
+
+        [reloaded] = [d for d in catalog.definitions if d.path == definition.path]
+        self.assertIsNone(reloaded.data)
+        self.assertEqual(reloaded.command, "")
+
+
+if __name__ == "__main__":
+    unittest.main()